@@ -0,0 +1,335 @@
+import queue
+import sys
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+
+class BackendUnavailable(Exception):
+    """Hiçbir çevrimiçi arka uç isteği kabul etmiyor (tüm devreler açık)"""
+
+
+class MalformedBatch(Exception):
+    """Toplu çeviri yanıtı parçalara güvenilir biçimde ayrılamadı"""
+
+
+class CircuitBreaker:
+    """Arka uç başına devre kesici
+
+    Art arda failure_threshold hata sonrası devre açılır ve reset_timeout
+    saniye boyunca arka uca istek gönderilmez. Süre dolunca tek bir deneme
+    isteğine izin verilir (yarı açık); başarılıysa devre kapanır, başarısızsa
+    bekleme süresi ikiye katlanarak (en fazla max_timeout) yeniden açılır.
+    """
+
+    CLOSED = "kapalı"
+    OPEN = "açık"
+    HALF_OPEN = "yarı açık"
+
+    def __init__(self, failure_threshold=5, reset_timeout=15.0, max_timeout=300.0):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.max_timeout = max_timeout
+        self.state = self.CLOSED
+        self.failures = 0
+        self.timeout = reset_timeout
+        self.opened_at = 0.0
+        self.trial_in_flight = False
+        self.lock = threading.Lock()
+
+    def allow(self):
+        """İstek gönderilebiliyorsa True; yarı açık durumda yalnızca bir deneme geçer"""
+        with self.lock:
+            if self.state == self.CLOSED:
+                return True
+            if self.state == self.OPEN:
+                if time.monotonic() - self.opened_at < self.timeout:
+                    return False
+                self.state = self.HALF_OPEN
+                self.trial_in_flight = False
+            if self.trial_in_flight:
+                return False
+            self.trial_in_flight = True
+            return True
+
+    def available(self):
+        # allow() gibi ama deneme hakkını tüketmez (sıralama için)
+        with self.lock:
+            if self.state == self.OPEN:
+                return time.monotonic() - self.opened_at >= self.timeout
+            return not (self.state == self.HALF_OPEN and self.trial_in_flight)
+
+    def record_success(self):
+        with self.lock:
+            self.state = self.CLOSED
+            self.failures = 0
+            self.timeout = self.reset_timeout
+            self.trial_in_flight = False
+
+    def record_failure(self):
+        with self.lock:
+            self.failures += 1
+            if self.state == self.HALF_OPEN:
+                # Deneme de başarısız: daha uzun bekle
+                self.timeout = min(self.timeout * 2, self.max_timeout)
+            elif self.failures < self.failure_threshold:
+                return
+            self.state = self.OPEN
+            self.opened_at = time.monotonic()
+            self.trial_in_flight = False
+
+
+class Backend:
+    """Yönlendiricideki tek bir arka uç: çağrı fonksiyonu, devre kesici ve kayan istatistikler
+
+    Son window çağrının süresi ve sonucu tutulur; gecikme ayrıca üstel
+    hareketli ortalamayla (EWMA) izlenir. translate_batch(metinler, kaynak,
+    hedef) verilirse arka uç birden çok parçayı tek istekte çevirebilir.
+    """
+
+    def __init__(self, name, translate, breaker=None, window=50, smoothing=0.3, translate_batch=None):
+        self.name = name
+        self.translate = translate
+        self.translate_batch = translate_batch
+        self.breaker = breaker if breaker is not None else CircuitBreaker()
+        self.smoothing = smoothing
+        self.latencies = deque(maxlen=window)
+        self.outcomes = deque(maxlen=window)
+        self.latency = None
+        self.last_used = 0.0
+        self.calls = 0
+        self.errors = 0
+        self.lock = threading.Lock()
+
+    def record(self, elapsed, ok, sample=True):
+        # sample=False: süre gecikme istatistiklerine katılmaz (ör. toplu istekler)
+        with self.lock:
+            self.calls += 1
+            self.last_used = time.monotonic()
+            self.outcomes.append(ok)
+            if not ok:
+                self.errors += 1
+            elif sample:
+                self.latencies.append(elapsed)
+                if self.latency is None:
+                    self.latency = elapsed
+                else:
+                    self.latency += self.smoothing * (elapsed - self.latency)
+        if ok:
+            self.breaker.record_success()
+        else:
+            self.breaker.record_failure()
+
+    def error_rate(self):
+        with self.lock:
+            if not self.outcomes:
+                return 0.0
+            return self.outcomes.count(False) / len(self.outcomes)
+
+    def percentile(self, fraction):
+        with self.lock:
+            if not self.latencies:
+                return None
+            ordered = sorted(self.latencies)
+        return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+    def score(self, probe_interval=None):
+        # Beklenen maliyet: gecikme / başarı oranı (hata oranı yüksek arka uçlar daha yavaş sayılır).
+        # Gecikmesi henüz ölçülmemiş veya probe_interval'dan uzun süredir
+        # kullanılmamış arka uçlar 0 puan alır, böylece ölçümleri tazelenir;
+        # hata verip hiç ölçülememiş arka uçlar en sona kalır
+        if probe_interval is not None and self.calls and time.monotonic() - self.last_used > probe_interval:
+            return 0.0
+        if self.latency is None:
+            return float("inf") if self.errors else 0.0
+        return self.latency / max(0.05, 1 - self.error_rate())
+
+    def stats(self):
+        return {
+            "state": self.breaker.state,
+            "calls": self.calls,
+            "errors": self.errors,
+            "error_rate": self.error_rate(),
+            "latency": self.latency,
+            "p95": self.percentile(0.95)
+        }
+
+
+class BackendRouter:
+    """Devre kesicili, gecikmeye göre sıralayan ve istek çoğaltan (hedging) arka uç yönlendirici
+
+    Her çağrıda devresi açık olmayan arka uçlar puanlarına (ölçülen gecikme,
+    hata oranıyla ağırlıklı) göre sıralanır ve en hızlısı denenir. Hata olursa
+    sıradaki hemen denenir. hedging açıkken yanıt arka ucun 95. yüzdelik
+    gecikmesini (yeterli ölçüm yoksa hedge_after saniyeyi) aşarsa sıradaki arka
+    uca paralel bir istek daha gönderilir ve ilk başarılı yanıt kullanılır;
+    geç kalan yanıtın süresi yine istatistiklere işlenir. probe_interval
+    saniyedir kullanılmayan arka uç bir kez öne alınarak yeniden ölçülür.
+    metrics (MetricsRegistry) verilirse arka uç başına çağrı, hata, gönderilen
+    bayt, yedeğe geçiş ve istek süresi metrikleri kaydedilir.
+    """
+
+    def __init__(self, backends, hedging=True, hedge_after=1.0, min_hedge_delay=0.05,
+                 max_hedge_delay=5.0, min_samples=10, probe_interval=30.0, max_workers=8, on_status=None,
+                 metrics=None):
+        self.backends = list(backends)
+        self.hedging = hedging
+        self.hedge_after = hedge_after
+        self.min_hedge_delay = min_hedge_delay
+        self.max_hedge_delay = max_hedge_delay
+        self.min_samples = min_samples
+        self.probe_interval = probe_interval
+        self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="backend")
+        self.on_status = on_status or (lambda message: None)
+        self.metrics = metrics
+        self.hedges = 0
+        self.hedge_wins = 0
+        self.lock = threading.Lock()
+
+    def candidates(self):
+        """İstek kabul eden arka uçlar, en hızlıdan yavaşa (eşitlikte tanım sırası)"""
+        available = [(backend.score(self.probe_interval), i, backend) for i, backend in enumerate(self.backends)
+                     if backend.breaker.available()]
+        return [backend for _, _, backend in sorted(available, key=lambda item: item[:2])]
+
+    def hedge_delay(self, backend):
+        if len(backend.latencies) < self.min_samples:
+            return self.hedge_after
+        delay = backend.percentile(0.95)
+        return min(self.max_hedge_delay, max(self.min_hedge_delay, delay))
+
+    def _measure(self, backend, kind, texts, elapsed, result):
+        if self.metrics is None:
+            return
+        self.metrics.increment("backend_calls_total", backend=backend.name, kind=kind, result=result)
+        self.metrics.increment("backend_bytes_sent_total", sum(len(text.encode("utf-8")) for text in texts),
+                               backend=backend.name)
+        self.metrics.observe("backend_request_seconds", elapsed, backend=backend.name, kind=kind)
+
+    def _count(self, name, backend):
+        if self.metrics is not None:
+            self.metrics.increment(name, backend=backend.name)
+
+    def _call(self, backend, text, source, target, results):
+        start = time.monotonic()
+        try:
+            translated = backend.translate(text, source, target)
+            if not translated:
+                raise Exception("Çeviri sonucu boş")
+        except Exception as e:
+            elapsed = time.monotonic() - start
+            backend.record(elapsed, False)
+            self._measure(backend, "single", [text], elapsed, "error")
+            print(f"{backend.name} hatası: {str(e)}", file=sys.stderr)
+            results.put((backend, False, e))
+        else:
+            elapsed = time.monotonic() - start
+            backend.record(elapsed, True)
+            self._measure(backend, "single", [text], elapsed, "ok")
+            results.put((backend, True, translated))
+
+    def translate(self, text, source, target):
+        """Metni en uygun arka uçla çevir; hiçbiri başaramazsa son hatayı fırlat"""
+        candidates = self.candidates()
+        results = queue.Queue()
+        pending = 0
+        errors = []
+        hedged = set()
+
+        def launch():
+            # Sıradaki adayı dene; devresi bu arada açılmış olanları atla
+            nonlocal pending
+            while candidates:
+                backend = candidates.pop(0)
+                if backend.breaker.allow():
+                    self.executor.submit(self._call, backend, text, source, target, results)
+                    pending += 1
+                    return backend
+            return None
+
+        primary = launch()
+        if primary is None:
+            raise BackendUnavailable("Tüm çeviri servisleri geçici olarak devre dışı")
+        if primary is not self.backends[0]:
+            self.on_status(f"{primary.name} kullanılıyor")
+        waiting_on = primary
+
+        while pending:
+            timeout = self.hedge_delay(waiting_on) if self.hedging and candidates else None
+            try:
+                backend, ok, value = results.get(timeout=timeout)
+            except queue.Empty:
+                # Yanıt gecikti: sıradaki arka uca paralel istek gönder
+                hedge = launch()
+                if hedge is not None:
+                    waiting_on = hedge
+                    hedged.add(hedge)
+                    self._count("hedges_total", hedge)
+                    with self.lock:
+                        self.hedges += 1
+                continue
+            pending -= 1
+            if ok:
+                if backend in hedged:
+                    with self.lock:
+                        self.hedge_wins += 1
+                return value
+            errors.append(value)
+            if not pending:
+                fallback = launch()
+                if fallback is not None:
+                    # Hata sonrası sıradaki arka uca geçildi
+                    self._count("fallbacks_total", fallback)
+                    waiting_on = fallback
+
+        raise errors[-1] if errors else BackendUnavailable("Çeviri servisi yanıt vermedi")
+
+    def translate_batch(self, texts, source, target):
+        """Metinleri toplu istek destekleyen ilk uygun arka uçla tek seferde çevir
+
+        Toplu istekler çoğaltılmaz ve gecikme istatistiklerine katılmaz.
+        Hiçbir arka uç geçerli bir toplu yanıt döndürmezse son hata fırlatılır;
+        çağıran parçaları tek tek çevirmelidir.
+        """
+        errors = []
+        for backend in self.candidates():
+            if backend.translate_batch is None or not backend.breaker.allow():
+                continue
+            if errors:
+                self._count("fallbacks_total", backend)
+            start = time.monotonic()
+            try:
+                translated = backend.translate_batch(texts, source, target)
+                if len(translated) != len(texts) or not all(translated):
+                    raise MalformedBatch(f"{len(texts)} parça gönderildi, {len(translated)} geldi")
+            except MalformedBatch as e:
+                # Arka uç yanıt verdi: devre kesici için hata sayılmaz
+                elapsed = time.monotonic() - start
+                backend.record(elapsed, True, sample=False)
+                self._measure(backend, "batch", texts, elapsed, "malformed")
+                print(f"{backend.name} toplu yanıtı bozuk: {str(e)}", file=sys.stderr)
+                errors.append(e)
+            except Exception as e:
+                elapsed = time.monotonic() - start
+                backend.record(elapsed, False)
+                self._measure(backend, "batch", texts, elapsed, "error")
+                print(f"{backend.name} hatası: {str(e)}", file=sys.stderr)
+                errors.append(e)
+            else:
+                elapsed = time.monotonic() - start
+                backend.record(elapsed, True, sample=False)
+                self._measure(backend, "batch", texts, elapsed, "ok")
+                return translated
+        raise errors[-1] if errors else BackendUnavailable("Toplu çeviri destekleyen servis yok")
+
+    def stats(self):
+        return {
+            "backends": {backend.name: backend.stats() for backend in self.backends},
+            "hedges": self.hedges,
+            "hedge_wins": self.hedge_wins
+        }
+
+    def close(self):
+        # Geç kalan çoğaltılmış istekler arka planda tamamlansın, bekleme
+        self.executor.shutdown(wait=False)
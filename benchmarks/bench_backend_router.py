@@ -0,0 +1,177 @@
+"""Arka uç yönlendirici kıyaslaması
+
+Gecikme ve hata enjekte eden iki yerel sahte (stub) çeviri sunucusu açar ve
+farklı arıza senaryolarında eski sıralı yedekleme zinciri (önce birincil,
+hata olursa ikincil) ile BackendRouter'ı (devre kesici, gecikmeye göre
+sıralama, istek çoğaltma) karşılaştırır. Her senaryo için istek başına
+gecikme yüzdeliklerini, başarısız istekleri ve birincil sunucuya giden
+istek sayısını yazdırır.
+
+Kullanım: python benchmarks/bench_backend_router.py [--requests 200] [--timeout 1.0]
+"""
+import argparse
+import json
+import os
+import random
+import sys
+import threading
+import time
+import urllib.request
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from backend_router import Backend, BackendRouter, CircuitBreaker
+
+# Senaryo: (ad, birincil ayarları, ikincil ayarları)
+# Ayarlar: latency (sn), spike_rate / spike_latency (ara sıra gelen yavaş yanıt), error_rate
+SCENARIOS = [
+    ("sağlıklı", {"latency": 0.02}, {"latency": 0.05}),
+    ("birincil çöktü (HTTP 500)", {"latency": 0.02, "error_rate": 1.0}, {"latency": 0.05}),
+    ("birincil yanıt vermiyor", {"latency": 30.0}, {"latency": 0.05}),
+    ("birincil yavaş", {"latency": 0.3}, {"latency": 0.05}),
+    ("gecikme sıçramaları (%10)", {"latency": 0.02, "spike_rate": 0.1, "spike_latency": 0.8},
+     {"latency": 0.05}),
+    ("kısmi hata (%30)", {"latency": 0.02, "error_rate": 0.3}, {"latency": 0.05}),
+]
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    settings = {}
+    requests = 0
+    rng = random.Random(1)
+    lock = threading.Lock()
+
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length", 0))
+        data = json.loads(self.rfile.read(length))
+        settings = self.settings
+        with self.lock:
+            type(self).requests += 1
+            roll = self.rng.random()
+            spike = self.rng.random() < settings.get("spike_rate", 0)
+        delay = settings.get("spike_latency", 0) if spike else settings.get("latency", 0)
+        time.sleep(delay)
+        if roll < settings.get("error_rate", 0):
+            self.send_response(500)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        body = json.dumps({"translatedText": data["q"].upper()}).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def start_stub_server():
+    # Her sunucunun ayarları ve sayacı kendi alt sınıfında tutulur
+    handler = type("Handler", (StubHandler,), {"settings": {}, "requests": 0})
+    server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, handler
+
+
+def make_translate(url, timeout):
+    def translate(text, source, target):
+        payload = json.dumps({"q": text, "source": source, "target": target}).encode("utf-8")
+        request = urllib.request.Request(url, data=payload,
+                                         headers={"Content-Type": "application/json"})
+        with urllib.request.urlopen(request, timeout=timeout) as response:
+            return json.loads(response.read())["translatedText"]
+    return translate
+
+
+def legacy_chain(primary, secondary):
+    # Eski TranslationPipeline.translate_chunk: her istekte önce birincil, hata olursa ikincil
+    def translate(text, source, target):
+        try:
+            translated = primary(text, source, target)
+            if translated:
+                return translated
+        except Exception:
+            pass
+        return secondary(text, source, target)
+    return translate
+
+
+def percentile(values, fraction):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+def run(translate, count, workers):
+    latencies = []
+    failures = 0
+    lock = threading.Lock()
+    indexes = iter(range(count))
+
+    def worker():
+        nonlocal failures
+        for i in indexes:
+            start = time.perf_counter()
+            try:
+                translate(f"cümle {i}", "tr", "en")
+                ok = True
+            except Exception:
+                ok = False
+            elapsed = time.perf_counter() - start
+            with lock:
+                latencies.append(elapsed)
+                failures += not ok
+
+    threads = [threading.Thread(target=worker) for _ in range(workers)]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return time.perf_counter() - start, latencies, failures
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=200, help="senaryo başına istek sayısı")
+    parser.add_argument("--workers", type=int, default=4, help="eş zamanlı istemci sayısı")
+    parser.add_argument("--timeout", type=float, default=1.0, help="istemci zaman aşımı (sn)")
+    args = parser.parse_args()
+
+    primary_server, primary_handler = start_stub_server()
+    secondary_server, secondary_handler = start_stub_server()
+    primary = make_translate(f"http://127.0.0.1:{primary_server.server_address[1]}/translate", args.timeout)
+    secondary = make_translate(f"http://127.0.0.1:{secondary_server.server_address[1]}/translate", args.timeout)
+    # Eski kod stderr'e her hatayı yazar; ölçüm çıktısı okunabilir kalsın
+    sys.stderr = open(os.devnull, "w")
+
+    print(f"{'senaryo':<28}{'yöntem':<14}{'süre':>7}{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}"
+          f"{'hata':>6}{'birincil':>10}{'çoğaltma':>10}")
+    for name, primary_settings, secondary_settings in SCENARIOS:
+        for method in ("eski zincir", "yönlendirici"):
+            primary_handler.settings = primary_settings
+            secondary_handler.settings = secondary_settings
+            primary_handler.requests = secondary_handler.requests = 0
+            router = None
+            if method == "eski zincir":
+                translate = legacy_chain(primary, secondary)
+            else:
+                router = BackendRouter([
+                    Backend("birincil", primary, CircuitBreaker(reset_timeout=2.0)),
+                    Backend("ikincil", secondary, CircuitBreaker(reset_timeout=2.0))
+                ], hedge_after=0.25)
+                translate = router.translate
+            elapsed, latencies, failures = run(translate, args.requests, args.workers)
+            hedges = router.hedges if router is not None else 0
+            print(f"{name:<28}{method:<14}{elapsed:>7.2f}{percentile(latencies, 0.5) * 1000:>9.0f}"
+                  f"{percentile(latencies, 0.95) * 1000:>9.0f}{percentile(latencies, 0.99) * 1000:>9.0f}"
+                  f"{failures:>6}{primary_handler.requests:>10}{hedges:>10}")
+            if router is not None:
+                router.close()
+
+
+if __name__ == "__main__":
+    main()
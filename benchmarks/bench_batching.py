@@ -0,0 +1,154 @@
+"""Toplu istek (batching) kıyaslaması
+
+Dizi halinde "q" kabul eden yerel bir sahte LibreTranslate sunucusuna karşı
+çok sayıda kısa metni TranslationPipeline ile farklı toplu istek boyutlarında
+çevirir; gönderilen istek sayısını, belge (metin) başına istek sayısını,
+süreyi ve metin/sn verimini ölçer. --malformed ile sunucu toplu yanıtların
+bir kısmını eksik döndürür; parça parça geri düşüşle tüm çevirilerin yine
+doğru geldiği doğrulanır.
+
+Kullanım: python benchmarks/bench_batching.py [--texts 1000] [--latency 0.03] [--malformed 0.2]
+"""
+import argparse
+import json
+import os
+import random
+import sys
+import tempfile
+import threading
+import time
+import urllib.request
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from backend_router import Backend, BackendRouter, MalformedBatch
+from translation_cache import TranslationCache
+from translation_pipeline import TranslationPipeline
+
+LETTERS = "abcçdefgğhıijklmnoöprsştuüvyz"
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    latency = 0.03
+    malformed = 0.0
+    requests = 0
+    rng = random.Random(1)
+    lock = threading.Lock()
+
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length", 0))
+        data = json.loads(self.rfile.read(length))
+        with self.lock:
+            type(self).requests += 1
+            broken = self.rng.random() < self.malformed
+        # Sabit istek maliyeti + metin uzunluğuyla artan çeviri süresi
+        texts = data["q"] if isinstance(data["q"], list) else [data["q"]]
+        time.sleep(self.latency + sum(len(text) for text in texts) * 1e-6)
+        translated = [text.upper() for text in texts]
+        if isinstance(data["q"], list):
+            if broken and len(translated) > 1:
+                translated = translated[:-1]
+        else:
+            translated = translated[0]
+        body = json.dumps({"translatedText": translated}).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class StubClients:
+    """BackendClients yerine urllib ile sahte sunucuya giden istemci"""
+
+    def __init__(self, url):
+        self.url = url
+
+    def post(self, data):
+        payload = json.dumps(data).encode("utf-8")
+        request = urllib.request.Request(self.url, data=payload,
+                                         headers={"Content-Type": "application/json"})
+        with urllib.request.urlopen(request, timeout=10) as response:
+            return json.loads(response.read())["translatedText"]
+
+    def translate_libre(self, text, source, target):
+        return self.post({"q": text, "source": source, "target": target})
+
+    def translate_libre_batch(self, texts, source, target):
+        translated = self.post({"q": list(texts), "source": source, "target": target})
+        if not isinstance(translated, list):
+            raise MalformedBatch("translatedText dizi değil")
+        return translated
+
+    def close(self):
+        pass
+
+
+class NoMemory:
+    """Çeviri belleğini devre dışı bırakır: ölçüm yalnızca istek maliyetini göstersin"""
+
+    def lookup(self, src_lang, dest_lang, text):
+        return None
+
+    def add(self, src_lang, dest_lang, source, translation):
+        pass
+
+
+def make_texts(rng, count):
+    # Arayüz ve komut satırındaki gibi kısa metinler: 1-3 cümle
+    texts = []
+    for i in range(count):
+        sentences = [" ".join("".join(rng.choice(LETTERS) for _ in range(rng.randint(2, 9)))
+                              for _ in range(rng.randint(4, 20))).capitalize() + "."
+                     for _ in range(rng.randint(1, 3))]
+        texts.append(f"{i}. " + " ".join(sentences))
+    return texts
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--texts", type=int, default=1000, help="çevrilecek metin sayısı")
+    parser.add_argument("--latency", type=float, default=0.03, help="istek başına sabit gecikme (sn)")
+    parser.add_argument("--malformed", type=float, default=0.0,
+                        help="eksik dönen toplu yanıt oranı (0-1)")
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--sizes", default="1,10,50", help="toplu istek boyutları (virgülle)")
+    args = parser.parse_args()
+
+    StubHandler.latency = args.latency
+    StubHandler.malformed = args.malformed
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    clients = StubClients(f"http://127.0.0.1:{server.server_address[1]}/translate")
+    texts = make_texts(random.Random(args.texts), args.texts)
+    # Bozuk toplu yanıt uyarıları ölçüm çıktısını kalabalıklaştırmasın
+    sys.stderr = open(os.devnull, "w")
+
+    print(f"{len(texts)} metin, gecikme {args.latency}s, bozuk toplu yanıt oranı {args.malformed:.0%}")
+    print(f"{'toplu boyut':>12}{'istek':>8}{'istek/metin':>13}{'süre (sn)':>11}{'metin/sn':>10}{'doğru':>8}")
+    for size in (int(value) for value in args.sizes.split(",")):
+        with tempfile.TemporaryDirectory() as directory:
+            router = BackendRouter([Backend("LibreTranslate", clients.translate_libre,
+                                            translate_batch=clients.translate_libre_batch)])
+            pipeline = TranslationPipeline(cache=TranslationCache(os.path.join(directory, "cache.db")),
+                                           backends=clients, router=router, memory=NoMemory(),
+                                           max_workers=args.workers, requests_per_second=None,
+                                           batch_items=size)
+            StubHandler.requests = 0
+            start = time.perf_counter()
+            translations = pipeline.translate_many(texts, "tr", "en")
+            elapsed = time.perf_counter() - start
+            correct = sum(translation == text.upper() for text, translation in zip(texts, translations))
+            pipeline.close()
+        print(f"{size:>12}{StubHandler.requests:>8}{StubHandler.requests / len(texts):>13.3f}"
+              f"{elapsed:>11.2f}{len(texts) / elapsed:>10.0f}{correct:>8}")
+
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
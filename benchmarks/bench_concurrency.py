@@ -0,0 +1,104 @@
+"""Paralel parça çevirisi kıyaslaması
+
+Yerel bir sahte (stub) çeviri sunucusuna karşı eski sıralı döngü ile
+translate_chunks iş havuzunun duvar saati süresini 1, 10 ve 100 parça için ölçer.
+
+Kullanım: python benchmarks/bench_concurrency.py [--latency 0.1] [--workers 8] [--rps 20]
+"""
+import argparse
+import json
+import os
+import sys
+import threading
+import time
+import urllib.request
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from translation_engine import translate_chunks
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    latency = 0.1
+
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length", 0))
+        data = json.loads(self.rfile.read(length))
+        time.sleep(self.latency)
+        body = json.dumps({"translatedText": data["q"].upper()}).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def start_stub_server(latency):
+    StubHandler.latency = latency
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def make_translate(url):
+    def translate(chunk):
+        payload = json.dumps({"q": chunk, "source": "tr", "target": "en"}).encode("utf-8")
+        request = urllib.request.Request(url, data=payload,
+                                         headers={"Content-Type": "application/json"})
+        with urllib.request.urlopen(request, timeout=5) as response:
+            return json.loads(response.read())["translatedText"]
+    return translate
+
+
+def sequential(chunks, translate, delay):
+    # Eski davranış: sırayla çevir ve parçalar arasında sabit bekle
+    results = []
+    for i, chunk in enumerate(chunks):
+        results.append(translate(chunk))
+        if len(chunks) > 1 and i < len(chunks) - 1:
+            time.sleep(delay)
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--latency", type=float, default=0.1, help="sahte sunucu gecikmesi (sn)")
+    parser.add_argument("--delay", type=float, default=0.5, help="eski döngüdeki sabit bekleme (sn)")
+    parser.add_argument("--workers", type=int, default=8)
+    parser.add_argument("--rps", type=float, default=20.0)
+    parser.add_argument("--skip-sequential", action="store_true",
+                        help="yavaş sıralı ölçümü atla")
+    args = parser.parse_args()
+
+    server = start_stub_server(args.latency)
+    url = f"http://127.0.0.1:{server.server_address[1]}/translate"
+    translate = make_translate(url)
+
+    print(f"gecikme={args.latency}s workers={args.workers} rps={args.rps}")
+    print(f"{'parça':>6} {'sıralı (s)':>12} {'paralel (s)':>12}")
+    for count in (1, 10, 100):
+        chunks = [f"cümle {i}." for i in range(count)]
+
+        sequential_time = float("nan")
+        if not args.skip_sequential:
+            start = time.perf_counter()
+            sequential(chunks, translate, args.delay)
+            sequential_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        results = translate_chunks(chunks, translate, max_workers=args.workers,
+                                   requests_per_second=args.rps)
+        parallel_time = time.perf_counter() - start
+        assert results == [chunk.upper() for chunk in chunks], "sıra bozuldu"
+
+        print(f"{count:>6} {sequential_time:>12.2f} {parallel_time:>12.2f}")
+
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
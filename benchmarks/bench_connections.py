@@ -0,0 +1,91 @@
+"""Bağlantı havuzu kıyaslaması
+
+Yerel bir sahte LibreTranslate sunucusuna karşı her parça için ayrı
+requests.post çağrısı ile BackendClients oturumunu karşılaştırır; açılan
+TCP bağlantı sayısını ve duvar saati süresini raporlar.
+
+Kullanım: python benchmarks/bench_connections.py [--chunks 100] [--workers 4]
+"""
+import argparse
+import json
+import os
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import requests
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from translation_backends import BackendClients
+
+
+class CountingHandler(BaseHTTPRequestHandler):
+    # Keep-alive için HTTP/1.1
+    protocol_version = "HTTP/1.1"
+    # Başlıklar ve gövde ayrı yazıldığından açık bağlantıda Nagle + gecikmeli ACK
+    # her yanıtı ~40 ms bekletir; gerçek sunucular gibi TCP_NODELAY kullan
+    disable_nagle_algorithm = True
+    connections = 0
+    lock = threading.Lock()
+
+    def setup(self):
+        # Her yeni TCP bağlantısı için bir handler örneği oluşturulur
+        with CountingHandler.lock:
+            CountingHandler.connections += 1
+        super().setup()
+
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length", 0))
+        data = json.loads(self.rfile.read(length))
+        body = json.dumps({"translatedText": data["q"].upper()}).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def run(label, translate, chunks, workers):
+    CountingHandler.connections = 0
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        results = list(executor.map(translate, chunks))
+    elapsed = time.perf_counter() - start
+    assert results == [chunk.upper() for chunk in chunks]
+    print(f"{label:<22} bağlantı={CountingHandler.connections:>5}  süre={elapsed:.3f}s")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--chunks", type=int, default=100)
+    parser.add_argument("--workers", type=int, default=4)
+    args = parser.parse_args()
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), CountingHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f"http://127.0.0.1:{server.server_address[1]}/translate"
+    chunks = [f"cümle {i}." for i in range(args.chunks)]
+
+    def unpooled(chunk):
+        # Eski davranış: her çağrıda yeni bağlantı
+        response = requests.post(url, json={"q": chunk, "source": "tr", "target": "en"}, timeout=5)
+        response.raise_for_status()
+        return response.json()["translatedText"]
+
+    clients = BackendClients(libre_url=url, libre_connections=args.workers)
+
+    run("requests.post", unpooled, chunks, args.workers)
+    run("BackendClients", lambda chunk: clients.translate_libre(chunk, "tr", "en"), chunks, args.workers)
+
+    clients.close()
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
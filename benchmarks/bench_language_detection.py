@@ -0,0 +1,95 @@
+"""Çevrimdışı dil tanıma kıyaslaması
+
+NgramLanguageModel'in eğitimde kullanılmayan cümleler üzerindeki doğruluğunu
+ve saniyede işlenen örnek sayısını ölçer.
+
+Kullanım: python benchmarks/bench_language_detection.py [--repeat 200]
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from language_detection import NgramLanguageModel, numpy
+
+TEST_SAMPLES = {
+    "tr": ["Yarın akşam size uğramayı düşünüyoruz, evde olacak mısınız?",
+           "Bu şehirde yaşamak pahalı ama insanlar çok sıcakkanlı.",
+           "Raporu cuma gününe kadar bitirmemiz gerekiyor.",
+           "Kahvaltıda peynir, zeytin ve domates yemeyi severim."],
+    "en": ["We are thinking of visiting you tomorrow evening, will you be at home?",
+           "Living in this city is expensive but the people are very warm.",
+           "We need to finish the report by Friday.",
+           "I like eating cheese, olives and tomatoes for breakfast."],
+    "de": ["Wir überlegen, morgen Abend bei euch vorbeizukommen, seid ihr zu Hause?",
+           "In dieser Stadt zu leben ist teuer, aber die Menschen sind sehr herzlich.",
+           "Wir müssen den Bericht bis Freitag fertigstellen.",
+           "Zum Frühstück esse ich gern Käse, Oliven und Tomaten."],
+    "fr": ["Nous pensons passer vous voir demain soir, serez-vous à la maison?",
+           "Vivre dans cette ville coûte cher mais les gens sont très chaleureux.",
+           "Nous devons terminer le rapport avant vendredi.",
+           "J'aime manger du fromage, des olives et des tomates au petit déjeuner."],
+    "es": ["Estamos pensando en visitaros mañana por la noche, ¿estaréis en casa?",
+           "Vivir en esta ciudad es caro pero la gente es muy cálida.",
+           "Tenemos que terminar el informe antes del viernes.",
+           "Me gusta desayunar queso, aceitunas y tomates."],
+    "it": ["Stiamo pensando di passare da voi domani sera, sarete a casa?",
+           "Vivere in questa città è costoso ma la gente è molto calorosa.",
+           "Dobbiamo finire la relazione entro venerdì.",
+           "A colazione mi piace mangiare formaggio, olive e pomodori."],
+    "ru": ["Мы думаем зайти к вам завтра вечером, вы будете дома?",
+           "Жить в этом городе дорого, но люди здесь очень добрые.",
+           "Нам нужно закончить отчёт до пятницы.",
+           "На завтрак я люблю есть сыр, оливки и помидоры."],
+    "zh-CN": ["我们打算明天晚上去看你们，你们在家吗？",
+              "住在这个城市很贵，但是人们都很热情。",
+              "我们必须在星期五之前完成报告。",
+              "我早饭喜欢吃奶酪、橄榄和西红柿。"],
+    "ja": ["明日の夜にお宅に伺おうと思っていますが、ご在宅ですか。",
+           "この町に住むのは高いですが、人々はとても親切です。",
+           "金曜日までに報告書を仕上げなければなりません。",
+           "朝ご飯にはチーズとオリーブとトマトを食べるのが好きです。"],
+    "ko": ["내일 저녁에 찾아뵐까 하는데 댁에 계세요?",
+           "이 도시에서 사는 것은 비싸지만 사람들이 아주 친절해요.",
+           "금요일까지 보고서를 끝내야 합니다.",
+           "아침으로 치즈와 올리브와 토마토를 먹는 것을 좋아해요."],
+    "ar": ["نفكر في زيارتكم مساء الغد، هل ستكونون في البيت؟",
+           "العيش في هذه المدينة مكلف لكن الناس ودودون جدا.",
+           "يجب أن ننهي التقرير قبل يوم الجمعة.",
+           "أحب أن آكل الجبن والزيتون والطماطم في الفطور."],
+}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=200, help="hız ölçümü için tekrar sayısı")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    model = NgramLanguageModel()
+    build_time = time.perf_counter() - start
+
+    samples = [(lang, text) for lang, texts in TEST_SAMPLES.items() for text in texts]
+    correct = 0
+    for lang, text in samples:
+        detected, confidence = model.detect(text)
+        mark = "✓" if detected == lang else "✗"
+        correct += detected == lang
+        print(f"{mark} {lang:>6} -> {detected:<6} güven={confidence:.2f}  {text[:40]}")
+
+    texts = [text for _, text in samples] * args.repeat
+    start = time.perf_counter()
+    model.detect_batch(texts)
+    elapsed = time.perf_counter() - start
+
+    print()
+    print(f"numpy: {'var' if numpy is not None else 'yok (array)'}  "
+          f"profil kurulumu: {build_time * 1000:.1f} ms  sözlük: {len(model.index)} özellik")
+    print(f"doğruluk: {correct}/{len(samples)} ({correct / len(samples):.0%})")
+    print(f"hız: {len(texts) / elapsed:,.0f} örnek/sn")
+
+
+if __name__ == "__main__":
+    main()
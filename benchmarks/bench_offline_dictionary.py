@@ -0,0 +1,119 @@
+"""Çevrimdışı sözlük kıyaslaması
+
+Yüz binlerce girdilik sentetik bir sözlüğü diske yazar; belleğe yüklenen
+trie ile bellek eşlemeli .lex sözlüğün açılış süresini, açılışta ayrılan
+belleği ve saniyede çevrilen kelime sayısını ölçer. Eski kelime başına
+regex + düz sözlük yöntemi karşılaştırma için verilir.
+
+Kullanım: python benchmarks/bench_offline_dictionary.py [--entries 200000] [--words 200000]
+"""
+import argparse
+import gc
+import os
+import random
+import re
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from offline_dictionary import OfflineTranslator, build_lexicon
+
+LETTERS = "abcçdefgğhıijklmnoöprsştuüvyz"
+
+
+def make_word(rng):
+    return "".join(rng.choice(LETTERS) for _ in range(rng.randint(3, 9)))
+
+
+def make_dictionary(rng, entries, phrase_ratio=0.2):
+    vocabulary = list({make_word(rng) for _ in range(entries)})
+    dictionary = {}
+    for word in vocabulary:
+        dictionary[word] = word.upper()
+    # Girdilerin bir kısmı çok kelimeli ifadeler
+    for _ in range(int(entries * phrase_ratio)):
+        phrase = " ".join(rng.choice(vocabulary) for _ in range(rng.randint(2, 4)))
+        dictionary[phrase] = phrase.upper()
+    return vocabulary, dictionary
+
+
+def make_text(rng, vocabulary, words):
+    parts = []
+    for i in range(words):
+        # Gerçek metinlerdeki gibi az sayıda kelime çok sık geçer (Zipf benzeri dağılım)
+        if rng.random() < 0.8:
+            word = vocabulary[min(int(rng.paretovariate(1.0)) - 1, len(vocabulary) - 1)]
+        else:
+            word = make_word(rng)
+        parts.append(word)
+        parts.append(rng.choice([" ", " ", " ", ", ", ". ", "\n"]))
+    return "".join(parts)
+
+
+def legacy_translate(dictionary, text):
+    # Eski yöntem: her kelimede regex, tek kelimelik arama
+    translated = []
+    for word in text.lower().split():
+        clean_word = re.sub(r'[^\w\s]', '', word)
+        translated.append(dictionary.get(clean_word, word))
+    return " ".join(translated)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--entries", type=int, default=200000, help="sözlükteki tek kelimelik girdi sayısı")
+    parser.add_argument("--words", type=int, default=200000, help="çevrilecek metnin kelime sayısı")
+    parser.add_argument("--seed", type=int, default=13)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    vocabulary, dictionary = make_dictionary(rng, args.entries)
+    text = make_text(rng, vocabulary, args.words)
+
+    rows = []
+    with tempfile.TemporaryDirectory() as directory:
+        trie_dir = os.path.join(directory, "trie")
+        lexicon_dir = os.path.join(directory, "lexicon")
+        os.makedirs(trie_dir)
+        os.makedirs(lexicon_dir)
+        with open(os.path.join(trie_dir, "tr-en.tsv"), "w", encoding="utf-8") as file:
+            for source, target in dictionary.items():
+                file.write(f"{source}\t{target}\n")
+        build_lexicon(dictionary.items(), os.path.join(lexicon_dir, "tr-en.lex"), "tr")
+
+        for name, path in (("trie (bellekte)", trie_dir), ("mmap sözlük (.lex)", lexicon_dir)):
+            # Açılışta ayrılan bellek ayrı bir açılışla ölçülür (tracemalloc süreyi bozar)
+            tracemalloc.start()
+            OfflineTranslator(path).dictionary("tr", "en")
+            memory = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+
+            translator = OfflineTranslator(path)
+            gc.collect()
+            start = time.perf_counter()
+            entries = len(translator.dictionary("tr", "en"))
+            load_time = time.perf_counter() - start
+
+            start = time.perf_counter()
+            translator.translate(text, "tr", "en")
+            elapsed = time.perf_counter() - start
+            translator.close()
+            del translator
+            rows.append((name, load_time, memory, elapsed))
+
+    start = time.perf_counter()
+    legacy_translate(dictionary, text)
+    legacy_time = time.perf_counter() - start
+
+    print(f"sözlük: {entries:,} girdi, metin: {args.words:,} kelime")
+    print(f"{'yöntem':<28}{'açılış (sn)':>13}{'bellek (MB)':>13}{'kelime/sn':>14}")
+    print(f"{'eski (regex + düz sözlük)':<28}{'-':>13}{'-':>13}{args.words / legacy_time:>14,.0f}")
+    for name, load_time, memory, elapsed in rows:
+        print(f"{name:<28}{load_time:>13.3f}{memory / 2 ** 20:>13.1f}{args.words / elapsed:>14,.0f}")
+
+
+if __name__ == "__main__":
+    main()
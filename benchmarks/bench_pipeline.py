@@ -0,0 +1,480 @@
+"""Tekrarlanabilir çeviri hattı kıyaslaması
+
+TranslationPipeline'ı Google ve LibreTranslate yerine geçen yerel bir sahte
+sunucuya karşı sabit derlemlerle (tweet, sayfa, kitap) çalıştırır ve her
+aşama için verimi (karakter/sn), belge başına gecikme yüzdeliklerini ve
+tepe belleği (tracemalloc) ölçer:
+
+    split_text         metni parçalama
+    detect_language    satırların dilini yerel algılama
+    offline_translate  çevrimdışı sözlükle çeviri
+    translate_cold     boş önbellekle çeviri (arka uç zinciri, gerekirse çevrimdışı)
+    translate_warm     aynı belgelerin önbellekten çevirisi
+
+Çeviri aşamaları gecikme ve hata oranı ayarlanabilen senaryolarda (sağlıklı,
+kısmi hata, çevrimiçi arka uçlar kapalı) tekrarlanır. Sahte sunucu yanıtları
+varsayılan olarak yapay çeviriyle (büyük harf) üretir; --replay ile bir kayıt
+dosyasından verir, --record ile de bulamadığı istekleri gerçek arka uçlara
+sorup dosyaya ekler (ağ gerektirir). Sonuçlar JSON olarak kaydedilir;
+--compare önceki bir sonuç dosyasıyla karşılaştırıp eşiği aşan gerilemeleri
+listeler ve 1 ile çıkar.
+
+Tepe bellek ölçümü süreç içindeki sahte sunucuyu da kapsar. Yerel aşamaların
+süresi tracemalloc kapalıyken ölçülür, bellek ayrı bir geçişte ölçülür;
+ağ ağırlıklı translate_cold tek geçişte ikisini birlikte ölçer.
+
+Kullanım: python benchmarks/bench_pipeline.py [--output sonuc.json] [--compare onceki.json] [--replay kayit.json]
+"""
+import argparse
+import hashlib
+import json
+import os
+import platform
+import random
+import re
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import tracemalloc
+import urllib.request
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from language_samples import TRAINING_SAMPLES
+from translation_backends import BackendClients
+from translation_cache import TranslationCache
+from translation_pipeline import TranslationPipeline
+
+# Derlemler her çalıştırmada aynı olsun diye sabit tohumla üretilir
+CORPUS_SEED = 25
+LETTERS = "abcçdefgğhıijklmnoöprsştuüvyz"
+TWEET_LENGTH = 280
+# derlem -> (belge sayısı, yaklaşık belge uzunluğu; kitap için --book-kb)
+CORPORA = {"tweet": (200, TWEET_LENGTH), "page": (20, 3000), "book": (1, None)}
+
+# Sonuçlarda gerilemeye bakılan alanlar: (alan, daha kötü yön)
+COMPARED_FIELDS = (("chars_per_second", -1), ("p95_ms", 1), ("peak_memory_mb", 1))
+
+
+def vary(rng, sentence):
+    # Örnek cümlelerdeki iki kelime uydurma kelimelerle değiştirilir: metinler
+    # Türkçe kalır ama birbirinin kopyası olmaz (önbellek ve çeviri belleği ölçümü bozmasın)
+    words = sentence.split()
+    for _ in range(2):
+        words[rng.randrange(len(words) - 1)] = "".join(rng.choice(LETTERS) for _ in range(rng.randint(3, 9)))
+    return " ".join(words)
+
+
+def make_tweet(rng, sentences):
+    tweet = vary(rng, rng.choice(sentences))[:TWEET_LENGTH]
+    while rng.random() < 0.5:
+        sentence = vary(rng, rng.choice(sentences))
+        if len(tweet) + 1 + len(sentence) > TWEET_LENGTH:
+            break
+        tweet += " " + sentence
+    return tweet
+
+
+def make_document(rng, sentences, size, chapters=False):
+    paragraphs = []
+    length = 0
+    while length < size:
+        if chapters and len(paragraphs) % 20 == 0:
+            paragraphs.append(f"Bölüm {len(paragraphs) // 20 + 1}")
+        paragraph = " ".join(vary(rng, rng.choice(sentences)) for _ in range(rng.randint(3, 6)))
+        paragraphs.append(paragraph)
+        length += len(paragraph) + 2
+    return "\n\n".join(paragraphs)
+
+
+def make_corpora(book_size):
+    rng = random.Random(CORPUS_SEED)
+    sentences = re.split(r"(?<=[.!?])\s+", TRAINING_SAMPLES["tr"])
+    corpora = {}
+    for name, (count, size) in CORPORA.items():
+        if name == "tweet":
+            corpora[name] = [make_tweet(rng, sentences) for _ in range(count)]
+        else:
+            corpora[name] = [make_document(rng, sentences, size or book_size, chapters=size is None)
+                             for _ in range(count)]
+    return corpora
+
+
+def corpus_digest(documents):
+    digest = hashlib.sha256()
+    for document in documents:
+        digest.update(document.encode("utf-8") + b"\0")
+    return digest.hexdigest()
+
+
+def synthetic(q):
+    # Büyük harfe çevirme parça işaretlerini ("[[1]]") ve satır yapısını korur
+    return [text.upper() for text in q] if isinstance(q, list) else q.upper()
+
+
+class Recording:
+    """Sahte sunucunun yanıt kaynağı: kayıt dosyası, gerçek arka uç veya yapay çeviri
+
+    Kayıtta bulunan istekler aynen yanıtlanır. record=True ise bulunamayanlar
+    gerçek arka uçlara sorulur ve kayda eklenir; değilse yapay çeviriyle
+    yanıtlanır ve ıskalama olarak sayılır.
+    """
+
+    def __init__(self, path=None, record=False):
+        self.path = path
+        self.entries = {}
+        self.misses = 0
+        self.lock = threading.Lock()
+        self.real = BackendClients() if record else None
+        if path and os.path.exists(path):
+            with open(path, "r", encoding="utf-8") as f:
+                for entry in json.load(f):
+                    key = self.key(entry["backend"], entry["q"], entry["source"], entry["target"])
+                    self.entries[key] = entry["translation"]
+
+    @staticmethod
+    def key(backend, q, source, target):
+        return json.dumps([backend, source, target, q], ensure_ascii=False)
+
+    def translate(self, backend, q, source, target):
+        key = self.key(backend, q, source, target)
+        with self.lock:
+            if key in self.entries:
+                return self.entries[key]
+        if self.real is None:
+            with self.lock:
+                self.misses += 1
+            return synthetic(q)
+
+        if backend == "google":
+            translation = self.real.translate_google(q, source, target)
+        elif isinstance(q, list):
+            translation = self.real.translate_libre_batch(q, source, target)
+        else:
+            translation = self.real.translate_libre(q, source, target)
+        with self.lock:
+            self.entries[key] = translation
+        return translation
+
+    def save(self):
+        entries = []
+        for key, translation in self.entries.items():
+            backend, source, target, q = json.loads(key)
+            entries.append({"backend": backend, "source": source, "target": target, "q": q,
+                            "translation": translation})
+        with open(self.path, "w", encoding="utf-8") as f:
+            json.dump(entries, f, ensure_ascii=False, indent=1)
+
+    def close(self):
+        if self.real is not None:
+            self.real.close()
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    """POST /google ve /libre: {"q", "source", "target"} -> {"translatedText"}"""
+
+    def do_POST(self):
+        server = self.server
+        backend = self.path.strip("/")
+        length = int(self.headers.get("Content-Length", 0))
+        data = json.loads(self.rfile.read(length))
+        settings = server.settings.get(backend, {})
+        with server.lock:
+            server.requests[backend] = server.requests.get(backend, 0) + 1
+            failed = server.rng.random() < settings.get("error_rate", 0)
+        time.sleep(settings.get("latency", 0))
+        if failed:
+            self.send_response(500)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        try:
+            translation = server.recording.translate(backend, data["q"], data["source"], data["target"])
+        except Exception as e:
+            print(f"Kayıt için gerçek arka uç hatası: {str(e)}", file=sys.__stderr__)
+            self.send_response(502)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        body = json.dumps({"translatedText": translation}).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def start_stub_server(recording):
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubHandler)
+    server.daemon_threads = True
+    server.recording = recording
+    server.settings = {}
+    server.requests = {}
+    server.rng = random.Random(1)
+    server.lock = threading.Lock()
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def post_json(url, data, timeout=10):
+    payload = json.dumps(data).encode("utf-8")
+    request = urllib.request.Request(url, data=payload, headers={"Content-Type": "application/json"})
+    with urllib.request.urlopen(request, timeout=timeout) as response:
+        return json.loads(response.read())
+
+
+class StubGoogle:
+    """GoogleTranslator yerine sahte sunucuya giden istemci (translate/detect arayüzü)"""
+
+    def __init__(self, url, source, target):
+        self.url = url
+        self.source = source
+        self.target = target
+
+    def translate(self, text):
+        return post_json(self.url, {"q": text, "source": self.source, "target": self.target})["translatedText"]
+
+    def detect(self, text):
+        # Yerel algılamanın sonucu kullanılır
+        return None
+
+
+class StubBackends(BackendClients):
+    """Gerçek istemci kodu (bağlantı havuzu, toplu paketleme) sahte sunucuya yönlendirilir"""
+
+    def __init__(self, url):
+        super().__init__(libre_url=url + "/libre", timeout=10)
+        self.google_url = url + "/google"
+
+    def google(self, source, target):
+        return StubGoogle(self.google_url, source, target)
+
+
+def make_scenarios(latency, failure_rate):
+    # Senaryo: (ad, arka uç başına sahte sunucu ayarları)
+    return [
+        ("sağlıklı", {"google": {"latency": latency}, "libre": {"latency": latency * 2}}),
+        (f"Google %{failure_rate * 100:.0f} hata", {"google": {"latency": latency, "error_rate": failure_rate},
+                                                 "libre": {"latency": latency * 2}}),
+        ("çevrimiçi kapalı", {"google": {"latency": latency, "error_rate": 1.0},
+                              "libre": {"latency": latency * 2, "error_rate": 1.0}}),
+    ]
+
+
+def percentile(values, fraction):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+def run_stage(func, documents, repeat=1):
+    latencies = []
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for document in documents:
+            started = time.perf_counter()
+            func(document)
+            latencies.append(time.perf_counter() - started)
+    return time.perf_counter() - start, latencies
+
+
+def measure(func, documents, repeat=1, traced=False):
+    """(süre, belge başına gecikmeler, tepe bellek) döndür
+
+    traced=False ise süre tracemalloc kapalıyken ölçülür ve bellek için ayrı
+    bir geçiş yapılır (func tekrar çalıştırılabilir olmalıdır).
+    """
+    if not traced:
+        elapsed, latencies = run_stage(func, documents, repeat)
+    tracemalloc.start()
+    try:
+        if traced:
+            elapsed, latencies = run_stage(func, documents, repeat)
+        else:
+            run_stage(func, documents)
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    return elapsed, latencies, peak
+
+
+def result_row(scenario, corpus, stage, documents, repeat, elapsed, latencies, peak, **extra):
+    characters = sum(len(document) for document in documents) * repeat
+    row = {
+        "scenario": scenario,
+        "corpus": corpus,
+        "stage": stage,
+        "documents": len(latencies),
+        "characters": characters,
+        "seconds": round(elapsed, 4),
+        "chars_per_second": round(characters / elapsed, 1) if elapsed else None,
+        "p50_ms": round(percentile(latencies, 0.5) * 1000, 3),
+        "p95_ms": round(percentile(latencies, 0.95) * 1000, 3),
+        "p99_ms": round(percentile(latencies, 0.99) * 1000, 3),
+        "peak_memory_mb": round(peak / 1024 / 1024, 3)
+    }
+    row.update(extra)
+    return row
+
+
+def print_row(row):
+    requests = row.get("backend_requests", {})
+    print(f"{row['scenario']:<18}{row['corpus']:<7}{row['stage']:<19}{row['documents']:>6}"
+          f"{row['chars_per_second'] or 0:>15,.0f}{row['p50_ms']:>10.2f}{row['p95_ms']:>10.2f}{row['p99_ms']:>10.2f}"
+          f"{row['peak_memory_mb']:>9.2f}{requests.get('google', 0):>8}{requests.get('libre', 0):>7}"
+          f"{row.get('offline_fallbacks', 0):>10}")
+
+
+def git_commit():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True,
+                              cwd=os.path.dirname(os.path.abspath(__file__))).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare(results, baseline, threshold):
+    """Önceki sonuçlarla karşılaştır; gerileme sayısını döndür"""
+    if baseline.get("corpora") != results["corpora"]:
+        print("Uyarı: derlemler önceki çalıştırmadakiyle aynı değil, karşılaştırma yanıltıcı olabilir")
+    if baseline.get("settings") != results["settings"]:
+        print("Uyarı: ayarlar önceki çalıştırmadakinden farklı")
+    previous = {(row["scenario"], row["corpus"], row["stage"]): row for row in baseline["results"]}
+
+    print(f"\n{baseline.get('commit') or '?'} -> {results.get('commit') or '?'} "
+          f"(eşik %{threshold * 100:.0f})")
+    regressions = 0
+    for row in results["results"]:
+        before = previous.get((row["scenario"], row["corpus"], row["stage"]))
+        if before is None:
+            continue
+        for field, worse in COMPARED_FIELDS:
+            old, new = before.get(field), row.get(field)
+            if not old or new is None:
+                continue
+            change = (new - old) / old
+            if abs(change) <= threshold:
+                continue
+            regressed = change * worse > 0
+            regressions += regressed
+            print(f"{'GERİLEME' if regressed else 'iyileşme':<10}{row['scenario']:<18}{row['corpus']:<7}"
+                  f"{row['stage']:<19}{field:<18}{old:>12,.2f} -> {new:>12,.2f} ({change:+.0%})")
+    print(f"{regressions} gerileme")
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--output", help="sonuç dosyası (varsayılan: bench_pipeline-<commit>.json)")
+    parser.add_argument("--compare", metavar="DOSYA", help="karşılaştırılacak önceki sonuç dosyası")
+    parser.add_argument("--threshold", type=float, default=0.2, help="gerileme eşiği (0.2: %%20)")
+    parser.add_argument("--replay", metavar="DOSYA", help="sahte sunucu yanıtlarının kayıt dosyası")
+    parser.add_argument("--record", action="store_true",
+                        help="kayıtta olmayan istekleri gerçek arka uçlara sor ve --replay dosyasına ekle")
+    parser.add_argument("--latency", type=float, default=0.02, help="sahte Google gecikmesi (sn, Libre 2 katı)")
+    parser.add_argument("--failure-rate", type=float, default=0.3, help="kısmi hata senaryosunda Google hata oranı")
+    parser.add_argument("--corpora", default="tweet,page,book", help="çalıştırılacak derlemler (virgülle)")
+    parser.add_argument("--book-kb", type=int, default=200, help="kitap derleminin boyutu (KB)")
+    parser.add_argument("--repeat", type=int, default=3, help="yerel aşamaların tekrar sayısı")
+    parser.add_argument("--workers", type=int, default=4, help="eş zamanlı arka uç isteği sayısı")
+    args = parser.parse_args(argv)
+    if args.record and not args.replay:
+        parser.error("--record için --replay dosyası gerekli")
+
+    corpora = make_corpora(args.book_kb * 1024)
+    names = [name for name in args.corpora.split(",") if name]
+    recording = Recording(args.replay, record=args.record)
+    server = start_stub_server(recording)
+    url = f"http://127.0.0.1:{server.server_address[1]}"
+    settings = {key: value for key, value in vars(args).items()
+                if key not in ("output", "compare", "threshold", "record")}
+    results = {
+        "suite": "bench_pipeline",
+        "commit": git_commit(),
+        "timestamp": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "settings": settings,
+        "corpora": {name: {"documents": len(corpora[name]),
+                           "characters": sum(len(document) for document in corpora[name]),
+                           "sha256": corpus_digest(corpora[name])} for name in names},
+        "results": []
+    }
+    # Hat her başarısız isteği stderr'e yazar; ölçüm çıktısı okunabilir kalsın
+    sys.stderr = open(os.devnull, "w")
+
+    for name in names:
+        info = results["corpora"][name]
+        print(f"{name}: {info['documents']} belge, {info['characters']:,} karakter")
+    print(f"{'senaryo':<18}{'derlem':<7}{'aşama':<19}{'belge':>6}{'karakter/sn':>15}{'p50 ms':>10}"
+          f"{'p95 ms':>10}{'p99 ms':>10}{'tepe MB':>9}{'google':>8}{'libre':>8}{'çevrimdışı':>12}")
+
+    with tempfile.TemporaryDirectory() as directory:
+        # Yerel aşamalar arka uçtan bağımsızdır, senaryo başına tekrarlanmaz
+        pipeline = TranslationPipeline(cache=TranslationCache(os.path.join(directory, "local.db")),
+                                       backends=StubBackends(url), requests_per_second=None)
+        local_stages = [
+            ("split_text", pipeline.split_text),
+            ("detect_language", lambda document: pipeline.detector.detect_batch(
+                [line for line in document.splitlines() if line.strip()])),
+            ("offline_translate", lambda document: pipeline.offline_translate(document, "tr", "en")),
+        ]
+        for name in names:
+            for stage, func in local_stages:
+                elapsed, latencies, peak = measure(func, corpora[name], args.repeat)
+                row = result_row("yerel", name, stage, corpora[name], args.repeat, elapsed, latencies, peak)
+                results["results"].append(row)
+                print_row(row)
+        pipeline.close()
+
+        for scenario, backend_settings in make_scenarios(args.latency, args.failure_rate):
+            server.settings = backend_settings
+            for name in names:
+                documents = corpora[name]
+                # Her derlem boş önbellek ve kapalı devre kesicilerle başlar
+                pipeline = TranslationPipeline(
+                    cache=TranslationCache(os.path.join(directory, f"{len(results['results'])}.db")),
+                    backends=StubBackends(url), max_workers=args.workers, requests_per_second=None)
+                translate = lambda document: pipeline.translate(document, "tr", "en")
+                for stage, traced in (("translate_cold", True), ("translate_warm", False)):
+                    server.requests = {}
+                    fallbacks = pipeline.metrics.counter("fallbacks_total", backend="offline")
+                    elapsed, latencies, peak = measure(translate, documents, traced=traced)
+                    row = result_row(scenario, name, stage, documents, 1, elapsed, latencies, peak,
+                                     backend_requests=dict(server.requests),
+                                     offline_fallbacks=pipeline.metrics.counter(
+                                         "fallbacks_total", backend="offline") - fallbacks)
+                    results["results"].append(row)
+                    print_row(row)
+                pipeline.close()
+
+    server.shutdown()
+    recording.close()
+    if args.replay:
+        if args.record:
+            recording.save()
+            print(f"Kayıt güncellendi: {args.replay} ({len(recording.entries)} yanıt)")
+        elif recording.misses:
+            print(f"Uyarı: {recording.misses} istek kayıtta yoktu, yapay çeviriyle yanıtlandı")
+
+    output = args.output or f"bench_pipeline-{results['commit'] or 'yerel'}.json"
+    with open(output, "w", encoding="utf-8") as f:
+        json.dump(results, f, ensure_ascii=False, indent=2)
+    print(f"Sonuçlar kaydedildi: {output}")
+
+    if args.compare:
+        with open(args.compare, "r", encoding="utf-8") as f:
+            baseline = json.load(f)
+        if compare(results, baseline, args.threshold):
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,152 @@
+"""Çeviri servisi yük testi
+
+translation_service.TranslationService'i yerel bir sahte LibreTranslate
+sunucusuna bağlı bir hatla başlatır ve çok sayıda eş zamanlı keep-alive
+bağlantıdan POST /translate istekleri gönderir. İsteklerin bir kısmı küçük
+bir "sıcak" metin kümesinden seçilir (aynı metni aynı anda soran araçlar).
+Gruplama kapalıyken, varsayılan ayarlarla ve küçük bir bekleme sınırıyla
+(geri basınç) p50/p99 gecikmeyi, saniyedeki istek sayısını, 503 yanıtlarını,
+birleştirilen istekleri ve sahte sunucuya giden istek sayısını yazdırır.
+
+Kullanım: python benchmarks/bench_service.py [--requests 2000] [--concurrency 64] [--latency 0.03]
+"""
+import argparse
+import asyncio
+import json
+import os
+import random
+import sys
+import tempfile
+import threading
+import time
+from http.server import ThreadingHTTPServer
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from backend_router import Backend, BackendRouter
+from bench_batching import NoMemory, StubClients, StubHandler, make_texts
+from translation_cache import TranslationCache
+from translation_pipeline import TranslationPipeline
+from translation_service import TranslationService
+
+# (ad, batch_window sn, max_batch, max_pending)
+CONFIGS = [
+    ("gruplama yok", 0.0, 1, 100000),
+    ("varsayılan", 0.005, 50, 1000),
+    ("geri basınç (32)", 0.005, 50, 32),
+]
+
+
+def start_service(service):
+    # Servis kendi olay döngüsüyle ayrı bir iş parçacığında çalışır
+    loop = asyncio.new_event_loop()
+    started = threading.Event()
+    address = {}
+
+    async def run():
+        server = await service.start("127.0.0.1", 0)
+        address["port"] = server.sockets[0].getsockname()[1]
+        started.set()
+        try:
+            await server.serve_forever()
+        except asyncio.CancelledError:
+            # service.close() sunucuyu kapattı
+            pass
+
+    threading.Thread(target=loop.run_until_complete, args=(run(),), daemon=True).start()
+    started.wait()
+    return loop, address["port"]
+
+
+async def post(reader, writer, body):
+    writer.write(b"POST /translate HTTP/1.1\r\nHost: 127.0.0.1\r\nContent-Type: application/json\r\n"
+                 + f"Content-Length: {len(body)}\r\n\r\n".encode("latin-1") + body)
+    await writer.drain()
+    status = int((await reader.readline()).split()[1])
+    length = 0
+    while True:
+        line = await reader.readline()
+        if line in (b"\r\n", b""):
+            break
+        name, _, value = line.decode("latin-1").partition(":")
+        if name.lower() == "content-length":
+            length = int(value)
+    return status, json.loads(await reader.readexactly(length))
+
+
+async def load(port, bodies, concurrency):
+    latencies = []
+    statuses = {}
+    queue = iter(bodies)
+
+    async def client():
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        for body, expected in queue:
+            start = time.perf_counter()
+            status, payload = await post(reader, writer, body)
+            latencies.append(time.perf_counter() - start)
+            if status == 200 and payload["translation"] != expected:
+                status = "yanlış"
+            statuses[status] = statuses.get(status, 0) + 1
+        writer.close()
+
+    start = time.perf_counter()
+    await asyncio.gather(*(client() for _ in range(concurrency)))
+    return time.perf_counter() - start, latencies, statuses
+
+
+def percentile(values, fraction):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=2000, help="toplam istek sayısı")
+    parser.add_argument("--concurrency", type=int, default=64, help="eş zamanlı bağlantı sayısı")
+    parser.add_argument("--latency", type=float, default=0.03, help="sahte sunucu gecikmesi (sn)")
+    parser.add_argument("--hot", type=float, default=0.3, help="sıcak kümeden gelen istek oranı")
+    parser.add_argument("--workers", type=int, default=4, help="eş zamanlı arka uç isteği sayısı")
+    args = parser.parse_args()
+
+    StubHandler.latency = args.latency
+    stub = ThreadingHTTPServer(("127.0.0.1", 0), StubHandler)
+    threading.Thread(target=stub.serve_forever, daemon=True).start()
+    clients = StubClients(f"http://127.0.0.1:{stub.server_address[1]}/translate")
+
+    rng = random.Random(args.requests)
+    hot = make_texts(rng, 20)
+    cold = make_texts(rng, args.requests)
+    texts = [rng.choice(hot) if rng.random() < args.hot else cold[i] for i in range(args.requests)]
+    bodies = [(json.dumps({"text": text, "source": "tr", "target": "en"}).encode("utf-8"), text.upper())
+              for text in texts]
+
+    print(f"{args.requests} istek, {args.concurrency} bağlantı, arka uç gecikmesi {args.latency}s, "
+          f"sıcak oran {args.hot:.0%}")
+    print(f"{'ayar':<20}{'istek/sn':>10}{'p50 ms':>9}{'p99 ms':>9}{'200':>7}{'503':>6}{'yanlış':>8}"
+          f"{'birleşen':>10}{'grup':>7}{'arka uç':>9}")
+    for name, window, max_batch, max_pending in CONFIGS:
+        with tempfile.TemporaryDirectory() as directory:
+            router = BackendRouter([Backend("LibreTranslate", clients.translate_libre,
+                                            translate_batch=clients.translate_libre_batch)])
+            pipeline = TranslationPipeline(cache=TranslationCache(os.path.join(directory, "cache.db")),
+                                           backends=clients, router=router, memory=NoMemory(),
+                                           max_workers=args.workers, requests_per_second=None)
+            service = TranslationService(pipeline, batch_window=window, max_batch=max_batch,
+                                         max_pending=max_pending, max_concurrent=args.workers)
+            loop, port = start_service(service)
+            StubHandler.requests = 0
+            elapsed, latencies, statuses = asyncio.run(load(port, bodies, args.concurrency))
+            stats = service.stats()
+            loop.call_soon_threadsafe(service.close)
+            pipeline.close()
+        print(f"{name:<20}{len(latencies) / elapsed:>10.0f}{percentile(latencies, 0.5) * 1000:>9.1f}"
+              f"{percentile(latencies, 0.99) * 1000:>9.1f}{statuses.get(200, 0):>7}{statuses.get(503, 0):>6}"
+              f"{statuses.get('yanlış', 0):>8}{stats['coalesced']:>10}{stats['batches']:>7}"
+              f"{StubHandler.requests:>9}")
+
+    stub.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,123 @@
+"""Metin parçalama mikro kıyaslaması
+
+Çok megabaytlık sentetik metinleri eski split_text algoritması ve yeni
+iter_chunks üreteciyle parçalar; süreyi, parça sayısını, parçaların bütçeyi
+ortalama doldurma oranını, bütçeyi aşan ve boş parçaları ve kaybolan
+(parçalara girmeyen) karakter sayısını karşılaştırır.
+
+Kullanım: python benchmarks/bench_split_text.py [--sizes 1,4,16] [--max-length 4500]
+"""
+import argparse
+import os
+import random
+import re
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from translation_pipeline import iter_chunks, byte_length
+
+LETTERS = "abcçdefgğhıijklmnoöprsştuüvyz"
+
+
+def legacy_split_text(text, max_length):
+    # Eski TranslationPipeline.split_text (karşılaştırma için birebir kopya)
+    if not text:
+        return []
+    if len(text) <= max_length:
+        return [text]
+    chunks = []
+    sentences = re.split(r'(?<=[.!?])\s+', text)
+    current_chunk = ""
+    for sentence in sentences:
+        if len(sentence) > max_length:
+            if current_chunk:
+                chunks.append(current_chunk)
+                current_chunk = ""
+            words = sentence.split()
+            word_chunk = ""
+            for word in words:
+                if len(word_chunk) + len(word) + 1 <= max_length:
+                    word_chunk += word + " "
+                else:
+                    chunks.append(word_chunk.strip())
+                    word_chunk = word + " "
+            if word_chunk:
+                current_chunk = word_chunk
+        else:
+            if len(current_chunk) + len(sentence) + 1 <= max_length:
+                current_chunk += sentence + " "
+            else:
+                chunks.append(current_chunk.strip())
+                current_chunk = sentence + " "
+    if current_chunk:
+        chunks.append(current_chunk.strip())
+    return chunks
+
+
+def make_text(rng, size):
+    # Paragraflar, normal cümleler, arada noktasız çok uzun "cümleler" (tablolar, listeler)
+    # ve bütçeden uzun boşluksuz parçalar (base64, uzun URL'ler)
+    parts = []
+    length = 0
+    while length < size:
+        if rng.random() < 0.001:
+            sentence = "".join(rng.choice(LETTERS) for _ in range(rng.randint(5000, 9000))) + " "
+            parts.append(sentence)
+            length += len(sentence)
+            continue
+        if rng.random() < 0.02:
+            words = rng.randint(800, 1500)
+            end = "\n"
+        else:
+            words = rng.randint(5, 30)
+            end = rng.choice([". ", ". ", "! ", "? ", ".\n\n"])
+        sentence = " ".join("".join(rng.choice(LETTERS) for _ in range(rng.randint(2, 10)))
+                            for _ in range(words)).capitalize() + end
+        parts.append(sentence)
+        length += len(sentence)
+    return "".join(parts)
+
+
+def non_space(chunks):
+    return sum(len(chunk) - chunk.count(" ") - chunk.count("\n") - chunk.count("\t") for chunk in chunks)
+
+
+def report(name, text, chunks, elapsed, limit, measure):
+    sizes = [measure(chunk) for chunk in chunks]
+    fill = sum(min(size, limit) for size in sizes) / (len(chunks) * limit) if chunks else 0
+    over = sum(size > limit for size in sizes)
+    empty = sum(not chunk for chunk in chunks)
+    lost = non_space([text]) - non_space(chunks)
+    print(f"  {name:<26}{elapsed:>9.3f}{len(chunks):>9}{fill:>9.1%}{over:>7}{empty:>6}{lost:>8,}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", default="1,4,16", help="metin boyutları (MB, virgülle)")
+    parser.add_argument("--max-length", type=int, default=4500, help="parça bütçesi")
+    args = parser.parse_args()
+
+    limit = args.max_length
+    for size in (float(value) for value in args.sizes.split(",")):
+        rng = random.Random(int(size * 10))
+        text = make_text(rng, int(size * 1024 * 1024))
+        print(f"{size:g} MB ({len(text):,} karakter), bütçe {limit}")
+        print(f"  {'yöntem':<26}{'süre (sn)':>9}{'parça':>9}{'doluluk':>9}{'aşan':>7}{'boş':>6}{'kayıp':>8}")
+
+        start = time.perf_counter()
+        chunks = legacy_split_text(text, limit)
+        report("eski split_text", text, chunks, time.perf_counter() - start, limit, len)
+
+        start = time.perf_counter()
+        chunks = [chunk for chunk, _ in iter_chunks(text, limit) if chunk]
+        report("iter_chunks (karakter)", text, chunks, time.perf_counter() - start, limit, len)
+
+        start = time.perf_counter()
+        chunks = [chunk for chunk, _ in iter_chunks(text, max_bytes=limit) if chunk]
+        report("iter_chunks (bayt)", text, chunks, time.perf_counter() - start, limit, byte_length)
+
+
+if __name__ == "__main__":
+    main()
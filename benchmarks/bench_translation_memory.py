@@ -0,0 +1,96 @@
+"""Çeviri belleği kıyaslaması
+
+Farklı boyutlarda sentetik cümle belleği kurar ve küçük değişiklikler
+içeren (noktalama, boşluk, tek harf) sorgular için isabet oranını ve arama
+süresini ölçer; aynı aramayı tüm kayıtları tarayan doğrusal yöntemle
+karşılaştırır.
+
+Kullanım: python benchmarks/bench_translation_memory.py [--sizes 1000,10000,30000]
+"""
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from translation_memory import TranslationMemory, normalize, numpy
+
+LETTERS = "abcçdefgğhıijklmnoöprsştuüvyz"
+
+
+def make_sentences(rng, count, vocabulary_size=3000, words=12):
+    vocabulary = ["".join(rng.choice(LETTERS) for _ in range(rng.randint(2, 9))) for _ in range(vocabulary_size)]
+    return [" ".join(rng.choice(vocabulary) for _ in range(words)).capitalize() + "." for _ in range(count)]
+
+
+def perturb(rng, sentence):
+    # Kurumsal metinlerdeki tipik küçük farklar
+    choice = rng.randrange(3)
+    if choice == 0:
+        return sentence[:-1] + "!"
+    if choice == 1:
+        return sentence.replace(" ", "  ", 1)
+    i = rng.randrange(1, len(sentence) - 1)
+    return sentence[:i] + rng.choice(LETTERS) + sentence[i + 1:]
+
+
+def linear_lookup(memory, sentences, text):
+    # Karşılaştırma: her kayıtla Jaccard benzerliği hesaplayan doğrusal tarama
+    shingles = memory.shingles(normalize(text))
+    best = None
+    for source in sentences:
+        score = memory.similarity(shingles, memory.shingles(source))
+        if score >= memory.threshold and (best is None or score > best):
+            best = score
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", default="1000,10000,30000", help="bellek boyutları (virgülle)")
+    parser.add_argument("--queries", type=int, default=300, help="boyut başına sorgu sayısı")
+    parser.add_argument("--threshold", type=float, default=0.9)
+    args = parser.parse_args()
+
+    print(f"numpy: {'var' if numpy is not None else 'yok'}  eşik: {args.threshold}")
+    print(f"{'kayıt':>8}{'ekleme/sn':>12}{'LSH ms':>10}{'doğrusal ms':>14}{'isabet':>9}{'yanlış':>9}")
+    for size in (int(value) for value in args.sizes.split(",")):
+        rng = random.Random(size)
+        sentences = make_sentences(rng, size)
+        memory = TranslationMemory(threshold=args.threshold)
+
+        start = time.perf_counter()
+        for sentence in sentences:
+            memory.add("tr", "en", sentence, sentence.upper())
+        add_rate = size / (time.perf_counter() - start)
+
+        # Sorguların yarısı bellekteki cümlelerin küçük değişiklikli halleri, yarısı yeni cümleler
+        targets = [rng.choice(sentences) for _ in range(args.queries // 2)]
+        queries = [(perturb(rng, target), target) for target in targets]
+        queries += [(sentence, None) for sentence in make_sentences(rng, args.queries - len(queries))]
+
+        hits = wrong = 0
+        start = time.perf_counter()
+        for query, target in queries:
+            match = memory.lookup("tr", "en", query)
+            if match is not None:
+                if target is not None and match[0] == target.upper():
+                    hits += 1
+                else:
+                    wrong += 1
+        lsh_time = (time.perf_counter() - start) / len(queries)
+
+        linear_queries = queries[:10]
+        start = time.perf_counter()
+        for query, _ in linear_queries:
+            linear_lookup(memory, sentences, query)
+        linear_time = (time.perf_counter() - start) / len(linear_queries)
+
+        print(f"{size:>8}{add_rate:>12,.0f}{lsh_time * 1000:>10.2f}{linear_time * 1000:>14.2f}"
+              f"{hits / len(targets):>9.0%}{wrong:>9}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,200 @@
+import hashlib
+import math
+import re
+import sys
+import threading
+from array import array
+from collections import Counter, OrderedDict
+
+from language_samples import TRAINING_SAMPLES
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+# Karakter sınıfları (yazı sistemi etiketleri); benzer yazılı dilleri ayırmaya yardım eder
+SCRIPT_RANGES = [
+    ("\u0400", "\u04ff", "<cyr>"),
+    ("\u0600", "\u06ff", "<arab>"),
+    ("\u3040", "\u309f", "<hira>"),
+    ("\u30a0", "\u30ff", "<kata>"),
+    ("\u4e00", "\u9fff", "<han>"),
+    ("\uac00", "\ud7af", "<hang>"),
+]
+
+NON_LETTERS = re.compile(r"[\W\d_]+")
+
+
+def script_tag(char):
+    for start, end, tag in SCRIPT_RANGES:
+        if start <= char <= end:
+            return tag
+    return None
+
+
+class NgramLanguageModel:
+    """Karakter n-gram profilleriyle çevrimdışı dil tanıma
+
+    Her dil için 1-3 karakterlik n-gramların log olasılıkları tek bir
+    sözlük indeksi üzerinde dil başına bir dizi (array) olarak tutulur.
+    Bir metin önce özellik indekslerine çevrilir, sonra her dilin puanı bu
+    indekslerin toplamıyla hesaplanır. NumPy kuruluysa tüm diller tek bir
+    matris toplamıyla puanlanır.
+    """
+
+    def __init__(self, samples=None, orders=(1, 2, 3), alpha=0.5, sharpness=6.0):
+        samples = samples if samples is not None else TRAINING_SAMPLES
+        self.orders = orders
+        self.sharpness = sharpness
+        self.languages = list(samples)
+
+        counts = [Counter(self.features(text)) for text in samples.values()]
+        vocabulary = set()
+        for counter in counts:
+            vocabulary.update(counter)
+        self.index = {feature: i for i, feature in enumerate(sorted(vocabulary))}
+
+        # Dil başına log olasılık dizileri (add-alpha düzeltmesiyle)
+        self.profiles = []
+        for counter in counts:
+            total = sum(counter.values()) + alpha * len(self.index)
+            profile = array("d", [0.0]) * len(self.index)
+            for feature, i in self.index.items():
+                profile[i] = math.log((counter.get(feature, 0) + alpha) / total)
+            self.profiles.append(profile)
+
+        self.matrix = None
+        if numpy is not None:
+            self.matrix = numpy.array(self.profiles).T.copy()
+
+    def features(self, text):
+        text = " " + NON_LETTERS.sub(" ", text.lower()).strip() + " "
+        features = []
+        for n in self.orders:
+            features.extend(text[i:i + n] for i in range(len(text) - n + 1))
+        for char in text:
+            tag = script_tag(char)
+            if tag is not None:
+                features.append(tag)
+        return features
+
+    def feature_indices(self, text):
+        index = self.index
+        return [index[f] for f in self.features(text) if f in index]
+
+    def scores(self, text):
+        indices = self.feature_indices(text)
+        if not indices:
+            return None, 0
+        if self.matrix is not None:
+            return self.matrix[indices].sum(axis=0).tolist(), len(indices)
+        return [sum(map(profile.__getitem__, indices)) for profile in self.profiles], len(indices)
+
+    def _decide(self, scores, count):
+        if scores is None:
+            return self.languages[0], 0.0
+
+        # Özellik başına ortalama log olasılıkla yumuşatılmış softmax
+        best = max(scores)
+        weights = [math.exp((score - best) / count * self.sharpness) for score in scores]
+        total = sum(weights)
+        top = scores.index(best)
+        return self.languages[top], weights[top] / total
+
+    def detect(self, text):
+        """(dil kodu, güven) döndürür; güven 0 ile 1 arasındadır"""
+        return self._decide(*self.scores(text))
+
+    def detect_batch(self, texts):
+        """Metin listesini tek geçişte puanla; her metin için (dil kodu, güven) döndürür
+
+        NumPy varsa tüm metinlerin özellik satırları tek bir dizide toplanır ve
+        add.reduceat ile metin başına tek seferde toplanır.
+        """
+        if self.matrix is None:
+            return [self.detect(text) for text in texts]
+
+        all_indices = []
+        offsets = []
+        counts = []
+        for text in texts:
+            indices = self.feature_indices(text)
+            counts.append(len(indices))
+            if indices:
+                offsets.append(len(all_indices))
+                all_indices.extend(indices)
+
+        sums = iter(numpy.add.reduceat(self.matrix[all_indices], offsets, axis=0).tolist()) if offsets else iter(())
+        return [self._decide(next(sums), count) if count else self._decide(None, 0) for count in counts]
+
+
+_default_model = None
+_default_model_lock = threading.Lock()
+
+
+def default_model():
+    # Profiller ilk kullanımda bir kez hesaplanır
+    global _default_model
+    with _default_model_lock:
+        if _default_model is None:
+            _default_model = NgramLanguageModel()
+        return _default_model
+
+
+class LanguageDetector:
+    """Önce yerel, gerekirse ağ üzerinden dil algılama
+
+    Yerel algılayıcının güveni min_confidence altında kaldığında Google'a
+    sorulur. Sonuçlar örnek metnin özetine göre önbelleğe alınır; aynı metin
+    ikinci kez ağa gitmez.
+    """
+
+    def __init__(self, backends=None, min_confidence=0.6, sample_length=100, cache_size=1024):
+        self.backends = backends
+        self.min_confidence = min_confidence
+        self.sample_length = sample_length
+        self.cache_size = cache_size
+        self.cache = OrderedDict()
+        self.lock = threading.Lock()
+
+    def detect_local(self, text):
+        return default_model().detect(text)
+
+    def detect_batch(self, segments):
+        """Her parçanın dil kodunu tek bir yerel geçişte döndür (ağa gitmez)"""
+        return [lang for lang, _ in default_model().detect_batch(segments)]
+
+    def group_by_language(self, segments):
+        """Parçaları algılanan dile göre grupla: {dil: [parça indeksleri]}"""
+        groups = {}
+        for i, lang in enumerate(self.detect_batch(segments)):
+            groups.setdefault(lang, []).append(i)
+        return groups
+
+    def detect(self, text):
+        """Metnin dil kodunu döndür"""
+        # Kısa bir metin parçası al (algılama için yeterlidir)
+        sample = text[:self.sample_length]
+        key = hashlib.sha256(sample.encode("utf-8")).hexdigest()
+
+        with self.lock:
+            if key in self.cache:
+                self.cache.move_to_end(key)
+                return self.cache[key]
+
+        detected_lang, confidence = self.detect_local(sample)
+
+        # Yerel sonuç belirsizse ağa sor
+        if confidence < self.min_confidence and self.backends is not None:
+            try:
+                detected_lang = self.backends.detect_google(sample) or detected_lang
+            except Exception as e:
+                print(f"Ağ üzerinden dil algılama hatası: {str(e)}", file=sys.stderr)
+
+        with self.lock:
+            self.cache[key] = detected_lang
+            if len(self.cache) > self.cache_size:
+                self.cache.popitem(last=False)
+        return detected_lang
@@ -0,0 +1,183 @@
+# Dil profillerinin çıkarıldığı örnek metinler (karakter n-gram istatistikleri için)
+TRAINING_SAMPLES = {
+    "tr": (
+        "Bugün hava çok güzel, bu yüzden parkta yürüyüş yapmaya karar verdik. "
+        "Çocuklar bahçede oynarken annem mutfakta yemek hazırlıyordu. "
+        "Yarın sabah erkenden işe gitmem gerekiyor, toplantı saat dokuzda başlayacak. "
+        "Bu kitabı okumanı gerçekten tavsiye ederim, çünkü çok ilginç bir hikayesi var. "
+        "Türkiye'nin en kalabalık şehri İstanbul'dur ve iki kıta üzerinde kuruludur. "
+        "Lütfen kapıyı kapatır mısın? Dışarısı oldukça soğuk ve rüzgarlı. "
+        "Öğretmenimiz derste bize tarihin önemini anlattı ve ödev verdi. "
+        "Akşam yemeğinden sonra arkadaşlarımla birlikte sinemaya gideceğiz. "
+        "Bilgisayarım bozulduğu için bütün dosyalarımı kaybettim, çok üzgünüm. "
+        "Her gün düzenli olarak spor yapmak sağlığımız için çok faydalıdır. "
+        "Merhaba, nasılsınız? Size nasıl yardımcı olabilirim? Teşekkür ederim, iyiyim. "
+        "Şirketimiz yeni bir ürün geliştirdi ve önümüzdeki ay satışa çıkaracak. "
+        "Ben ve kardeşim bu yaz tatilde deniz kenarındaki köyümüze gideceğiz. "
+        "Geçen hafta aldığım ayakkabılar biraz dar geldi, değiştirmem lazım. "
+        "Bu konuyu daha önce konuşmuştuk ama henüz bir karara varamadık."
+    ),
+    "en": (
+        "The weather is really nice today, so we decided to take a walk in the park. "
+        "While the children were playing in the garden, my mother was cooking dinner. "
+        "I have to go to work early tomorrow morning because the meeting starts at nine. "
+        "I would really recommend reading this book, it has a very interesting story. "
+        "London is the capital of England and one of the largest cities in Europe. "
+        "Could you please close the door? It is quite cold and windy outside. "
+        "Our teacher explained the importance of history and gave us some homework. "
+        "After dinner we are going to the cinema with some of our friends. "
+        "My computer broke down and I lost all of my files, which is very sad. "
+        "Doing sports regularly every day is very good for our health. "
+        "Hello, how are you? How can I help you? Thank you, I am fine. "
+        "Our company has developed a new product and will start selling it next month. "
+        "My brother and I will spend the summer holiday in our village by the sea. "
+        "The shoes that I bought last week are a little tight, I need to change them. "
+        "We talked about this subject before but we have not reached a decision yet."
+    ),
+    "de": (
+        "Das Wetter ist heute sehr schön, deshalb haben wir beschlossen, im Park spazieren zu gehen. "
+        "Während die Kinder im Garten spielten, kochte meine Mutter das Abendessen. "
+        "Ich muss morgen früh zur Arbeit gehen, weil die Besprechung um neun Uhr beginnt. "
+        "Ich kann dir dieses Buch wirklich empfehlen, es hat eine sehr interessante Geschichte. "
+        "Berlin ist die Hauptstadt von Deutschland und eine der größten Städte Europas. "
+        "Könntest du bitte die Tür schließen? Draußen ist es ziemlich kalt und windig. "
+        "Unser Lehrer hat uns die Bedeutung der Geschichte erklärt und Hausaufgaben gegeben. "
+        "Nach dem Abendessen gehen wir mit unseren Freunden ins Kino. "
+        "Mein Computer ist kaputt gegangen und ich habe alle meine Dateien verloren. "
+        "Jeden Tag regelmäßig Sport zu treiben ist sehr gut für unsere Gesundheit. "
+        "Hallo, wie geht es Ihnen? Wie kann ich Ihnen helfen? Danke, mir geht es gut. "
+        "Unsere Firma hat ein neues Produkt entwickelt und wird es nächsten Monat verkaufen. "
+        "Mein Bruder und ich verbringen die Sommerferien in unserem Dorf am Meer. "
+        "Die Schuhe, die ich letzte Woche gekauft habe, sind ein bisschen zu eng. "
+        "Wir haben schon früher über dieses Thema gesprochen, aber noch keine Entscheidung getroffen."
+    ),
+    "fr": (
+        "Il fait très beau aujourd'hui, alors nous avons décidé de nous promener dans le parc. "
+        "Pendant que les enfants jouaient dans le jardin, ma mère préparait le dîner. "
+        "Je dois aller au travail tôt demain matin parce que la réunion commence à neuf heures. "
+        "Je te recommande vraiment de lire ce livre, il raconte une histoire très intéressante. "
+        "Paris est la capitale de la France et l'une des plus grandes villes d'Europe. "
+        "Pourriez-vous fermer la porte, s'il vous plaît? Il fait assez froid et il y a du vent dehors. "
+        "Notre professeur nous a expliqué l'importance de l'histoire et nous a donné des devoirs. "
+        "Après le dîner, nous allons au cinéma avec quelques amis. "
+        "Mon ordinateur est tombé en panne et j'ai perdu tous mes fichiers, c'est très triste. "
+        "Faire du sport régulièrement chaque jour est très bon pour notre santé. "
+        "Bonjour, comment allez-vous? Comment puis-je vous aider? Merci, je vais bien. "
+        "Notre entreprise a développé un nouveau produit et commencera à le vendre le mois prochain. "
+        "Mon frère et moi passerons les vacances d'été dans notre village au bord de la mer. "
+        "Les chaussures que j'ai achetées la semaine dernière sont un peu trop petites. "
+        "Nous avons déjà parlé de ce sujet mais nous n'avons pas encore pris de décision."
+    ),
+    "es": (
+        "Hoy hace muy buen tiempo, así que decidimos dar un paseo por el parque. "
+        "Mientras los niños jugaban en el jardín, mi madre estaba preparando la cena. "
+        "Mañana tengo que ir temprano al trabajo porque la reunión empieza a las nueve. "
+        "Te recomiendo de verdad leer este libro, tiene una historia muy interesante. "
+        "Madrid es la capital de España y una de las ciudades más grandes de Europa. "
+        "¿Podrías cerrar la puerta, por favor? Fuera hace bastante frío y mucho viento. "
+        "Nuestro profesor nos explicó la importancia de la historia y nos dio deberes. "
+        "Después de la cena vamos a ir al cine con algunos de nuestros amigos. "
+        "Mi ordenador se estropeó y perdí todos mis archivos, estoy muy triste. "
+        "Hacer deporte con regularidad todos los días es muy bueno para nuestra salud. "
+        "Hola, ¿cómo está usted? ¿En qué puedo ayudarle? Gracias, estoy bien. "
+        "Nuestra empresa ha desarrollado un nuevo producto y empezará a venderlo el próximo mes. "
+        "Mi hermano y yo pasaremos las vacaciones de verano en nuestro pueblo junto al mar. "
+        "Los zapatos que compré la semana pasada me quedan un poco pequeños, tengo que cambiarlos. "
+        "Ya hablamos de este tema antes, pero todavía no hemos tomado ninguna decisión."
+    ),
+    "it": (
+        "Oggi il tempo è molto bello, quindi abbiamo deciso di fare una passeggiata nel parco. "
+        "Mentre i bambini giocavano in giardino, mia madre preparava la cena. "
+        "Domani mattina devo andare presto al lavoro perché la riunione inizia alle nove. "
+        "Ti consiglio davvero di leggere questo libro, ha una storia molto interessante. "
+        "Roma è la capitale d'Italia ed è una delle città più antiche d'Europa. "
+        "Potresti chiudere la porta, per favore? Fuori fa piuttosto freddo e c'è vento. "
+        "Il nostro insegnante ci ha spiegato l'importanza della storia e ci ha dato i compiti. "
+        "Dopo cena andiamo al cinema con alcuni dei nostri amici. "
+        "Il mio computer si è rotto e ho perso tutti i miei file, sono molto triste. "
+        "Fare sport regolarmente ogni giorno fa molto bene alla nostra salute. "
+        "Ciao, come sta? Come posso aiutarla? Grazie, sto bene. "
+        "La nostra azienda ha sviluppato un nuovo prodotto e inizierà a venderlo il mese prossimo. "
+        "Mio fratello ed io passeremo le vacanze estive nel nostro paese vicino al mare. "
+        "Le scarpe che ho comprato la settimana scorsa sono un po' strette, devo cambiarle. "
+        "Abbiamo già parlato di questo argomento ma non abbiamo ancora preso una decisione."
+    ),
+    "ru": (
+        "Сегодня очень хорошая погода, поэтому мы решили прогуляться по парку. "
+        "Пока дети играли в саду, моя мама готовила ужин. "
+        "Завтра утром мне нужно рано идти на работу, потому что совещание начинается в девять. "
+        "Я очень советую тебе прочитать эту книгу, в ней очень интересная история. "
+        "Москва является столицей России и одним из крупнейших городов Европы. "
+        "Не могли бы вы закрыть дверь, пожалуйста? На улице довольно холодно и ветрено. "
+        "Наш учитель объяснил нам важность истории и дал домашнее задание. "
+        "После ужина мы пойдём в кино с нашими друзьями. "
+        "Мой компьютер сломался, и я потерял все свои файлы, мне очень грустно. "
+        "Регулярно заниматься спортом каждый день очень полезно для здоровья. "
+        "Здравствуйте, как у вас дела? Чем я могу вам помочь? Спасибо, всё хорошо. "
+        "Наша компания разработала новый продукт и начнёт продавать его в следующем месяце. "
+        "Мы с братом проведём летние каникулы в нашей деревне у моря."
+    ),
+    "zh-CN": (
+        "今天天气很好，所以我们决定去公园散步。"
+        "孩子们在花园里玩的时候，我妈妈正在做晚饭。"
+        "我明天早上要早点去上班，因为会议九点开始。"
+        "我真的推荐你读这本书，它有一个非常有趣的故事。"
+        "北京是中国的首都，也是世界上最大的城市之一。"
+        "请你把门关上好吗？外面很冷，风也很大。"
+        "我们的老师给我们讲了历史的重要性，还布置了作业。"
+        "晚饭以后我们和几个朋友一起去看电影。"
+        "我的电脑坏了，所有的文件都丢了，我很难过。"
+        "每天坚持锻炼身体对我们的健康非常有好处。"
+        "你好，你最近怎么样？我能为你做些什么？谢谢，我很好。"
+        "我们公司开发了一个新产品，下个月开始销售。"
+        "我和我哥哥今年夏天要去海边的村子度假。"
+        "我上个星期买的鞋子有点小，我需要去换一双。"
+        "这个问题我们以前讨论过，但是还没有做出决定。"
+    ),
+    "ja": (
+        "今日はとても天気がいいので、公園を散歩することにしました。"
+        "子供たちが庭で遊んでいる間、母は夕食を作っていました。"
+        "会議が九時に始まるので、明日の朝は早く仕事に行かなければなりません。"
+        "この本は本当におすすめです。とても面白い物語があります。"
+        "東京は日本の首都で、世界で最も大きな都市の一つです。"
+        "ドアを閉めていただけますか。外はかなり寒くて風が強いです。"
+        "先生は私たちに歴史の大切さを説明して、宿題を出しました。"
+        "夕食の後で、友達と一緒に映画を見に行きます。"
+        "パソコンが壊れて、ファイルを全部なくしてしまいました。とても悲しいです。"
+        "毎日運動をすることは健康にとてもいいです。"
+        "こんにちは、お元気ですか。何かお手伝いしましょうか。ありがとうございます、元気です。"
+        "私たちの会社は新しい製品を開発して、来月から販売を始めます。"
+        "兄と私は今年の夏休みに海の近くの村で過ごします。"
+        "先週買った靴が少しきついので、交換しなければなりません。"
+    ),
+    "ko": (
+        "오늘은 날씨가 정말 좋아서 공원에서 산책하기로 했습니다. "
+        "아이들이 정원에서 노는 동안 어머니는 저녁을 준비하고 계셨습니다. "
+        "회의가 아홉 시에 시작하기 때문에 내일 아침 일찍 출근해야 합니다. "
+        "이 책을 꼭 읽어 보라고 추천하고 싶어요. 이야기가 아주 재미있어요. "
+        "서울은 한국의 수도이며 세계에서 가장 큰 도시 중 하나입니다. "
+        "문 좀 닫아 주시겠어요? 밖이 꽤 춥고 바람이 많이 불어요. "
+        "선생님께서 우리에게 역사의 중요성을 설명해 주시고 숙제를 내 주셨습니다. "
+        "저녁을 먹은 후에 친구들과 함께 영화를 보러 갈 거예요. "
+        "컴퓨터가 고장 나서 파일을 모두 잃어버렸어요. 너무 슬퍼요. "
+        "매일 규칙적으로 운동하는 것은 건강에 아주 좋습니다. "
+        "안녕하세요, 어떻게 지내세요? 무엇을 도와드릴까요? 감사합니다, 잘 지내요. "
+        "우리 회사는 새로운 제품을 개발했고 다음 달부터 판매를 시작합니다. "
+        "형과 저는 이번 여름 방학을 바닷가 마을에서 보낼 거예요."
+    ),
+    "ar": (
+        "الطقس جميل جدا اليوم، لذلك قررنا أن نتمشى في الحديقة. "
+        "بينما كان الأطفال يلعبون في الحديقة، كانت أمي تحضر العشاء. "
+        "يجب أن أذهب إلى العمل مبكرا صباح الغد لأن الاجتماع يبدأ في الساعة التاسعة. "
+        "أنصحك حقا بقراءة هذا الكتاب، فهو يحتوي على قصة ممتعة جدا. "
+        "القاهرة هي عاصمة مصر وواحدة من أكبر المدن في العالم العربي. "
+        "هل يمكنك إغلاق الباب من فضلك؟ الجو بارد جدا والرياح قوية في الخارج. "
+        "شرح لنا المعلم أهمية التاريخ وأعطانا واجبا منزليا. "
+        "بعد العشاء سنذهب إلى السينما مع بعض أصدقائنا. "
+        "تعطل حاسوبي وفقدت جميع ملفاتي، وأنا حزين جدا. "
+        "ممارسة الرياضة بانتظام كل يوم مفيدة جدا لصحتنا. "
+        "مرحبا، كيف حالك؟ كيف يمكنني مساعدتك؟ شكرا، أنا بخير. "
+        "طورت شركتنا منتجا جديدا وستبدأ في بيعه الشهر القادم. "
+        "سأقضي أنا وأخي العطلة الصيفية في قريتنا بجانب البحر."
+    ),
+}
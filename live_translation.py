@@ -0,0 +1,151 @@
+import difflib
+import re
+
+from translation_pipeline import AUTO_LANGUAGE
+from translation_scheduler import INTERACTIVE
+
+# Cümle sonu noktalaması (ardından gelen tırnak/parantezle) ve sonrasındaki boşluk ya da satır sonu
+SENTENCE_BREAK = re.compile(r'((?<=[.!?…。！？])["\'»”’)\]]*\s+|\s*\n\s*)')
+
+
+def split_sentences(text):
+    """Metni (cümle, ardındaki ayırıcı) çiftlerine ayır; birleştirince metnin aynısı çıkar"""
+    parts = SENTENCE_BREAK.split(text)
+    parts.append("")
+    return list(zip(parts[0::2], parts[1::2]))
+
+
+class LiveSession:
+    """Yazarken canlı çeviri: yalnızca değişen cümleleri çevirir
+
+    Her güncellemede metin cümlelere ayrılır ve önceki sürümle cümle
+    düzeyinde karşılaştırılır (difflib). Çevirisi bilinen cümleler yeniden
+    gönderilmez; yeni ve değişen cümleler tek bir etkileşimli işte birlikte
+    çevrilir (hat bunları toplu isteklere koyar). Cümleleri artık metinde
+    olmayan işler iptal edilir. Değişen bir cümlenin çevirisi gelene kadar
+    aynı yerde önceki çevirisi gösterilir.
+
+    update ve apply arayüz thread'inden çağrılmalıdır; on_result(iş kimliği,
+    {cümle: çeviri} veya None) iş bittiğinde zamanlayıcı thread'inden
+    çağrılır ve sonucu arayüze (ör. olay kuyruğuyla) iletmelidir.
+    """
+
+    def __init__(self, scheduler, pipeline, on_result):
+        self.scheduler = scheduler
+        self.pipeline = pipeline
+        self.on_result = on_result
+        self.pair = None
+        self.layout = []
+        # Ekranda cümle başına gösterilen metin (değişen cümlelerde yer tutucu olarak kullanılır)
+        self.shown = []
+        self.placeholders = {}
+        self.translations = {}
+        # iş kimliği -> (iş, cümleler); cümle -> onu çeviren işin kimliği
+        self.jobs = {}
+        self.waiting = {}
+
+    def update(self, text, src_lang, dest_lang):
+        """Yeni metni işle; çevrilmek üzere gönderilen cümle sayısını döndür"""
+        pair = (src_lang, dest_lang)
+        if pair != self.pair:
+            # Dil değişti: eski çeviriler ve bekleyen işler geçersiz
+            self.cancel()
+            self.translations.clear()
+            self.layout = []
+            self.shown = []
+            self.pair = pair
+
+        old = [sentence for sentence, _ in self.layout]
+        layout = split_sentences(text)
+        new = [sentence for sentence, _ in layout]
+        current = set(new)
+
+        # Yerinde değiştirilen cümleler, yeni çevirileri gelene kadar eski çevirilerini gösterir
+        placeholders = {}
+        matcher = difflib.SequenceMatcher(None, old, new, autojunk=False)
+        for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+            if tag == "replace":
+                for k in range(min(i2 - i1, j2 - j1)):
+                    if i1 + k < len(self.shown):
+                        placeholders[j1 + k] = self.shown[i1 + k]
+        self.layout = layout
+        self.placeholders = placeholders
+
+        # Cümlelerinin hiçbiri artık metinde olmayan işler boşuna çalışmasın
+        for job_id, (job, sentences) in list(self.jobs.items()):
+            if not sentences & current:
+                job.cancel()
+                self._forget(job_id)
+
+        self.translations = {sentence: translation for sentence, translation in self.translations.items()
+                             if sentence in current}
+
+        needed = []
+        for sentence in new:
+            if (sentence.strip() and sentence not in self.translations
+                    and sentence not in self.waiting and sentence not in needed):
+                needed.append(sentence)
+        if needed:
+            job = self.scheduler.submit(
+                lambda job: self._translate(job, needed, src_lang, dest_lang),
+                priority=INTERACTIVE,
+                on_done=lambda job: self.on_result(job.id, job.result)
+            )
+            self.jobs[job.id] = (job, set(needed))
+            for sentence in needed:
+                self.waiting[sentence] = job.id
+        return len(needed)
+
+    def _translate(self, job, sentences, src_lang, dest_lang):
+        # Zamanlayıcı thread'inde çalışır. Cümleler yazılırken yarım haldedir:
+        # çevirileri önbelleğe ve çeviri belleğine yazılmaz, yoksa cümle
+        # tamamlanınca yarım halinin çevirisi geri gelirdi
+        kwargs = {"cancel_event": job.cancel_event, "priority": job.priority,
+                  "remember": False, "cache_writes": False}
+        if src_lang == AUTO_LANGUAGE:
+            translations, _ = self.pipeline.translate_by_language(sentences, dest_lang, **kwargs)
+        else:
+            translations = self.pipeline.translate_many(sentences, src_lang, dest_lang, **kwargs)
+        return dict(zip(sentences, translations))
+
+    def apply(self, job_id, translations):
+        """Biten işin sonuçlarını kaydet; ekranın yenilenmesi gerekiyorsa True döndür"""
+        if job_id not in self.jobs:
+            # İptal edilmiş veya dil değişmeden önceki iş
+            return False
+        self._forget(job_id)
+        if not translations:
+            return False
+        current = {sentence for sentence, _ in self.layout}
+        changed = False
+        for sentence, translation in translations.items():
+            if sentence in current and not translation.startswith("[Çeviri hatası:"):
+                self.translations[sentence] = translation
+                changed = True
+        return changed
+
+    def _forget(self, job_id):
+        _, sentences = self.jobs.pop(job_id)
+        for sentence in sentences:
+            if self.waiting.get(sentence) == job_id:
+                del self.waiting[sentence]
+
+    def render(self):
+        """Çevrilen cümleleri özgün ayırıcılarla birleştir; çevirisi gelmeyenler yer tutucuyla gösterilir"""
+        self.shown = []
+        for j, (sentence, _) in enumerate(self.layout):
+            translation = self.translations.get(sentence)
+            if translation is None:
+                translation = self.placeholders.get(j, sentence)
+            self.shown.append(translation)
+        return "".join(shown + separator for shown, (_, separator) in zip(self.shown, self.layout))
+
+    def pending(self):
+        """Çevirisi beklenen cümle sayısı"""
+        return len(self.waiting)
+
+    def cancel(self):
+        for job, _ in self.jobs.values():
+            job.cancel()
+        self.jobs.clear()
+        self.waiting.clear()
@@ -0,0 +1,181 @@
+import bisect
+import json
+import threading
+import time
+from contextlib import contextmanager
+
+# Gecikme histogramları için varsayılan kova sınırları (saniye)
+LATENCY_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+def escape_label(value):
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def format_labels(labels):
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{key}="{escape_label(value)}"' for key, value in labels) + "}"
+
+
+class Histogram:
+    """Sabit kovalı gecikme histogramı (Prometheus "le" kovalarıyla uyumlu)"""
+
+    def __init__(self, buckets=LATENCY_BUCKETS):
+        self.buckets = tuple(buckets)
+        # Son kova sınırsızdır (+Inf)
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value):
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+
+    def quantile(self, fraction):
+        """Kovalar içinde doğrusal aradeğerlemeyle yaklaşık yüzdelik"""
+        if not self.count:
+            return None
+        rank = fraction * self.count
+        seen = 0
+        for i, count in enumerate(self.counts):
+            if count and seen + count >= rank:
+                lower = self.buckets[i - 1] if i > 0 else 0.0
+                if i == len(self.buckets):
+                    return lower
+                return lower + (self.buckets[i] - lower) * (rank - seen) / count
+            seen += count
+        return self.buckets[-1]
+
+    def snapshot(self):
+        return {
+            "count": self.count,
+            "sum": self.sum,
+            "mean": self.sum / self.count if self.count else None,
+            "p50": self.quantile(0.5),
+            "p95": self.quantile(0.95),
+            "p99": self.quantile(0.99),
+            "buckets": dict(zip([str(bound) for bound in self.buckets] + ["+Inf"], self.counts))
+        }
+
+
+class MetricsRegistry:
+    """Sayaçları ve gecikme histogramlarını tutan iş parçacığı güvenli kayıt
+
+    Metrikler ad ve etiketlerle ({"backend": "LibreTranslate"} gibi)
+    tanımlanır ve ilk kullanımda oluşturulur. Değerler JSON (snapshot, dump)
+    veya Prometheus metin biçiminde (to_prometheus) dışa aktarılır.
+    """
+
+    def __init__(self, prefix="translator_"):
+        self.prefix = prefix
+        self.counters = {}
+        self.histograms = {}
+        self.started = time.time()
+        self.lock = threading.Lock()
+
+    @staticmethod
+    def _key(name, labels):
+        return name, tuple(sorted(labels.items()))
+
+    def increment(self, name, amount=1, **labels):
+        key = self._key(name, labels)
+        with self.lock:
+            self.counters[key] = self.counters.get(key, 0) + amount
+
+    def observe(self, name, value, **labels):
+        key = self._key(name, labels)
+        with self.lock:
+            histogram = self.histograms.get(key)
+            if histogram is None:
+                histogram = self.histograms[key] = Histogram()
+            histogram.observe(value)
+
+    @contextmanager
+    def timer(self, name, **labels):
+        """with bloğunun süresini name histogramına ekle"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(name, time.perf_counter() - start, **labels)
+
+    def counter(self, name, **labels):
+        with self.lock:
+            return self.counters.get(self._key(name, labels), 0)
+
+    def snapshot(self):
+        """Tüm metrikleri JSON'a uygun bir sözlük olarak döndür"""
+        with self.lock:
+            counters = [{"name": name, "labels": dict(labels), "value": value}
+                        for (name, labels), value in sorted(self.counters.items())]
+            histograms = [dict({"name": name, "labels": dict(labels)}, **histogram.snapshot())
+                          for (name, labels), histogram in sorted(self.histograms.items())]
+        return {
+            "started": self.started,
+            "uptime": time.time() - self.started,
+            "counters": counters,
+            "histograms": histograms
+        }
+
+    def to_prometheus(self):
+        """Prometheus metin biçimi (text/plain; version=0.0.4)"""
+        lines = []
+        with self.lock:
+            declared = set()
+            for (name, labels), value in sorted(self.counters.items()):
+                full = self.prefix + name
+                if full not in declared:
+                    lines.append(f"# TYPE {full} counter")
+                    declared.add(full)
+                lines.append(f"{full}{format_labels(labels)} {value}")
+            for (name, labels), histogram in sorted(self.histograms.items()):
+                full = self.prefix + name
+                if full not in declared:
+                    lines.append(f"# TYPE {full} histogram")
+                    declared.add(full)
+                cumulative = 0
+                for bound, count in zip(list(histogram.buckets) + ["+Inf"], histogram.counts):
+                    cumulative += count
+                    bucket_labels = format_labels(labels + (("le", bound),))
+                    lines.append(f"{full}_bucket{bucket_labels} {cumulative}")
+                lines.append(f"{full}_sum{format_labels(labels)} {histogram.sum}")
+                lines.append(f"{full}_count{format_labels(labels)} {histogram.count}")
+        return "\n".join(lines) + "\n"
+
+    def dump(self, path):
+        """Anlık görüntüyü JSON dosyasına yaz"""
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.snapshot(), f, ensure_ascii=False, indent=2)
+
+    def report(self):
+        """Tanılama paneli ve komut satırı için okunabilir özet"""
+        snapshot = self.snapshot()
+
+        def ms(value):
+            return "-" if value is None else f"{value * 1000:.1f}"
+
+        def title(metric):
+            return metric["name"] + "".join(f" {key}={value}" for key, value in metric["labels"].items())
+
+        histograms = [(title(histogram), histogram) for histogram in snapshot["histograms"]]
+        counters = [(title(counter), counter["value"]) for counter in snapshot["counters"]]
+        # Ad sütunu en uzun metrik adına göre genişler
+        width = max([len(name) for name, _ in histograms + counters] + [20]) + 2
+
+        lines = [f"Çalışma süresi: {snapshot['uptime']:.0f} sn", "",
+                 f"{'süre':<{width}}{'adet':>8}{'ort ms':>9}{'p50':>9}{'p95':>9}{'p99':>9}"]
+        for name, histogram in histograms:
+            lines.append(f"{name:<{width}}{histogram['count']:>8}{ms(histogram['mean']):>9}{ms(histogram['p50']):>9}"
+                         f"{ms(histogram['p95']):>9}{ms(histogram['p99']):>9}")
+        lines += ["", f"{'sayaç':<{width}}{'değer':>12}"]
+        for name, value in counters:
+            lines.append(f"{name:<{width}}{value:>12,}")
+        return "\n".join(lines)
+
+    def reset(self):
+        with self.lock:
+            self.counters.clear()
+            self.histograms.clear()
+            self.started = time.time()
@@ -0,0 +1,350 @@
+import argparse
+import gzip
+import mmap
+import os
+import re
+import struct
+import sys
+import threading
+
+# Sözlük dosyalarının bulunduğu klasör: <kaynak>-<hedef>.lex, .tsv veya .tsv.gz
+DICTIONARY_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "dictionaries")
+
+# Metni bir kez ve önceden derlenmiş tek bir ifadeyle böl: tek indeksler kelime,
+# çift indeksler aradaki noktalama/boşluk olur
+WORDS = re.compile(r"(\w+)")
+
+# Trie düğümünde çevirinin saklandığı anahtar (kelimelerle çakışmaz)
+VALUE = "\0"
+
+# Derlenmiş sözlük (.lex) dosya düzeni:
+#   başlık:   sihirli bayt dizisi + girdi sayısı
+#   tablo:    (girdi sayısı + 1) satır; her satır anahtarın ve çevirinin başladığı
+#             konum (2 x 8 bayt). Son satır dosya sonunu gösterir.
+#   kayıtlar: anahtara göre (UTF-8 bayt sırası) sıralı "anahtar\tçeviri\n" satırları
+LEXICON_MAGIC = b"TRLEX001"
+LEXICON_HEADER = struct.Struct("<8sQ")
+LEXICON_ROW = struct.Struct("<QQ")
+
+
+def fold_case(word, lang):
+    """Dile duyarlı küçük harfe çevirme (Türkçe'de I -> ı, İ -> i)"""
+    if lang == "tr":
+        word = word.replace("I", "ı").replace("İ", "i")
+    return word.lower()
+
+
+def normalize_key(source, lang):
+    # Sözlük anahtarı: küçük harfli kelimeler tek boşlukla birleştirilir
+    return " ".join(WORDS.split(fold_case(source, lang))[1::2])
+
+
+def read_entries(path):
+    """Sekmeyle ayrılmış "kaynak<TAB>hedef" satırlarını (kaynak, hedef) olarak üret"""
+    opener = gzip.open if path.endswith(".gz") else open
+    with opener(path, "rt", encoding="utf-8") as file:
+        for line in file:
+            line = line.rstrip("\n")
+            if not line or line.startswith("#"):
+                continue
+            source, _, target = line.partition("\t")
+            if target:
+                yield source, target
+
+
+class PhraseDictionary:
+    """Tek yönlü, çok kelimeli girdileri destekleyen sözlük (kelime trie'si)
+
+    Her girdi kelimelerine ayrılıp iç içe sözlüklerden oluşan bir trie'ye
+    eklenir; çeviri sırasında her konumda en uzun eşleşen ifade bulunur.
+    """
+
+    def __init__(self, source_lang, entries=(), cache_size=65536):
+        self.source_lang = source_lang
+        self.root = {}
+        self.size = 0
+        # kelime -> (tek kelimelik çeviri veya None, ifade olarak devamı var mı)
+        self.cache_size = cache_size
+        self.first_steps = {}
+        for source, target in entries:
+            self.add(source, target)
+
+    def add(self, source, target):
+        node = self.root
+        for word in WORDS.split(fold_case(source, self.source_lang))[1::2]:
+            node = node.setdefault(word, {})
+        if VALUE not in node:
+            self.size += 1
+        node[VALUE] = target
+        self.first_steps.clear()
+
+    def __len__(self):
+        return self.size
+
+    def first_step(self, word):
+        """Kelimenin (tek başına çevirisi veya None, devamı var mı) bilgisini döndür ve önbelleğe al"""
+        node = self.root.get(word)
+        if node is None:
+            step = (None, False)
+        else:
+            step = (node.get(VALUE), len(node) > (VALUE in node))
+        if len(self.first_steps) >= self.cache_size:
+            self.first_steps.clear()
+        self.first_steps[word] = step
+        return step
+
+    def longest_match(self, words, start):
+        """words[start:] başında en uzun eşleşen ifadeyi bul; (bitiş, çeviri) veya None"""
+        node = self.root.get(words[start])
+        if node is None:
+            return None
+        match = (start + 1, node[VALUE]) if VALUE in node else None
+        for i in range(start + 1, len(words)):
+            node = node.get(words[i])
+            if node is None:
+                break
+            if VALUE in node:
+                match = (i + 1, node[VALUE])
+        return match
+
+    @classmethod
+    def load(cls, path, source_lang):
+        """Sekmeyle ayrılmış metin sözlüğünü belleğe yükle (küçük sözlükler için)"""
+        return cls(source_lang, read_entries(path))
+
+
+def build_lexicon(entries, path, source_lang):
+    """(kaynak, hedef) çiftlerinden bellek eşlemeli .lex sözlüğü derle
+
+    Aynı anahtar birden fazla kez gelirse sonuncusu geçerlidir.
+    """
+    records = {}
+    for source, target in entries:
+        key = normalize_key(source, source_lang)
+        if key:
+            records[key.encode("utf-8")] = target.replace("\t", " ").replace("\n", " ").encode("utf-8")
+
+    keys = sorted(records)
+    offset = LEXICON_HEADER.size + LEXICON_ROW.size * (len(keys) + 1)
+    rows = []
+    for key in keys:
+        rows.append(LEXICON_ROW.pack(offset, offset + len(key) + 1))
+        offset += len(key) + len(records[key]) + 2
+    rows.append(LEXICON_ROW.pack(offset, offset))
+
+    with open(path, "wb") as file:
+        file.write(LEXICON_HEADER.pack(LEXICON_MAGIC, len(keys)))
+        file.write(b"".join(rows))
+        for key in keys:
+            file.write(key + b"\t" + records[key] + b"\n")
+    return len(keys)
+
+
+class MappedLexicon:
+    """Diskte kalan, bellek eşlemeli sıralı sözlük
+
+    Dosya mmap ile açılır ve ikili aramayla yerinde taranır; girdiler Python
+    nesnesine dönüştürülmez. Yalnızca erişilen sayfalar belleğe girer, bu
+    yüzden milyonlarca girdilik sözlükler bile açılışta neredeyse hiç bellek
+    ve süre harcamaz.
+    """
+
+    def __init__(self, path, source_lang, cache_size=65536):
+        self.source_lang = source_lang
+        self.file = open(path, "rb")
+        self.data = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, self.size = LEXICON_HEADER.unpack_from(self.data, 0)
+        if magic != LEXICON_MAGIC:
+            self.close()
+            raise ValueError(f"Geçersiz sözlük dosyası: {path}")
+        # Sık geçen kelimeler için ilk adımın sonucu (metinlerde aynı kelimeler tekrar eder):
+        # kelime -> (tek kelimelik çeviri veya None, devamı var mı, sonraki konum)
+        self.cache_size = cache_size
+        self.first_steps = {}
+
+    def __len__(self):
+        return self.size
+
+    def _row(self, i):
+        return LEXICON_ROW.unpack_from(self.data, LEXICON_HEADER.size + LEXICON_ROW.size * i)
+
+    def _key(self, i):
+        key_start, value_start = self._row(i)
+        return self.data[key_start:value_start - 1]
+
+    def _value(self, i):
+        value_start = self._row(i)[1]
+        return self.data[value_start:self._row(i + 1)[0] - 1].decode("utf-8")
+
+    def _lower_bound(self, key, low=0):
+        # İkili arama; sık çağrıldığı için satır okuma burada satır içi yapılır
+        data = self.data
+        unpack = LEXICON_ROW.unpack_from
+        header, row = LEXICON_HEADER.size, LEXICON_ROW.size
+        high = self.size
+        while low < high:
+            middle = (low + high) // 2
+            key_start, value_start = unpack(data, header + row * middle)
+            if data[key_start:value_start - 1] < key:
+                low = middle + 1
+            else:
+                high = middle
+        return low
+
+    def _step(self, key, low):
+        """key'i low konumundan itibaren ara; (sonraki konum, çeviri veya None, devamı var mı)
+
+        Anahtarlar bayt sırasında sıralı olduğundan bir ifadenin devamları
+        ("how" -> "how are", "how are you") ifadenin hemen ardından gelir.
+        """
+        low = self._lower_bound(key, low)
+        value = None
+        if low < self.size and self._key(low) == key:
+            value = self._value(low)
+            low += 1
+        continues = low < self.size and self._key(low).startswith(key + b" ")
+        return low, value, continues
+
+    def get(self, key):
+        return self._step(key.encode("utf-8"), 0)[1]
+
+    def first_step(self, word):
+        """Kelimenin (tek başına çevirisi veya None, devamı var mı, sonraki konum) bilgisini önbelleğe al"""
+        low, value, continues = self._step(word.encode("utf-8"), 0)
+        step = (value, continues, low)
+        if len(self.first_steps) >= self.cache_size:
+            self.first_steps.clear()
+        self.first_steps[word] = step
+        return step
+
+    def longest_match(self, words, start):
+        """words[start:] başında en uzun eşleşen ifadeyi bul; (bitiş, çeviri) veya None"""
+        word = words[start]
+        key = word.encode("utf-8")
+        step = self.first_steps.get(word)
+        if step is None:
+            step = self.first_step(word)
+
+        value, continues, low = step
+        match = (start + 1, value) if value is not None else None
+        i = start + 1
+        while continues and i < len(words):
+            key = key + b" " + words[i].encode("utf-8")
+            low, value, continues = self._step(key, low)
+            i += 1
+            if value is not None:
+                match = (i, value)
+        return match
+
+    def close(self):
+        self.data.close()
+        self.file.close()
+
+
+class OfflineTranslator:
+    """Yön başına sözlüklerle çevrimdışı çeviri
+
+    Sözlükler ilk ihtiyaç duyulduğunda açılır: derlenmiş .lex dosyaları
+    bellek eşlemeli olarak yerinde aranır, .tsv dosyaları (küçük, elle
+    düzenlenen sözlükler) belleğe yüklenir. Metin tek bir
+    derlenmiş ifadeyle parçalanır; noktalama ve boşluklar korunur, kelimeler
+    en uzun ifade eşleşmesiyle çevrilir, sözlükte olmayanlar olduğu gibi kalır.
+    """
+
+    def __init__(self, directory=DICTIONARY_DIR):
+        self.directory = directory
+        self.dictionaries = {}
+        self.lock = threading.Lock()
+
+    def dictionary(self, src_lang, dest_lang):
+        key = (src_lang, dest_lang)
+        with self.lock:
+            if key not in self.dictionaries:
+                self.dictionaries[key] = self._load(src_lang, dest_lang)
+            return self.dictionaries[key]
+
+    def _load(self, src_lang, dest_lang):
+        base = os.path.join(self.directory, f"{src_lang}-{dest_lang}")
+        if os.path.exists(base + ".lex"):
+            return MappedLexicon(base + ".lex", src_lang)
+        for path in (base + ".tsv", base + ".tsv.gz"):
+            if os.path.exists(path):
+                return PhraseDictionary.load(path, src_lang)
+        return None
+
+    def translate(self, text, src_lang, dest_lang):
+        dictionary = self.dictionary(src_lang, dest_lang)
+        if dictionary is None:
+            return text
+
+        tokens = WORDS.split(text)
+        # Kelimeler tek seferde küçültülür (metin ikinci kez bölünmez); nadir durumlarda
+        # (ör. "İ" Türkçe dışı dillerde) kelime sayısı değişirse kelime kelime küçült
+        words = fold_case("\0".join(tokens[1::2]), src_lang).split("\0")
+        if len(words) * 2 + 1 != len(tokens):
+            words = [fold_case(word, src_lang) for word in tokens[1::2]]
+
+        output = []
+        last = 0
+        w = 0
+        count = len(words)
+        longest_match = dictionary.longest_match
+        # Hızlı yol: ifade devamı olmayan kelimeler önbellekteki ilk adımla tek aramada
+        # çevrilir; en uzun eşleşme yalnızca bir ifadenin başı olabilecek kelimelerde aranır
+        first_steps = dictionary.first_steps
+        first_step = dictionary.first_step
+        while w < count:
+            step = first_steps.get(words[w])
+            if step is None:
+                step = first_step(words[w])
+            if step[1]:
+                match = longest_match(words, w)
+            elif step[0] is not None:
+                match = (w + 1, step[0])
+            else:
+                match = None
+            if match is None:
+                w += 1
+                continue
+
+            # w. kelime tokens[2w+1] konumundadır
+            end, translation = match
+            output.extend(tokens[last:2 * w + 1])
+            # Orijinal kelime büyük harfle başlıyorsa çeviride de uygula
+            if translation and tokens[2 * w + 1][0].isupper():
+                translation = translation[0].upper() + translation[1:]
+            output.append(translation)
+            last = 2 * end
+            w = end
+
+        output.extend(tokens[last:])
+        return "".join(output)
+
+    def close(self):
+        with self.lock:
+            for dictionary in self.dictionaries.values():
+                if isinstance(dictionary, MappedLexicon):
+                    dictionary.close()
+            self.dictionaries = {}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Sekmeyle ayrılmış sözlüğü bellek eşlemeli .lex biçimine derle")
+    parser.add_argument("source", help="kaynak sözlük (.tsv veya .tsv.gz)")
+    parser.add_argument("output", nargs="?", help="çıktı dosyası (varsayılan: aynı ad, .lex uzantısı)")
+    parser.add_argument("-l", "--lang", help="kaynak dil (varsayılan: dosya adından, ör. tr-en.tsv -> tr)")
+    args = parser.parse_args(argv)
+
+    name = os.path.basename(args.source)
+    base = name[:-len(".gz")] if name.endswith(".gz") else name
+    base = os.path.splitext(base)[0]
+    output = args.output or os.path.join(os.path.dirname(args.source), base + ".lex")
+    lang = args.lang or base.split("-")[0]
+
+    count = build_lexicon(read_entries(args.source), output, lang)
+    print(f"{count} girdi -> {output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
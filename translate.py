@@ -0,0 +1,104 @@
+"""Komut satırından toplu çeviri
+
+Dosyaları veya standart girdiyi satır satır çeviri hattından geçirir ve
+çıktıyı parça parça yazar. tkinter veya PIL içe aktarmaz, sunucularda
+çalışabilir.
+
+Örnekler:
+    python translate.py -s tr -t en metin.txt
+    python translate.py -s auto -t en karisik.txt
+    cat metin.txt | python translate.py -s en -t tr -o ceviri.txt
+    python translate.py --metrics metrikler.json metin.txt
+"""
+import argparse
+import sys
+
+from translation_cache import TranslationCache
+from translation_pipeline import TranslationPipeline, SUPPORTED_LANGUAGES, AUTO_LANGUAGE
+from translation_memory import TranslationMemory
+
+
+def read_batches(stream, batch_size):
+    batch = []
+    for line in stream:
+        batch.append(line)
+        if len(batch) >= batch_size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def translate_stream(pipeline, stream, output, src_lang, dest_lang, batch_size):
+    for batch in read_batches(stream, batch_size):
+        # Boş satırlar olduğu gibi yazılır, ağa gönderilmez
+        bodies = [line.rstrip("\r\n") for line in batch]
+        to_translate = [i for i, body in enumerate(bodies) if body.strip()]
+        segments = [bodies[i] for i in to_translate]
+        if src_lang == AUTO_LANGUAGE:
+            # Karışık dilli girdi: satırlar dillerine göre gruplanıp çevrilir
+            translations, _ = pipeline.translate_by_language(segments, dest_lang)
+        else:
+            translations = pipeline.translate_many(segments, src_lang, dest_lang)
+
+        translated = dict(zip(to_translate, translations))
+        for i, line in enumerate(batch):
+            newline = line[len(bodies[i]):]
+            output.write(translated.get(i, bodies[i]) + newline)
+        output.flush()
+
+
+def main(argv=None):
+    codes = sorted(SUPPORTED_LANGUAGES.values())
+    parser = argparse.ArgumentParser(description="Dosyaları veya standart girdiyi satır satır çevir")
+    parser.add_argument("files", nargs="*", help="çevrilecek dosyalar (verilmezse standart girdi)")
+    parser.add_argument("-s", "--source", default="tr", choices=codes + [AUTO_LANGUAGE],
+                        help="kaynak dil ('auto': her satırın dili ayrı algılanır)")
+    parser.add_argument("-t", "--target", default="en", choices=codes, help="hedef dil")
+    parser.add_argument("-o", "--output", help="çıktı dosyası (varsayılan: standart çıktı)")
+    parser.add_argument("--cache", default="translation_cache.db", help="önbellek dosyası")
+    parser.add_argument("--no-cache", action="store_true", help="kalıcı önbelleği kullanma")
+    parser.add_argument("--workers", type=int, default=4, help="eş zamanlı istek sayısı")
+    parser.add_argument("--rps", type=float, default=2.0, help="saniyedeki istek bütçesi")
+    parser.add_argument("--similarity", type=float, default=1.0,
+                        help="çeviri belleğinden benzer cümle kullanma eşiği "
+                             "(varsayılan 1.0: yalnızca birebir; ör. 0.9 bulanık eşleşmeyi açar)")
+    parser.add_argument("--batch", type=int, default=None,
+                        help="birlikte çevrilen satır sayısı (etkileşimli girdide 1)")
+    parser.add_argument("--metrics", metavar="DOSYA",
+                        help="çıkışta aşama süreleri ve arka uç sayaçlarını bu JSON dosyasına yaz")
+    args = parser.parse_args(argv)
+
+    batch_size = args.batch
+    if batch_size is None:
+        batch_size = 1 if not args.files and sys.stdin.isatty() else 16
+
+    pipeline = TranslationPipeline(
+        cache=TranslationCache(":memory:" if args.no_cache else args.cache),
+        max_workers=args.workers,
+        requests_per_second=args.rps,
+        memory=TranslationMemory(threshold=args.similarity),
+        on_status=lambda message: print(message, file=sys.stderr)
+    )
+
+    output = open(args.output, "w", encoding="utf-8") if args.output else sys.stdout
+    try:
+        if args.files:
+            for path in args.files:
+                with open(path, "r", encoding="utf-8") as stream:
+                    translate_stream(pipeline, stream, output, args.source, args.target, batch_size)
+        else:
+            translate_stream(pipeline, sys.stdin, output, args.source, args.target, batch_size)
+    except KeyboardInterrupt:
+        return 130
+    finally:
+        if output is not sys.stdout:
+            output.close()
+        pipeline.close()
+        if args.metrics:
+            pipeline.metrics.dump(args.metrics)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
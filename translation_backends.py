@@ -0,0 +1,91 @@
+import re
+import threading
+
+import requests
+from requests.adapters import HTTPAdapter
+from deep_translator import GoogleTranslator
+
+from backend_router import MalformedBatch
+
+LIBRE_URL = "https://translate.argosopentech.com/translate"
+
+# Google'a toplu gönderimde parçalar arasına konan numaralı işaret ("\n[[1]]\n")
+SEGMENT_MARK = "\n[[{}]]\n"
+SEGMENT_SPLIT = re.compile(r"\s*\[\[(\d+)\]\]\s*")
+# Toplu isteklerde parça başına eklenen en fazla karakter (iki basamaklı işaret)
+BATCH_OVERHEAD = len(SEGMENT_MARK.format(99))
+
+
+class BackendClients:
+    """Çeviri arka uçları için yeniden kullanılabilir istemciler
+
+    LibreTranslate çağrıları keep-alive bağlantı havuzu olan tek bir
+    requests.Session üzerinden gider. GoogleTranslator örnekleri her iş
+    parçacığı için dil çifti başına bir kez oluşturulur (nesne çağrılar
+    arasında durum tuttuğu için iş parçacıkları arasında paylaşılmaz).
+    Her arka uç için eş zamanlı bağlantı sayısı sınırlıdır.
+    """
+
+    def __init__(self, libre_url=LIBRE_URL, libre_connections=4, google_connections=4, timeout=5):
+        self.libre_url = libre_url
+        self.timeout = timeout
+
+        self.session = requests.Session()
+        # pool_block=True: havuz doluyken yeni bağlantı açmak yerine bekle
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=libre_connections, pool_block=True)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+        self.google_slots = threading.BoundedSemaphore(google_connections)
+        self.local = threading.local()
+
+    def google(self, source, target):
+        translators = getattr(self.local, "translators", None)
+        if translators is None:
+            translators = self.local.translators = {}
+        key = (source, target)
+        if key not in translators:
+            translators[key] = GoogleTranslator(source=source, target=target)
+        return translators[key]
+
+    def translate_google(self, text, source, target):
+        with self.google_slots:
+            return self.google(source, target).translate(text)
+
+    def translate_google_batch(self, texts, source, target):
+        # Parçalar numaralı işaretlerle tek metinde birleştirilir; çeviride
+        # işaretler sırasıyla bulunamazsa yanıt bozuk sayılır
+        if any(SEGMENT_SPLIT.search(text) for text in texts):
+            raise MalformedBatch("parça işaret dizisini içeriyor")
+        packed = texts[0] + "".join(SEGMENT_MARK.format(i) + text for i, text in enumerate(texts[1:], 1))
+        parts = SEGMENT_SPLIT.split(self.translate_google(packed, source, target) or "")
+        if parts[1::2] != [str(i) for i in range(1, len(texts))]:
+            raise MalformedBatch("parça işaretleri çeviride kayboldu")
+        return [part.strip() for part in parts[0::2]]
+
+    def detect_google(self, text):
+        with self.google_slots:
+            return self.google("auto", "en").detect(text)
+
+    def translate_libre(self, text, source, target):
+        data = {
+            "q": text,
+            "source": source,
+            "target": target
+        }
+        response = self.session.post(self.libre_url, json=data, timeout=self.timeout)
+        response.raise_for_status()  # HTTP hataları için
+        return response.json()["translatedText"]
+
+    def translate_libre_batch(self, texts, source, target):
+        # LibreTranslate "q" için dizi kabul eder ve çevirileri aynı sırayla döndürür
+        response = self.session.post(self.libre_url, json={"q": list(texts), "source": source, "target": target},
+                                     timeout=self.timeout)
+        response.raise_for_status()
+        translated = response.json().get("translatedText")
+        if not isinstance(translated, list):
+            raise MalformedBatch("translatedText dizi değil")
+        return translated
+
+    def close(self):
+        self.session.close()
@@ -0,0 +1,122 @@
+import hashlib
+import sqlite3
+import threading
+
+
+class TranslationCache:
+    """Diskte kalıcı, boyut sınırlı LRU çeviri önbelleği (SQLite)
+
+    Anahtarlar kaynak metnin kendisi yerine SHA-256 özetidir; böylece uzun
+    metinler bellekte ve diskte iki kez tutulmaz.
+    """
+
+    def __init__(self, path="translation_cache.db", max_entries=5000, max_bytes=50 * 1024 * 1024):
+        self.path = path
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+
+        # Sayaçlar
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        self.lock = threading.Lock()
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS cache ("
+            " key TEXT PRIMARY KEY,"
+            " translation TEXT NOT NULL,"
+            " size INTEGER NOT NULL,"
+            " last_used INTEGER NOT NULL)"
+        )
+        self.conn.execute("CREATE INDEX IF NOT EXISTS cache_last_used ON cache(last_used)")
+        self.conn.commit()
+
+        # LRU sırası için artan sayaç ve toplam boyut
+        row = self.conn.execute(
+            "SELECT COALESCE(MAX(last_used), 0), COUNT(*), COALESCE(SUM(size), 0) FROM cache"
+        ).fetchone()
+        self.clock, self.entries, self.total_bytes = row
+
+    @staticmethod
+    def make_key(src_lang, dest_lang, text):
+        digest = hashlib.sha256(text.encode("utf-8")).hexdigest()
+        return f"{src_lang}:{dest_lang}:{digest}"
+
+    def _tick(self):
+        self.clock += 1
+        return self.clock
+
+    def get(self, src_lang, dest_lang, text):
+        key = self.make_key(src_lang, dest_lang, text)
+        with self.lock:
+            row = self.conn.execute("SELECT translation FROM cache WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            self.conn.execute("UPDATE cache SET last_used = ? WHERE key = ?", (self._tick(), key))
+            self.conn.commit()
+            self.hits += 1
+            return row[0]
+
+    def set(self, src_lang, dest_lang, text, translation):
+        key = self.make_key(src_lang, dest_lang, text)
+        size = len(translation.encode("utf-8"))
+        with self.lock:
+            old = self.conn.execute("SELECT size FROM cache WHERE key = ?", (key,)).fetchone()
+            if old is not None:
+                self.entries -= 1
+                self.total_bytes -= old[0]
+            self.conn.execute(
+                "INSERT OR REPLACE INTO cache (key, translation, size, last_used) VALUES (?, ?, ?, ?)",
+                (key, translation, size, self._tick())
+            )
+            self.entries += 1
+            self.total_bytes += size
+            self._evict()
+            self.conn.commit()
+
+    def _evict(self):
+        # En uzun süredir kullanılmayan kayıtları sınırlar sağlanana kadar sil
+        while self.entries > self.max_entries or (self.max_bytes and self.total_bytes > self.max_bytes):
+            excess = max(1, self.entries - self.max_entries)
+            rows = self.conn.execute(
+                "SELECT key, size FROM cache ORDER BY last_used LIMIT ?", (excess,)
+            ).fetchall()
+            if not rows:
+                break
+            self.conn.executemany("DELETE FROM cache WHERE key = ?", [(key,) for key, _ in rows])
+            self.entries -= len(rows)
+            self.total_bytes -= sum(size for _, size in rows)
+            self.evictions += len(rows)
+
+    def __contains__(self, item):
+        src_lang, dest_lang, text = item
+        key = self.make_key(src_lang, dest_lang, text)
+        with self.lock:
+            return self.conn.execute("SELECT 1 FROM cache WHERE key = ?", (key,)).fetchone() is not None
+
+    def __len__(self):
+        return self.entries
+
+    def stats(self):
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "entries": self.entries,
+            "bytes": self.total_bytes
+        }
+
+    def clear(self):
+        with self.lock:
+            self.conn.execute("DELETE FROM cache")
+            self.conn.commit()
+            self.entries = 0
+            self.total_bytes = 0
+
+    def close(self):
+        with self.lock:
+            self.conn.close()
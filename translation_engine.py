@@ -0,0 +1,277 @@
+import heapq
+import itertools
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+
+class TranslationCancelled(Exception):
+    """Çeviri işi tamamlanmadan iptal edildi"""
+
+
+class OfflineTranslation(str):
+    """Çevrimdışı sözlükle üretilmiş (kelime kelime) çeviri
+
+    Normal bir metin gibi kullanılır ama önbelleğe, çeviri belleğine ve
+    geçmişe yazılmaz; arka uçlar geri gelince parça yeniden çevrilir.
+    """
+
+
+class TokenBucket:
+    """Saniyedeki istek bütçesini uygulayan iş parçacığı güvenli token kovası"""
+
+    def __init__(self, rate, capacity=None):
+        if rate <= 0:
+            raise ValueError("rate pozitif olmalı")
+        self.rate = float(rate)
+        # Kapasite verilmezse en fazla bir saniyelik patlamaya izin ver
+        self.capacity = float(capacity if capacity is not None else max(1.0, rate))
+        self.tokens = self.capacity
+        self.last_refill = time.monotonic()
+        self.lock = threading.Lock()
+
+    def _refill(self):
+        now = time.monotonic()
+        elapsed = now - self.last_refill
+        self.last_refill = now
+        self.tokens = min(self.capacity, self.tokens + elapsed * self.rate)
+
+    def acquire(self, tokens=1, cancel_event=None):
+        # Yeterli token birikene kadar bekle; iptal edilirse False döndür
+        while True:
+            with self.lock:
+                self._refill()
+                if self.tokens >= tokens:
+                    self.tokens -= tokens
+                    return True
+                wait_time = (tokens - self.tokens) / self.rate
+            if cancel_event is None:
+                time.sleep(wait_time)
+            elif cancel_event.wait(wait_time):
+                return False
+
+
+class RequestSlots:
+    """Öncelikli, sınırlı eş zamanlı istek yuvaları
+
+    Tüm işler arasında aynı anda yapılan arka uç isteği sayısını sınırlar.
+    Yuva boşaldığında önce en düşük öncelik değerine sahip (en acil) bekleyen,
+    eşitlikte önce gelen alır.
+    """
+
+    def __init__(self, limit):
+        self.available = limit
+        self.waiters = []
+        self.counter = itertools.count()
+        self.condition = threading.Condition()
+
+    def acquire(self, priority=0, cancel_event=None):
+        ticket = (priority, next(self.counter))
+        with self.condition:
+            heapq.heappush(self.waiters, ticket)
+            while not (self.available > 0 and self.waiters[0] == ticket):
+                if cancel_event is not None and cancel_event.is_set():
+                    self.waiters.remove(ticket)
+                    heapq.heapify(self.waiters)
+                    self.condition.notify_all()
+                    raise TranslationCancelled()
+                self.condition.wait(0.1)
+            heapq.heappop(self.waiters)
+            self.available -= 1
+            # Başka yuva boşsa sıradaki bekleyen de ilerleyebilsin
+            self.condition.notify_all()
+
+    def release(self):
+        with self.condition:
+            self.available += 1
+            self.condition.notify_all()
+
+
+def translate_chunks(chunks, translate_chunk, max_workers=4, requests_per_second=2.0,
+                     on_progress=None, on_result=None, cancel_event=None):
+    """Parçaları sınırlı bir iş havuzunda paralel çevir, sonuçları orijinal sırada döndür
+
+    translate_chunk(chunk) her parça için kendi yedekleme zincirini çalıştırır.
+    on_progress(tamamlanan, toplam) her parça bittiğinde çağrılır.
+    on_result(indeks, çeviri) her parça bittiğinde, bitiş sırasıyla çağrılır.
+    cancel_event kurulduğunda kalan parçalar gönderilmez ve
+    TranslationCancelled fırlatılır.
+    """
+    if not chunks:
+        return []
+
+    bucket = TokenBucket(requests_per_second) if requests_per_second else None
+    results = [None] * len(chunks)
+    completed = 0
+    progress_lock = threading.Lock()
+
+    def cancelled():
+        return cancel_event is not None and cancel_event.is_set()
+
+    def worker(index, chunk):
+        nonlocal completed
+        if cancelled():
+            return
+        if bucket is not None and not bucket.acquire(cancel_event=cancel_event):
+            return
+        try:
+            results[index] = translate_chunk(chunk)
+        except TranslationCancelled:
+            return
+        except Exception as e:
+            print(f"Chunk {index+1} çeviri hatası: {str(e)}", file=sys.stderr)
+            # Hata durumunda da çevrilmemiş metni ekle
+            results[index] = f"[Çeviri hatası: {chunk}]"
+        if on_result is not None:
+            on_result(index, results[index])
+        if on_progress is not None:
+            with progress_lock:
+                completed += 1
+                on_progress(completed, len(chunks))
+
+    # Tek parça için iş havuzu kurmaya gerek yok
+    if len(chunks) == 1:
+        worker(0, chunks[0])
+    else:
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(chunks))) as executor:
+            futures = [executor.submit(worker, i, chunk) for i, chunk in enumerate(chunks)]
+            for future in futures:
+                future.result()
+
+    if cancelled():
+        raise TranslationCancelled()
+    return results
+
+
+def pack_batches(items, max_length, max_items=50, measure=len, overhead=0):
+    """Ardışık öğeleri toplam boyutu max_length'i aşmayan gruplara ayır
+
+    Her öğe measure(öğe) + overhead yer kaplar; bir grupta en fazla max_items
+    öğe olur. Bütçeden büyük öğeler kendi gruplarında kalır. Sıra korunur;
+    indeks listelerinden oluşan bir liste döndürür.
+    """
+    batches = []
+    current = []
+    size = 0
+    for i, item in enumerate(items):
+        length = measure(item) + overhead
+        if current and (size + length > max_length or len(current) >= max_items):
+            batches.append(current)
+            current = []
+            size = 0
+        current.append(i)
+        size += length
+    if current:
+        batches.append(current)
+    return batches
+
+
+def translate_segments(chunks, translate_chunk, cache, src_lang, dest_lang, on_chunk=None, memory=None,
+                       translate_batch=None, batch_length=4500, batch_items=50, measure=len,
+                       batch_overhead=0, metrics=None, remember=True, cache_writes=True, **kwargs):
+    """Parçaları önbellek üzerinden çevir; yalnızca önbellekte olmayanlar arka uca gider
+
+    memory (TranslationMemory) verilirse önbellekte olmayan parçalar için
+    birebir veya yeterince benzer eski çeviriler de kullanılır ve yeni
+    çeviriler belleğe eklenir (remember=False ise yalnızca aranır; dosya
+    çevirisi gibi toplu işler belleği doldurmasın). cache_writes=False ise
+    yeni çeviriler önbelleğe de yazılmaz (canlı çeviride yarım yazılmış
+    cümleler kalıcı önbelleği doldurmasın ve sonradan geri gelmesin).
+    Çevrimdışı yedekten gelen çeviriler (OfflineTranslation) hiçbir zaman
+    önbelleğe ya da belleğe yazılmaz.
+
+    translate_batch(parçalar) verilirse eksik parçalar pack_batches ile
+    batch_length/batch_items sınırlarında gruplanır ve her grup tek bir
+    çağrıyla çevrilir (çeviri listesi döndürmelidir); bu durumda
+    translate_chunk kullanılmaz ve on_progress grup sayısını bildirir.
+
+    metrics (MetricsRegistry) verilirse önbellek/bellek arama süresi ve
+    isabet sayaçları kaydedilir.
+
+    (çeviriler, yeniden kullanılan parça sayısı) döndürür. on_chunk(indeks,
+    toplam, çeviri) parçalar hazır oldukça orijinal sırayla çağrılır; böylece
+    sonuç ilk parça biter bitmez gösterilebilir. Diğer argümanlar
+    translate_chunks'a aktarılır.
+    """
+    results = [None] * len(chunks)
+    ready = [False] * len(chunks)
+    missing = []
+    next_index = 0
+    emit_lock = threading.Lock()
+
+    def emit_ready():
+        # Sıradaki parça hazır olduğu sürece sırayla bildir
+        nonlocal next_index
+        while next_index < len(chunks) and ready[next_index]:
+            if on_chunk is not None:
+                on_chunk(next_index, len(chunks), results[next_index])
+            next_index += 1
+
+    cache_hits = memory_hits = 0
+    start = time.perf_counter()
+    for i, chunk in enumerate(chunks):
+        cached = cache.get(src_lang, dest_lang, chunk)
+        if cached is not None:
+            cache_hits += 1
+        elif memory is not None:
+            match = memory.lookup(src_lang, dest_lang, chunk)
+            if match is not None:
+                cached = match[0]
+                memory_hits += 1
+        if cached is not None:
+            results[i] = cached
+            ready[i] = True
+        else:
+            missing.append(i)
+    if metrics is not None:
+        metrics.observe("stage_seconds", time.perf_counter() - start, stage="cache_lookup")
+        metrics.increment("cache_hits_total", cache_hits)
+        metrics.increment("memory_hits_total", memory_hits)
+        metrics.increment("cache_misses_total", len(missing))
+
+    with emit_lock:
+        emit_ready()
+
+    def store(i, translation):
+        # Hatalı ve çevrimdışı çevrilmiş parçaları önbelleğe alma, bir sonraki denemede tekrar çevrilsin
+        if (cache_writes and not isinstance(translation, OfflineTranslation)
+                and not translation.startswith("[Çeviri hatası:")):
+            cache.set(src_lang, dest_lang, chunks[i], translation)
+            if memory is not None and remember:
+                memory.add(src_lang, dest_lang, chunks[i], translation)
+        with emit_lock:
+            results[i] = translation
+            ready[i] = True
+            emit_ready()
+
+    if translate_batch is None:
+        translate_chunks([chunks[i] for i in missing], translate_chunk,
+                         on_result=lambda position, translation: store(missing[position], translation),
+                         **kwargs)
+        return results, len(chunks) - len(missing)
+
+    groups = [[missing[position] for position in batch]
+              for batch in pack_batches([chunks[i] for i in missing], batch_length, batch_items,
+                                        measure, batch_overhead)]
+
+    def translate_group(group):
+        try:
+            translations = translate_batch(group)
+            if len(translations) != len(group):
+                raise ValueError(f"{len(group)} parça için {len(translations)} çeviri döndü")
+            return translations
+        except TranslationCancelled:
+            raise
+        except Exception as e:
+            print(f"Toplu çeviri hatası: {str(e)}", file=sys.stderr)
+            return [f"[Çeviri hatası: {chunk}]" for chunk in group]
+
+    def on_group_result(position, translations):
+        for i, translation in zip(groups[position], translations):
+            store(i, translation)
+
+    translate_chunks([[chunks[i] for i in group] for group in groups], translate_group,
+                     on_result=on_group_result, **kwargs)
+
+    return results, len(chunks) - len(missing)
@@ -0,0 +1,276 @@
+import hashlib
+import json
+import os
+import sqlite3
+import sys
+import threading
+import time
+from collections import OrderedDict
+
+
+class TranslationHistory:
+    """Diskte kalıcı, eklemeli çeviri geçmişi (SQLite)
+
+    Her çeviri tek bir INSERT ile eklenir; dosya baştan yazılmaz. Zaman,
+    dil çifti ve kaynak metin (özet) üzerinde indeks vardır; SQLite FTS5
+    destekliyorsa kaynak ve çeviri metinlerinde kelime araması da indekslidir.
+    Kayıt sayısı max_entries'i belirgin biçimde aşınca en eski kayıtlar
+    silinerek dosya sıkıştırılır.
+    """
+
+    def __init__(self, path="translation_history.db", max_entries=50000, legacy_path="translation_history.json"):
+        self.path = path
+        self.max_entries = max_entries
+        # Sıkıştırma her eklemede değil, sınır bu kadar aşıldığında yapılır
+        self.compact_slack = max(100, max_entries // 10)
+
+        self.lock = threading.Lock()
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS history ("
+            " id INTEGER PRIMARY KEY,"
+            " timestamp TEXT NOT NULL,"
+            " source_lang TEXT NOT NULL,"
+            " target_lang TEXT NOT NULL,"
+            " source_hash TEXT NOT NULL,"
+            " full_source TEXT NOT NULL,"
+            " translation TEXT NOT NULL)"
+        )
+        self.conn.execute("CREATE INDEX IF NOT EXISTS history_timestamp ON history(timestamp)")
+        self.conn.execute("CREATE INDEX IF NOT EXISTS history_pair ON history(source_lang, target_lang, id)")
+        self.conn.execute("CREATE INDEX IF NOT EXISTS history_source ON history(source_hash)")
+
+        # Metin araması için FTS5 (yoksa LIKE ile taranır)
+        try:
+            self.conn.execute(
+                "CREATE VIRTUAL TABLE IF NOT EXISTS history_text USING fts5("
+                " full_source, translation, content='history', content_rowid='id')"
+            )
+            self.full_text = True
+        except sqlite3.OperationalError:
+            self.full_text = False
+        self.conn.commit()
+
+        self.entries = self.conn.execute("SELECT COUNT(*) FROM history").fetchone()[0]
+        if self.entries == 0 and legacy_path and os.path.exists(legacy_path):
+            self.import_json(legacy_path)
+
+    @staticmethod
+    def source_hash(text):
+        return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+    @staticmethod
+    def _entry(row):
+        full_source = row["full_source"]
+        # Listelerde gösterilen kısa önizleme (ilk 100 karakter)
+        return {
+            "id": row["id"],
+            "source": full_source[:100] + "..." if len(full_source) > 100 else full_source,
+            "full_source": full_source,
+            "translation": row["translation"],
+            "source_lang": row["source_lang"],
+            "target_lang": row["target_lang"],
+            "timestamp": row["timestamp"]
+        }
+
+    def _insert(self, source_text, translated_text, source_lang, target_lang, timestamp):
+        cursor = self.conn.execute(
+            "INSERT INTO history (timestamp, source_lang, target_lang, source_hash, full_source, translation)"
+            " VALUES (?, ?, ?, ?, ?, ?)",
+            (timestamp, source_lang, target_lang, self.source_hash(source_text), source_text, translated_text)
+        )
+        if self.full_text:
+            self.conn.execute(
+                "INSERT INTO history_text (rowid, full_source, translation) VALUES (?, ?, ?)",
+                (cursor.lastrowid, source_text, translated_text)
+            )
+        self.entries += 1
+        return cursor.lastrowid
+
+    def add(self, source_text, translated_text, source_lang, target_lang, timestamp=None):
+        """Bir çeviriyi geçmişe ekle ve kaydın kimliğini döndür"""
+        timestamp = timestamp or time.strftime("%Y-%m-%d %H:%M:%S")
+        with self.lock:
+            entry_id = self._insert(source_text, translated_text, source_lang, target_lang, timestamp)
+            self.conn.commit()
+            compact = self.entries > self.max_entries + self.compact_slack
+        if compact:
+            self.compact()
+        return entry_id
+
+    def import_json(self, path):
+        """Eski translation_history.json dosyasını içe aktar ve yanına .bak olarak taşı"""
+        try:
+            with open(path, "r", encoding="utf-8") as file:
+                items = json.load(file)
+            with self.lock:
+                for item in items:
+                    self._insert(item.get("full_source", item.get("source", "")), item.get("translation", ""),
+                                 item.get("source_lang", ""), item.get("target_lang", ""),
+                                 item.get("timestamp") or time.strftime("%Y-%m-%d %H:%M:%S"))
+                self.conn.commit()
+            os.replace(path, path + ".bak")
+        except Exception as e:
+            print(f"Eski geçmiş içe aktarılırken hata: {str(e)}", file=sys.stderr)
+
+    def __len__(self):
+        return self.entries
+
+    def get(self, entry_id):
+        with self.lock:
+            row = self.conn.execute("SELECT * FROM history WHERE id = ?", (entry_id,)).fetchone()
+        return self._entry(row) if row is not None else None
+
+    def recent(self, limit=50, offset=0):
+        """En yeni kayıttan başlayarak sayfa sayfa kayıt döndür"""
+        with self.lock:
+            rows = self.conn.execute(
+                "SELECT * FROM history ORDER BY id DESC LIMIT ? OFFSET ?", (limit, offset)
+            ).fetchall()
+        return [self._entry(row) for row in rows]
+
+    def find_source(self, source_text, source_lang=None, target_lang=None):
+        """Aynı kaynak metnin en son çevirisini döndür (yoksa None)"""
+        query = "SELECT * FROM history WHERE source_hash = ?"
+        params = [self.source_hash(source_text)]
+        if source_lang is not None:
+            query += " AND source_lang = ?"
+            params.append(source_lang)
+        if target_lang is not None:
+            query += " AND target_lang = ?"
+            params.append(target_lang)
+        with self.lock:
+            row = self.conn.execute(query + " ORDER BY id DESC LIMIT 1", params).fetchone()
+        return self._entry(row) if row is not None else None
+
+    def _filter(self, text=None, source_lang=None, target_lang=None, since=None, until=None):
+        # Arama koşullarından (tablolar, WHERE ifadesi, parametreler) üret
+        conditions = []
+        params = []
+        tables = "history"
+        if text:
+            if self.full_text:
+                # Her kelime önek olarak aranır: "merh dünya" -> "merh"* AND "dünya"*
+                terms = ['"' + word.replace('"', '""') + '"*' for word in text.split()]
+                tables = "history JOIN history_text ON history_text.rowid = history.id"
+                conditions.append("history_text MATCH ?")
+                params.append(" AND ".join(terms))
+            else:
+                conditions.append("(full_source LIKE ? OR translation LIKE ?)")
+                params.extend([f"%{text}%", f"%{text}%"])
+        if source_lang is not None:
+            conditions.append("source_lang = ?")
+            params.append(source_lang)
+        if target_lang is not None:
+            conditions.append("target_lang = ?")
+            params.append(target_lang)
+        if since is not None:
+            conditions.append("timestamp >= ?")
+            params.append(since)
+        if until is not None:
+            conditions.append("timestamp <= ?")
+            params.append(until)
+        where = " WHERE " + " AND ".join(conditions) if conditions else ""
+        return tables, where, params
+
+    def search(self, text=None, source_lang=None, target_lang=None, since=None, until=None, limit=100, offset=0):
+        """Metin, dil çifti ve tarih aralığına göre ara (en yeni önce)
+
+        since/until "YYYY-AA-GG SS:DD:ss" biçiminde (veya öneki) olabilir.
+        """
+        tables, where, params = self._filter(text, source_lang, target_lang, since, until)
+        query = f"SELECT history.* FROM {tables}{where} ORDER BY history.id DESC LIMIT ? OFFSET ?"
+        with self.lock:
+            rows = self.conn.execute(query, params + [limit, offset]).fetchall()
+        return [self._entry(row) for row in rows]
+
+    def count(self, text=None, source_lang=None, target_lang=None, since=None, until=None):
+        """search ile aynı koşullara uyan kayıt sayısı"""
+        if not (text or source_lang or target_lang or since or until):
+            return self.entries
+        tables, where, params = self._filter(text, source_lang, target_lang, since, until)
+        with self.lock:
+            return self.conn.execute(f"SELECT COUNT(*) FROM {tables}{where}", params).fetchone()[0]
+
+    def compact(self):
+        """max_entries'i aşan en eski kayıtları sil ve dosyayı küçült"""
+        with self.lock:
+            excess = self.entries - self.max_entries
+            if excess > 0:
+                cutoff = self.conn.execute(
+                    "SELECT id FROM history ORDER BY id LIMIT 1 OFFSET ?", (excess - 1,)
+                ).fetchone()[0]
+                self.conn.execute("DELETE FROM history WHERE id <= ?", (cutoff,))
+                if self.full_text:
+                    self.conn.execute("INSERT INTO history_text (history_text) VALUES ('rebuild')")
+                self.entries -= excess
+            self.conn.commit()
+            try:
+                self.conn.execute("VACUUM")
+            except sqlite3.OperationalError as e:
+                print(f"Geçmiş sıkıştırılırken hata: {str(e)}", file=sys.stderr)
+
+    def clear(self):
+        with self.lock:
+            self.conn.execute("DELETE FROM history")
+            if self.full_text:
+                self.conn.execute("INSERT INTO history_text (history_text) VALUES ('delete-all')")
+            self.conn.commit()
+            self.entries = 0
+
+    def close(self):
+        with self.lock:
+            self.conn.close()
+
+
+class HistoryPager:
+    """Bir geçmiş sorgusunun sonuçlarına sayfa sayfa, tembel erişim
+
+    Sanal listeler yalnızca görünen satırları ister; kayıtlar depodan
+    page_size'lık sayfalar halinde çekilir ve son kullanılan birkaç sayfa
+    bellekte tutulur. Toplam kayıt sayısı ilk ihtiyaçta bir kez sorgulanır.
+    """
+
+    def __init__(self, store, text=None, page_size=100, max_pages=8, **filters):
+        self.store = store
+        self.text = text
+        self.filters = filters
+        self.page_size = page_size
+        self.max_pages = max_pages
+        self.pages = OrderedDict()
+        self.total = None
+
+    def __len__(self):
+        if self.total is None:
+            self.total = self.store.count(self.text, **self.filters)
+        return self.total
+
+    def _page(self, number):
+        if number in self.pages:
+            self.pages.move_to_end(number)
+            return self.pages[number]
+        page = self.store.search(self.text, limit=self.page_size, offset=number * self.page_size, **self.filters)
+        self.pages[number] = page
+        if len(self.pages) > self.max_pages:
+            self.pages.popitem(last=False)
+        return page
+
+    def get(self, index):
+        if index < 0:
+            return None
+        page = self._page(index // self.page_size)
+        offset = index % self.page_size
+        return page[offset] if offset < len(page) else None
+
+    def rows(self, start, count):
+        """start'tan itibaren en fazla count kayıt döndür"""
+        rows = []
+        for index in range(max(0, start), min(start + count, len(self))):
+            item = self.get(index)
+            if item is None:
+                break
+            rows.append(item)
+        return rows
@@ -0,0 +1,235 @@
+import itertools
+import random
+import re
+import threading
+import zlib
+from collections import Counter, OrderedDict
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+# MinHash permütasyonları için Mersenne asalı; 32 bitlik özetlerle çarpımlar 64 bite sığar
+PRIME = (1 << 31) - 1
+
+WHITESPACE = re.compile(r"\s+")
+NUMBERS = re.compile(r"\d+")
+
+
+def normalize(text):
+    # Boşluk farkları eşleşmeyi bozmasın
+    return WHITESPACE.sub(" ", text).strip()
+
+
+class TranslationMemory:
+    """Benzer cümleleri ağa gitmeden çeviren çeviri belleği
+
+    Geçmiş (kaynak, çeviri) çiftleri dil çifti başına tutulur. Önce boşlukları
+    normalleştirilmiş metinle birebir eşleşme aranır; yoksa karakter
+    n-gramlarının MinHash imzaları LSH kovalarıyla taranır ve adayların
+    n-gram çoklukları üzerinden hesaplanan Jaccard benzerliği threshold'u
+    geçerse (uzunlukları da en az bu oranda yakınsa ve sayılar aynıysa) kayıtlı
+    çeviri döndürülür; yalnızca tekrar sayısı farklı metinler ("çok çok" /
+    "çok çok çok") eşleşmez. Varsayılan threshold 1.0'dır, yani yalnızca
+    birebir eşleşme aranır: benzerlik olumsuzluk gibi tek kelimelik anlam
+    farklarını ("ödendi" / "ödenmedi") ayırt edemez, bu yüzden bulanık
+    eşleşme yalnızca açıkça daha düşük bir eşik verilince kullanılır.
+    Arama kayıt sayısından bağımsız olarak yalnızca aynı kovadaki adaylara
+    bakar. NumPy kuruluysa imzalar vektörel hesaplanır.
+
+    Yalnızca max_length karaktere kadar olan cümle düzeyindeki metinler
+    tutulur ve aranır: uzun bir parçada tek kelimelik düzeltme benzerliği
+    eşiğin altına düşürmez (eski çeviri geri gelirdi) ve imza maliyeti metin
+    uzunluğuyla artar. Bellek en fazla max_entries kayıt ve yaklaşık
+    max_bytes bayt (UTF-8 kaynak + çeviri) tutar; sınır aşılınca en eski
+    kayıtlar silinir.
+    """
+
+    def __init__(self, threshold=1.0, num_perm=64, shingle_size=3, max_entries=100000, max_length=300,
+                 max_bytes=16 * 1024 * 1024, seed=17):
+        self.threshold = threshold
+        self.num_perm = num_perm
+        self.shingle_size = shingle_size
+        self.max_entries = max_entries
+        self.max_length = max_length
+        self.max_bytes = max_bytes
+        self.bytes = 0
+        self.rows, self.bands = self._band_layout(threshold, num_perm)
+
+        rng = random.Random(seed)
+        self.coefficients = [(rng.randrange(1, PRIME), rng.randrange(0, PRIME)) for _ in range(num_perm)]
+        if numpy is not None:
+            self.a = numpy.array([a for a, _ in self.coefficients], dtype=numpy.uint64)
+            self.b = numpy.array([b for _, b in self.coefficients], dtype=numpy.uint64)
+            self.prime = numpy.uint64(PRIME)
+
+        self.ids = itertools.count()
+        # kimlik -> (dil çifti, normalleştirilmiş kaynak, çeviri, kova anahtarları, bayt)
+        self.entries = OrderedDict()
+        # (dil çifti, normalleştirilmiş kaynak) -> kimlik
+        self.exact = {}
+        # (dil çifti, bant, bant özeti) -> kimlikler
+        self.buckets = {}
+        self.lock = threading.Lock()
+
+        # Sayaçlar
+        self.exact_hits = 0
+        self.fuzzy_hits = 0
+        self.misses = 0
+        # max_length'ten uzun olduğu için aranmayan metinler
+        self.skipped = 0
+
+    @staticmethod
+    def _band_layout(threshold, num_perm):
+        # Eşik benzerliğindeki çiftlerin en az %95'ini aday yapan en seçici (en çok satırlı) bant düzeni
+        for rows in sorted((r for r in range(1, num_perm + 1) if num_perm % r == 0), reverse=True):
+            bands = num_perm // rows
+            if 1 - (1 - threshold ** rows) ** bands >= 0.95:
+                return rows, bands
+        return 1, num_perm
+
+    def shingles(self, text):
+        """Karakter n-gramları ve metindeki tekrar sayıları"""
+        text = text.lower()
+        n = self.shingle_size
+        if len(text) <= n:
+            return Counter([text])
+        return Counter(text[i:i + n] for i in range(len(text) - n + 1))
+
+    def signature(self, shingles):
+        hashes = [zlib.crc32(shingle.encode("utf-8")) for shingle in shingles]
+        if numpy is not None:
+            values = numpy.array(hashes, dtype=numpy.uint64) % self.prime
+            # (a * x + b) mod p, her permütasyon için tüm n-gramlarda minimum
+            matrix = (numpy.outer(self.a, values) + self.b[:, None]) % self.prime
+            return matrix.min(axis=1).tolist()
+        hashes = [h % PRIME for h in hashes]
+        return [min((a * h + b) % PRIME for h in hashes) for a, b in self.coefficients]
+
+    def _bucket_keys(self, pair, signature):
+        rows = self.rows
+        return [(pair, band, hash(tuple(signature[band * rows:(band + 1) * rows])))
+                for band in range(self.bands)]
+
+    @staticmethod
+    def similarity(first, second):
+        """n-gram çoklukları üzerinden Jaccard benzerliği"""
+        if not first or not second:
+            return 0.0
+        return sum((first & second).values()) / sum((first | second).values())
+
+    @property
+    def exact_only(self):
+        return self.threshold >= 1.0
+
+    def add(self, src_lang, dest_lang, source, translation):
+        """(kaynak, çeviri) çiftini belleğe ekle; aynı kaynak varsa çeviriyi günceller"""
+        text = normalize(source)
+        if not text or not translation or len(text) > self.max_length:
+            return
+        pair = (src_lang, dest_lang)
+        keys = [] if self.exact_only else self._bucket_keys(pair, self.signature(self.shingles(text)))
+        size = len(text.encode("utf-8")) + len(translation.encode("utf-8"))
+
+        with self.lock:
+            previous = self.exact.get((pair, text))
+            if previous is not None:
+                self._remove(previous)
+            entry_id = next(self.ids)
+            self.entries[entry_id] = (pair, text, translation, keys, size)
+            self.exact[(pair, text)] = entry_id
+            self.bytes += size
+            for key in keys:
+                self.buckets.setdefault(key, set()).add(entry_id)
+            # En eski kayıtlar silinir
+            while len(self.entries) > self.max_entries or self.bytes > self.max_bytes:
+                self._remove(next(iter(self.entries)))
+
+    def _remove(self, entry_id):
+        pair, text, _, keys, size = self.entries.pop(entry_id)
+        del self.exact[(pair, text)]
+        self.bytes -= size
+        for key in keys:
+            bucket = self.buckets.get(key)
+            if bucket is not None:
+                bucket.discard(entry_id)
+                if not bucket:
+                    del self.buckets[key]
+
+    def lookup(self, src_lang, dest_lang, text):
+        """En benzer kaydın (çeviri, benzerlik) çiftini döndür; eşik altındaysa None"""
+        text = normalize(text)
+        pair = (src_lang, dest_lang)
+        with self.lock:
+            if len(text) > self.max_length:
+                self.skipped += 1
+                return None
+            entry_id = self.exact.get((pair, text))
+            if entry_id is not None:
+                self.exact_hits += 1
+                return self.entries[entry_id][2], 1.0
+            if self.exact_only:
+                self.misses += 1
+                return None
+
+        shingles = self.shingles(text)
+        keys = self._bucket_keys(pair, self.signature(shingles))
+        with self.lock:
+            candidates = set()
+            for key in keys:
+                candidates.update(self.buckets.get(key, ()))
+            entries = [self.entries[i] for i in candidates]
+
+        best = None
+        numbers = NUMBERS.findall(text)
+        for _, source, translation, _, _ in entries:
+            # Uzunluk oranı benzerlik eşiğini geçemeyecek adaylar n-gram sayılmadan elenir
+            if min(len(source), len(text)) < self.threshold * max(len(source), len(text)):
+                continue
+            # Sayıları farklı cümleler (tarih, tutar, fatura no.) benzer olsa da eşleşmez
+            if NUMBERS.findall(source) != numbers:
+                continue
+            score = self.similarity(shingles, self.shingles(source))
+            if score >= self.threshold and (best is None or score > best[1]):
+                best = (translation, score)
+
+        with self.lock:
+            if best is None:
+                self.misses += 1
+            else:
+                self.fuzzy_hits += 1
+        return best
+
+    def load_history(self, history, limit=10000, max_length=None):
+        """Çeviri geçmişindeki son kayıtları belleğe ekle (en eskiden yeniye)"""
+        items = history.recent(limit)
+        for item in reversed(items):
+            if len(item["full_source"]) > min(self.max_length, max_length or self.max_length):
+                # Bellek yalnızca cümle düzeyindeki kısa metinleri tutar
+                continue
+            if item["source_lang"] and item["target_lang"]:
+                self.add(item["source_lang"], item["target_lang"], item["full_source"], item["translation"])
+
+    def __len__(self):
+        return len(self.entries)
+
+    def stats(self):
+        return {
+            "exact_hits": self.exact_hits,
+            "fuzzy_hits": self.fuzzy_hits,
+            "misses": self.misses,
+            "skipped": self.skipped,
+            "entries": len(self.entries),
+            "bytes": self.bytes,
+            "bands": self.bands,
+            "rows": self.rows
+        }
+
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
+            self.exact.clear()
+            self.buckets.clear()
+            self.bytes = 0
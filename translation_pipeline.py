@@ -0,0 +1,530 @@
+import os
+import re
+import sys
+import threading
+import time
+
+from backend_router import Backend, BackendRouter
+from translation_backends import BATCH_OVERHEAD, BackendClients
+from translation_cache import TranslationCache
+from translation_engine import OfflineTranslation, TokenBucket, TranslationCancelled, translate_segments
+from language_detection import LanguageDetector
+from metrics import MetricsRegistry
+from offline_dictionary import OfflineTranslator
+from translation_memory import TranslationMemory
+
+# Desteklenen diller
+SUPPORTED_LANGUAGES = {
+    "Türkçe": "tr",
+    "İngilizce": "en",
+    "Almanca": "de",
+    "Fransızca": "fr",
+    "İspanyolca": "es",
+    "İtalyanca": "it",
+    "Rusça": "ru",
+    "Çince": "zh-CN",
+    "Japonca": "ja",
+    "Korece": "ko",
+    "Arapça": "ar"
+}
+
+# Kaynak dili parça parça algılanacak karışık metinler için özel kod
+AUTO_LANGUAGE = "auto"
+
+# Satır sonları (karışık dilli metinlerde her satır/paragraf ayrı algılanır)
+LINE_BREAKS = re.compile(r'(\n+)')
+
+# Cümle sonu ve ardından gelen boşluk (pencere kenarlarında bölme noktası)
+SENTENCE_BOUNDARY = re.compile(r'(?<=[.!?])\s+')
+WHITESPACE = re.compile(r'\s+')
+
+# Parça içindeki satır yapısı: satır sonu içeren boşluklar (boş satırlar, girintiler)
+LINE_STRUCTURE = re.compile(r'([ \t\r\f\v]*\n\s*)')
+
+# Bir pencere içindeki son boşluk ve son cümle sonu/paragraf (açgözlü .* sayesinde
+# eşleşme sondan geriye doğru C içinde aranır)
+LAST_SPACE = re.compile(r'.*(\s)', re.S)
+LAST_SENTENCE_BREAK = re.compile(r'.*(?:[.!?…。！？]["\'»”’)\]]*(\s)|(\n))', re.S)
+# Boşluksuz yazılan dillerde (Çince, Japonca) cümle sonu
+LAST_CJK_SENTENCE_END = re.compile(r'.*[。！？]', re.S)
+
+
+def byte_length(text):
+    return len(text.encode("utf-8"))
+
+
+def budget_end(text, start, limit, by_bytes):
+    """text[start:] içinde bütçeye sığan en uzak bitiş konumu"""
+    if not by_bytes:
+        return min(len(text), start + limit)
+    # Karakter sayısı bayt sayısından büyük olamaz; limit karakterlik dilimi baytta kes
+    window = text[start:start + limit].encode("utf-8")[:limit].decode("utf-8", "ignore")
+    return start + max(1, len(window))
+
+
+def iter_chunks(text, max_length=4500, max_bytes=None):
+    """Metni bütçeye sığan parçalara ayıran, doğrusal zamanlı üreteç
+
+    (parça, ayırıcı) çiftleri üretir; ayırıcı parçadan sonra gelen özgün
+    boşluktur (satır sonları dahil), böylece "".join(parça + ayırıcı) metnin
+    kendisini verir. Metin boşlukla başlıyorsa ilk çift ("", baştaki boşluk)
+    olur. Bütçe max_bytes verilirse UTF-8 bayt, verilmezse karakter
+    cinsindendir.
+
+    Her adımda yalnızca bütçe kadarlık pencereye bakılır: pencerenin ikinci
+    yarısında cümle sonu/paragraf varsa orada, yoksa son boşlukta, o da yoksa
+    (tek başına sığmayan kelime, boşluksuz diller) bütçe sınırında kesilir.
+    Metin yalnızca ofsetlerle gezilir, parçalar birleştirilerek kurulmaz.
+    """
+    if not text:
+        return
+
+    limit = max_bytes or max_length
+    by_bytes = bool(max_bytes)
+    length = len(text)
+
+    leading = WHITESPACE.match(text)
+    start = leading.end() if leading else 0
+    if start:
+        yield "", text[:start]
+
+    while start < length:
+        end = budget_end(text, start, limit, by_bytes)
+        if end >= length:
+            # Kalan metin sığıyor; sondaki boşluk son ayırıcıdır
+            rest = text[start:].rstrip()
+            yield rest, text[start + len(rest):]
+            return
+
+        # Kesim noktası (boşluğun başladığı konum); pencerenin hemen ardındaki boşluk da
+        # geçerlidir, bu yüzden aramalar end + 1'e kadar yapılır
+        half = start + (end - start) // 2
+        cut = None
+        match = LAST_SENTENCE_BREAK.match(text, half, end + 1)
+        if match is not None:
+            cut = match.start(1) if match.group(1) is not None else match.start(2)
+        else:
+            match = LAST_SPACE.match(text, start, end + 1)
+            if match is not None and match.start(1) > start:
+                cut = match.start(1)
+
+        if cut is None:
+            # Boşluk yok: mümkünse boşluksuz dillerin cümle sonunda, değilse bütçe sınırında kes
+            match = LAST_CJK_SENTENCE_END.match(text, half, end)
+            cut = match.end() if match is not None else end
+            yield text[start:cut], ""
+            start = cut
+            continue
+
+        # Boşluk dizisinin tamamı ayırıcıdır (pencerenin dışına taşsa da)
+        while cut > start and text[cut - 1].isspace():
+            cut -= 1
+        separator = WHITESPACE.match(text, cut)
+        yield text[start:cut], separator.group()
+        start = separator.end()
+
+
+def flatten_lines(chunk):
+    """Parçanın satır yapısını ayır: (gönderilecek metin, satır ayırıcıları)
+
+    Boş satırlar ve girintiler ağa gönderilmez; satırlar tek bir "\n" ile
+    birleştirilir, özgün ayırıcılar restore_lines için saklanır.
+    """
+    parts = LINE_STRUCTURE.split(chunk)
+    return "\n".join(parts[0::2]), parts[1::2]
+
+
+def restore_lines(translation, breaks):
+    """flatten_lines ile ayrılan satır ayırıcılarını çeviriye geri koy
+
+    Çevirideki satır sayısı değiştiyse (arka uç satırları birleştirdiyse)
+    çeviri olduğu gibi döndürülür.
+    """
+    if not breaks:
+        return translation
+    lines = translation.split("\n")
+    if len(lines) != len(breaks) + 1:
+        return translation
+    parts = [lines[0].strip()]
+    for separator, line in zip(breaks, lines[1:]):
+        parts.append(separator)
+        parts.append(line.strip())
+    return "".join(parts)
+
+
+def iter_windows(stream, window_size):
+    """Akışı sınırlı pencerelerde oku, her pencereyi cümle sınırında kes
+
+    (metin, ayırıcı) çiftleri üretir: metin çevrilecek tam cümleler, ayırıcı
+    ise kesim noktasındaki özgün boşluktur ve olduğu gibi yazılmalıdır.
+    Yarım kalan cümle bir sonraki pencereye taşınır.
+    """
+    carry = ""
+    while True:
+        data = stream.read(window_size)
+        buffer = carry + data
+        if not data:
+            if buffer:
+                yield buffer, ""
+            return
+
+        # Son cümle sınırında kes; yoksa son boşlukta, o da yoksa pencere sonunda
+        cut = None
+        for match in SENTENCE_BOUNDARY.finditer(buffer):
+            if match.end() < len(buffer):
+                cut = match
+        if cut is None:
+            for match in WHITESPACE.finditer(buffer):
+                if match.start() > 0 and match.end() < len(buffer):
+                    cut = match
+
+        if cut is not None:
+            yield buffer[:cut.start()], cut.group()
+            carry = buffer[cut.end():]
+        else:
+            yield buffer, ""
+            carry = ""
+
+
+class TranslationPipeline:
+    """Tkinter'dan bağımsız çeviri hattı
+
+    Metni parçalara ayırır, parçaları önbellek üzerinden paralel çevirir ve
+    her parça için çevrimiçi arka uçları (Google, LibreTranslate) BackendRouter
+    üzerinden dener, hepsi başarısızsa çevrimdışı sözlüğe düşer. Masaüstü uygulaması ve komut satırı aracı bu sınıfı kullanır.
+    """
+
+    def __init__(self, cache=None, backends=None, max_workers=4, requests_per_second=2.0,
+                 max_length=4500, max_bytes=None, on_status=None, request_slots=None, offline=None,
+                 memory=None, router=None, batch_items=50, metrics=None):
+        self.cache = cache if cache is not None else TranslationCache()
+        # Çeviri belleği: önbellekte olmayan parçalar ağa gitmeden önce burada aranır. Varsayılan
+        # bellek yalnızca birebir eşleşir; bulanık eşleşme için eşiği düşük bir bellek verilmelidir
+        self.memory = memory if memory is not None else TranslationMemory()
+        self.backends = backends if backends is not None else BackendClients()
+        self.max_workers = max_workers
+        self.requests_per_second = requests_per_second
+        # İstek bütçesi aynı hattı kullanan tüm işler arasında paylaşılır
+        self.rate_limiter = TokenBucket(requests_per_second) if requests_per_second else None
+        # Eş zamanlı arka uç isteklerini sınırlayan ortak RequestSlots (isteğe bağlı)
+        self.request_slots = request_slots
+        self.max_length = max_length
+        # Verilirse parça bütçesi karakter yerine UTF-8 bayt cinsinden ölçülür
+        self.max_bytes = max_bytes
+        self.detector = LanguageDetector(self.backends)
+        # Yön başına sözlüklerle çevrimdışı yedek (sözlükler ilk kullanımda yüklenir)
+        self.offline = offline if offline is not None else OfflineTranslator()
+        # Durum mesajları için geri çağırma (ör. arayüzdeki durum çubuğu)
+        self.on_status = on_status or (lambda message: None)
+        # Aşama süreleri ve arka uç sayaçları (tanılama paneli, /metrics ve döküm dosyası)
+        self.metrics = metrics if metrics is not None else MetricsRegistry()
+        # Devre kesicili, en hızlı sağlıklı arka uca yönlendiren ve yavaş isteği çoğaltan yönlendirici
+        self.router = router if router is not None else BackendRouter([
+            Backend("GoogleTranslator", self.backends.translate_google,
+                    translate_batch=self.backends.translate_google_batch),
+            Backend("LibreTranslate", self.backends.translate_libre,
+                    translate_batch=self.backends.translate_libre_batch)
+        ], on_status=lambda message: self.on_status(message), metrics=self.metrics)
+        # Kısa parçalar bütçe dolana kadar tek istekte toplanır (1: toplu istek yok)
+        self.batch_items = batch_items
+
+    # Metni parçalara ayırma (maksimum uzunluk sınırı için)
+    def split_text(self, text, max_length=None):
+        # Boş parçalar (yalnızca boşluktan oluşan metin) çevrilmez
+        return [chunk for chunk, _ in self.iter_chunks(text, max_length) if chunk]
+
+    def iter_chunks(self, text, max_length=None):
+        """Metni hattın bütçesine göre (parça, ayırıcı) çiftlerine ayır"""
+        if self.max_bytes:
+            return iter_chunks(text, max_bytes=self.max_bytes)
+        return iter_chunks(text, max_length or self.max_length)
+
+    # Alternatif çeviri yöntemi: LibreTranslate
+    def translate_with_libre(self, text, source, target):
+        try:
+            # LibreTranslate API'si ile çeviri (API anahtarı gerektirmez, ortak oturum kullanılır)
+            return self.backends.translate_libre(text, source, target)
+        except Exception as e:
+            print(f"LibreTranslate hatası: {str(e)}", file=sys.stderr)
+            raise e
+
+    # Basit çevrimdışı çeviri
+    def offline_translate(self, text, src_lang, dest_lang):
+        # Sözlük yönü kaynak/hedef dile göre seçilir; sözlük yoksa metin olduğu gibi kalır
+        with self.metrics.timer("stage_seconds", stage="offline"):
+            return self.offline.translate(text, src_lang, dest_lang)
+
+    # Tek bir parçayı çevrimiçi arka uçlar -> çevrimdışı zinciriyle çevir
+    def translate_chunk(self, chunk, src_lang, dest_lang):
+        # Yönlendirici açık devreli arka uçları atlar, en hızlı sağlıklı olanı dener
+        try:
+            return self.router.translate(chunk, src_lang, dest_lang)
+        except Exception as e:
+            print(f"Çevrimiçi çeviri hatası: {str(e)}", file=sys.stderr)
+
+        # Son çare: Basit çevrimdışı çeviri (işaretlenir, önbelleğe ve belleğe yazılmaz)
+        self.metrics.increment("fallbacks_total", backend="offline")
+        self.on_status("Çevrimdışı çeviri kullanılıyor (sınırlı)")
+        return OfflineTranslation(self.offline_translate(chunk, src_lang, dest_lang))
+
+    def _translate_chunk_gated(self, chunk, src_lang, dest_lang, priority, cancel_event):
+        # Önce öncelikli istek yuvası, sonra ortak istek bütçesi: acil işler
+        # yuvayı önce aldığı için bütçeyi de önce kullanır
+        start = time.perf_counter()
+        if self.request_slots is not None:
+            self.request_slots.acquire(priority, cancel_event)
+        try:
+            if self.rate_limiter is not None and not self.rate_limiter.acquire(cancel_event=cancel_event):
+                raise TranslationCancelled()
+            self.metrics.observe("stage_seconds", time.perf_counter() - start, stage="queue_wait")
+            return self.translate_chunk(chunk, src_lang, dest_lang)
+        finally:
+            if self.request_slots is not None:
+                self.request_slots.release()
+
+    def _translate_batch_gated(self, chunks, src_lang, dest_lang, priority, cancel_event):
+        # Grup tek bir yuva ve tek bir istek bütçesiyle gönderilir; toplu
+        # yanıt alınamazsa parçalar (her biri kendi bütçesiyle) tek tek çevrilir
+        if len(chunks) == 1:
+            return [self._translate_chunk_gated(chunks[0], src_lang, dest_lang, priority, cancel_event)]
+        start = time.perf_counter()
+        if self.request_slots is not None:
+            self.request_slots.acquire(priority, cancel_event)
+        try:
+            if self.rate_limiter is not None and not self.rate_limiter.acquire(cancel_event=cancel_event):
+                raise TranslationCancelled()
+            self.metrics.observe("stage_seconds", time.perf_counter() - start, stage="queue_wait")
+            try:
+                return self.router.translate_batch(chunks, src_lang, dest_lang)
+            except Exception as e:
+                print(f"Toplu çeviri alınamadı, parçalar tek tek çevriliyor: {str(e)}", file=sys.stderr)
+                self.metrics.increment("batch_splits_total")
+            translations = []
+            for chunk in chunks:
+                if self.rate_limiter is not None and not self.rate_limiter.acquire(cancel_event=cancel_event):
+                    raise TranslationCancelled()
+                translations.append(self.translate_chunk(chunk, src_lang, dest_lang))
+            return translations
+        finally:
+            if self.request_slots is not None:
+                self.request_slots.release()
+
+    def translate_detailed(self, texts, src_lang, dest_lang, on_progress=None, on_chunk=None,
+                           cancel_event=None, priority=0, remember=True, cache_writes=True, on_text=None):
+        """Metin listesini çevir; (çeviriler, önbellekten gelen parça, toplam parça) döndürür
+
+        Tüm metinlerin parçaları tek bir iş havuzunda birlikte çevrilir; kısa
+        parçalar parça bütçesini aşmayacak şekilde toplu isteklerde gönderilir.
+        Parçalar arasındaki özgün boşluklar, satır sonları ve girintiler
+        kaydedilir ve birleştirmede birebir geri konur; yalnızca metin içeren
+        kısımlar ağa gönderilir. on_chunk(indeks, toplam, çıktı) parçalar hazır
+        oldukça sırayla çağrılır; çıktı, parçanın çevirisi ile önündeki ve
+        arkasındaki yapıyı içerir, yani olduğu gibi art arda eklenebilir.
+        cancel_event kurulursa TranslationCancelled fırlatılır; priority ortak
+        istek yuvalarında sıralamayı belirler (küçük değer önce). remember=False
+        ise yeni çeviriler çeviri belleğine, cache_writes=False ise önbelleğe
+        eklenmez. on_text(indeks, çeviri) bir metnin tüm parçaları hazır olunca
+        çağrılır. Parçalarından biri çevrimdışı çevrilen metinler
+        OfflineTranslation olarak döner.
+        """
+        started = time.perf_counter()
+        chunks = []
+        # Her parça için: (ait olduğu metin, önündeki yapı, satır ayırıcıları, ardındaki ayırıcı)
+        layout = []
+        # Hiç metin içermeyen girdiler (yalnızca boşluk) olduğu gibi döner
+        structure_only = {}
+        for index, text in enumerate(texts):
+            prefix = ""
+            first = len(layout)
+            for chunk, separator in self.iter_chunks(text):
+                if not chunk:
+                    prefix += separator
+                    continue
+                sendable, breaks = flatten_lines(chunk)
+                chunks.append(sendable)
+                layout.append((index, prefix, breaks, separator))
+                prefix = ""
+            if len(layout) == first:
+                structure_only[index] = text
+        self.metrics.observe("stage_seconds", time.perf_counter() - started, stage="split")
+
+        def assemble(position, translated_chunk):
+            _, prefix, breaks, separator = layout[position]
+            return prefix + restore_lines(translated_chunk, breaks) + separator
+
+        # Parçalar sırayla bildirildiği için metnin son parçası gelince metin tamamlanmıştır
+        last_positions = {index: position for position, (index, _, _, _) in enumerate(layout)}
+        pieces = {}
+
+        def emit(position, total, translated_chunk):
+            output = assemble(position, translated_chunk)
+            if on_chunk is not None:
+                on_chunk(position, total, output)
+            if on_text is not None:
+                index = layout[position][0]
+                pieces.setdefault(index, []).append(output)
+                if last_positions[index] == position:
+                    on_text(index, "".join(pieces.pop(index)))
+
+        if on_text is not None:
+            for index, text in structure_only.items():
+                on_text(index, text)
+
+        translated_chunks, reused = translate_segments(
+            chunks,
+            lambda chunk: self._translate_chunk_gated(chunk, src_lang, dest_lang, priority, cancel_event),
+            self.cache, src_lang, dest_lang,
+            memory=self.memory,
+            remember=remember,
+            cache_writes=cache_writes,
+            metrics=self.metrics,
+            translate_batch=(lambda group: self._translate_batch_gated(group, src_lang, dest_lang,
+                                                                      priority, cancel_event))
+            if self.batch_items > 1 else None,
+            batch_length=self.max_bytes or self.max_length,
+            batch_items=self.batch_items,
+            measure=byte_length if self.max_bytes else len,
+            batch_overhead=BATCH_OVERHEAD,
+            max_workers=self.max_workers,
+            requests_per_second=None,
+            on_progress=on_progress,
+            on_chunk=emit if on_chunk is not None or on_text is not None else None,
+            cancel_event=cancel_event
+        )
+
+        # Parçaları ait oldukları metinlerde özgün yapılarıyla birleştir
+        grouped = [[] for _ in texts]
+        offline = set()
+        for position, translated_chunk in enumerate(translated_chunks):
+            index = layout[position][0]
+            grouped[index].append(assemble(position, translated_chunk))
+            if isinstance(translated_chunk, OfflineTranslation):
+                offline.add(index)
+        translations = [structure_only.get(i, "".join(parts)) for i, parts in enumerate(grouped)]
+        for index in offline:
+            translations[index] = OfflineTranslation(translations[index])
+
+        self.metrics.observe("stage_seconds", time.perf_counter() - started, stage="translate")
+        return translations, reused, len(chunks)
+
+    def translate_many(self, texts, src_lang, dest_lang, on_progress=None, **kwargs):
+        return self.translate_detailed(texts, src_lang, dest_lang, on_progress, **kwargs)[0]
+
+    def translate(self, text, src_lang, dest_lang, on_progress=None, **kwargs):
+        return self.translate_many([text], src_lang, dest_lang, on_progress, **kwargs)[0]
+
+    def translate_by_language(self, segments, dest_lang, **kwargs):
+        """Karışık dilli parçaları algılanan kaynak dillerine göre gruplayarak çevir
+
+        Tüm parçaların dili tek bir yerel geçişte algılanır (parça başına ağ
+        çağrısı yapılmaz), her dil grubu kendi isteği olarak çevrilir ve
+        sonuçlar orijinal sıraya konur. Zaten hedef dilde olan ve boş parçalar
+        olduğu gibi bırakılır. (çeviriler, {dil: [indeksler]}) döndürür.
+        """
+        return self.translate_by_language_detailed(segments, dest_lang, **kwargs)[:2]
+
+    def translate_by_language_detailed(self, segments, dest_lang, on_segment=None, **kwargs):
+        """translate_by_language gibi; ayrıca önbellekten gelen ve toplam parça sayısını döndürür
+
+        on_segment(indeks, çeviri) her parçanın çevirisi hazır olunca çağrılır;
+        çevrilmeyen parçalar için hemen çağrılır. Dil grupları metinde ilk
+        göründükleri sırayla çevrilir. (çeviriler, {dil: [indeksler]},
+        önbellekten gelen parça, toplam parça) döndürür.
+        """
+        results = list(segments)
+        indexed = [i for i, segment in enumerate(segments) if segment.strip()]
+        groups = {}
+        for position, lang in enumerate(self.detector.detect_batch([segments[i] for i in indexed])):
+            groups.setdefault(lang, []).append(indexed[position])
+
+        translated = {i for lang, indices in groups.items() if lang != dest_lang for i in indices}
+        if on_segment is not None:
+            for i, segment in enumerate(segments):
+                if i not in translated:
+                    on_segment(i, segment)
+
+        reused = total = 0
+        for lang, indices in sorted(groups.items(), key=lambda item: item[1][0]):
+            if lang == dest_lang:
+                continue
+            on_text = None
+            if on_segment is not None:
+                on_text = lambda position, translation, indices=indices: on_segment(indices[position], translation)
+            translations, group_reused, group_total = self.translate_detailed(
+                [segments[i] for i in indices], lang, dest_lang, on_text=on_text, **kwargs)
+            reused += group_reused
+            total += group_total
+            for i, translation in zip(indices, translations):
+                results[i] = translation
+
+        return results, groups, reused, total
+
+    def translate_mixed(self, text, dest_lang, **kwargs):
+        """Satırları farklı dillerde olabilen metni çevir, satır sonlarını koru"""
+        return self.translate_mixed_detailed(text, dest_lang, **kwargs)[0]
+
+    def translate_mixed_detailed(self, text, dest_lang, on_chunk=None, **kwargs):
+        """translate_mixed gibi; (çeviri, önbellekten gelen parça, toplam parça) döndürür
+
+        on_chunk(indeks, toplam, çıktı) satırlar hazır oldukça metindeki
+        sırayla çağrılır; çıktı satırın çevirisi ve ardındaki satır sonlarıdır,
+        yani olduğu gibi art arda eklenebilir.
+        """
+        parts = LINE_BREAKS.split(text)
+        segments = parts[0::2]
+        separators = parts[1::2] + [""]
+        ready = [None] * len(segments)
+        next_index = 0
+        lock = threading.Lock()
+
+        def on_segment(i, translation):
+            # Sıradaki satır hazır olduğu sürece sırayla bildir
+            nonlocal next_index
+            with lock:
+                ready[i] = translation
+                while next_index < len(segments) and ready[next_index] is not None:
+                    on_chunk(next_index, len(segments), ready[next_index] + separators[next_index])
+                    next_index += 1
+
+        translations, _, reused, total = self.translate_by_language_detailed(
+            segments, dest_lang, on_segment=on_segment if on_chunk is not None else None, **kwargs)
+        parts[0::2] = translations
+        translation = "".join(parts)
+        if any(isinstance(segment, OfflineTranslation) for segment in translations):
+            translation = OfflineTranslation(translation)
+        return translation, reused, total
+
+    def translate_file(self, input_path, output_path, src_lang, dest_lang,
+                       window_size=64 * 1024, on_progress=None, cancel_event=None, priority=0):
+        """Dosyayı dosyaya akış halinde çevir; bellek kullanımı dosya boyutundan bağımsızdır
+
+        Girdi window_size karakterlik pencerelerle okunur, her pencerenin
+        çevirisi biter bitmez diske yazılır. on_progress(okunan bayt, toplam bayt)
+        her pencereden sonra çağrılır. İptal edilirse o ana kadar yazılan
+        çeviri dosyada kalır. Dosya parçaları çeviri belleğine eklenmez.
+        """
+        total_bytes = os.path.getsize(input_path)
+        with open(input_path, "r", encoding="utf-8") as source, \
+                open(output_path, "w", encoding="utf-8") as target:
+            for text, separator in iter_windows(source, window_size):
+                if cancel_event is not None and cancel_event.is_set():
+                    raise TranslationCancelled()
+                if not text.strip():
+                    target.write(text)
+                elif src_lang == AUTO_LANGUAGE:
+                    target.write(self.translate_mixed(text, dest_lang, cancel_event=cancel_event,
+                                                      priority=priority, remember=False))
+                else:
+                    target.write(self.translate(text, src_lang, dest_lang, cancel_event=cancel_event,
+                                                priority=priority, remember=False))
+                target.write(separator)
+                target.flush()
+
+                if on_progress is not None:
+                    on_progress(min(source.buffer.tell(), total_bytes), total_bytes)
+
+    def close(self):
+        self.router.close()
+        self.backends.close()
+        self.cache.close()
+        self.offline.close()
@@ -0,0 +1,148 @@
+import itertools
+import queue
+import sys
+import threading
+import traceback
+
+from translation_engine import RequestSlots, TranslationCancelled
+
+# Öncelikler: küçük değer önce çalışır
+INTERACTIVE = 0
+BULK = 10
+
+
+class TranslationJob:
+    """Zamanlayıcıya gönderilen tek bir çeviri işi"""
+
+    def __init__(self, job_id, func, priority, group, on_done):
+        self.id = job_id
+        self.func = func
+        self.priority = priority
+        self.group = group
+        self.on_done = on_done
+        self.cancel_event = threading.Event()
+        # queued -> running -> done / failed / cancelled
+        self.state = "queued"
+        self.result = None
+        self.error = None
+
+    @property
+    def cancelled(self):
+        return self.cancel_event.is_set()
+
+    def cancel(self):
+        self.cancel_event.set()
+
+
+class TranslationScheduler:
+    """Tüm çeviri işlerinin sahibi olan öncelikli, iptal edilebilir zamanlayıcı
+
+    Etkileşimli işler hemen kendi thread'lerinde başlar; toplu işler öncelik
+    sırasıyla sınırlı sayıda çalıştırıcı thread'de yürütülür. Aynı gruba
+    gönderilen yeni iş eskisini iptal eder (ör. kullanıcı yeniden ÇEVİR'e
+    bastığında). Tüm işlerin arka uç istekleri ortak, öncelikli
+    RequestSlots üzerinden geçer; böylece toplu dosya işleri çalışırken kısa
+    etkileşimli metinler sıra beklemez.
+    """
+
+    def __init__(self, pipeline, max_concurrent_requests=4, max_bulk_jobs=2):
+        self.pipeline = pipeline
+        self.request_slots = RequestSlots(max_concurrent_requests)
+        self.pipeline.request_slots = self.request_slots
+
+        self.job_ids = itertools.count(1)
+        self.order = itertools.count()
+        self.jobs = {}
+        self.groups = {}
+        self.lock = threading.Lock()
+        self.pending = queue.PriorityQueue()
+
+        self.runners = []
+        for _ in range(max_bulk_jobs):
+            runner = threading.Thread(target=self._run)
+            runner.daemon = True
+            runner.start()
+            self.runners.append(runner)
+
+    def submit(self, func, priority=INTERACTIVE, group=None, on_done=None):
+        """func(job) çalıştıracak bir iş ekle ve TranslationJob döndür
+
+        func, job.cancel_event ve job.priority değerlerini hatta aktarmalıdır.
+        on_done(job) iş bittiğinde (başarılı, hatalı veya iptal) çalıştırıcı
+        thread'den çağrılır.
+        """
+        with self.lock:
+            job = TranslationJob(next(self.job_ids), func, priority, group, on_done)
+            self.jobs[job.id] = job
+            if group is not None:
+                # Aynı gruptaki eski iş artık geçersiz
+                previous = self.groups.get(group)
+                if previous is not None:
+                    previous.cancel()
+                self.groups[group] = job
+
+        if priority <= INTERACTIVE:
+            # Etkileşimli işler toplu işlerin bitmesini beklemez
+            runner = threading.Thread(target=self._execute, args=(job,))
+            runner.daemon = True
+            runner.start()
+        else:
+            self.pending.put((priority, next(self.order), job))
+        return job
+
+    def cancel(self, job_id):
+        with self.lock:
+            job = self.jobs.get(job_id)
+        if job is not None:
+            job.cancel()
+        return job is not None
+
+    def cancel_all(self):
+        with self.lock:
+            jobs = list(self.jobs.values())
+        for job in jobs:
+            job.cancel()
+
+    def active_jobs(self):
+        with self.lock:
+            return [job for job in self.jobs.values() if job.state in ("queued", "running")]
+
+    def _run(self):
+        while True:
+            _, _, job = self.pending.get()
+            if job is None:
+                return
+            self._execute(job)
+
+    def _execute(self, job):
+        if job.cancelled:
+            job.state = "cancelled"
+        else:
+            job.state = "running"
+            try:
+                job.result = job.func(job)
+                job.state = "cancelled" if job.cancelled else "done"
+            except TranslationCancelled:
+                job.state = "cancelled"
+            except Exception as e:
+                job.error = e
+                job.state = "failed"
+                print(f"Çeviri işi {job.id} hatası: {str(e)}", file=sys.stderr)
+                traceback.print_exc()
+
+        with self.lock:
+            self.jobs.pop(job.id, None)
+            if job.group is not None and self.groups.get(job.group) is job:
+                del self.groups[job.group]
+
+        if job.on_done is not None:
+            try:
+                job.on_done(job)
+            except Exception as e:
+                print(f"Çeviri işi {job.id} geri çağırma hatası: {str(e)}", file=sys.stderr)
+
+    def shutdown(self):
+        self.cancel_all()
+        for _ in self.runners:
+            # Sentinel her işten sonra gelsin
+            self.pending.put((float("inf"), next(self.order), None))
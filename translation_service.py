@@ -0,0 +1,303 @@
+"""Yerel HTTP/JSON çeviri servisi
+
+Masaüstü uygulamasıyla aynı çeviri hattını (TranslationPipeline) asyncio
+tabanlı bir HTTP sunucusu olarak açar; aynı makinedeki araçlar tek bir
+önbellek, istek bütçesi ve bağlantı havuzunu paylaşır. tkinter veya PIL içe
+aktarmaz.
+
+Uç noktalar:
+    POST /translate  {"text": "...", "source": "tr", "target": "en"}
+                     (birden çok metin için "text" yerine "texts": [...])
+    GET  /health     {"status": "ok"}
+    GET  /stats      servis, önbellek ve arka uç sayaçları, aşama süreleri
+    GET  /metrics    aynı metrikler Prometheus metin biçiminde
+
+Kullanım: python translation_service.py [--host 127.0.0.1] [--port 8765] [--batch-window 5]
+"""
+import argparse
+import asyncio
+import json
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http import HTTPStatus
+
+from translation_cache import TranslationCache
+from translation_pipeline import TranslationPipeline, SUPPORTED_LANGUAGES, AUTO_LANGUAGE
+
+# İstek gövdesi için üst sınır (bayt)
+MAX_BODY = 1024 * 1024
+
+# Süre metriklerinde ayrı etiketlenen yollar (diğerleri tek etikette toplanır)
+ENDPOINTS = ("/translate", "/health", "/stats", "/metrics")
+
+
+class ServiceOverloaded(Exception):
+    """Bekleyen çeviri sayısı sınırda; istemci daha sonra tekrar denemeli"""
+
+
+class BadRequest(Exception):
+    """İstek gövdesi veya parametreleri geçersiz"""
+
+
+class TranslationService:
+    """Eş zamanlı istekleri birleştiren ve küçük gruplar halinde çeviren asyncio servisi
+
+    Aynı (metin, kaynak, hedef) için eş zamanlı gelen istekler tek bir
+    çeviriyi bekler (single-flight). Farklı metinler batch_window saniye
+    içinde toplanır ve dil çifti başına en fazla max_batch metinlik gruplar
+    halinde pipeline.translate_many'ye verilir; hat bu grupları toplu arka uç
+    isteklerine çevirir. En fazla max_concurrent grup aynı anda çevrilir.
+    Sonuç bekleyen farklı metin sayısı max_pending'e ulaşınca yeni metinler
+    ServiceOverloaded ile reddedilir (HTTP 503).
+    """
+
+    def __init__(self, pipeline, batch_window=0.005, max_batch=50, max_pending=1000, max_concurrent=4):
+        self.pipeline = pipeline
+        self.batch_window = batch_window
+        self.max_batch = max_batch
+        self.max_pending = max_pending
+        self.executor = ThreadPoolExecutor(max_workers=max_concurrent, thread_name_prefix="service")
+        self.languages = set(SUPPORTED_LANGUAGES.values())
+        # (metin, kaynak, hedef) -> sonucu bekleyen asyncio.Future
+        self.inflight = {}
+        # (kaynak, hedef) -> gruplanmayı bekleyen metinler ve gönderim zamanlayıcısı
+        self.queues = {}
+        self.timers = {}
+        self.server = None
+
+        # Sayaçlar
+        self.requests = 0
+        self.coalesced = 0
+        self.rejected = 0
+        self.batches = 0
+        self.batched_texts = 0
+
+    async def translate(self, text, src_lang, dest_lang):
+        """Metni çevir; aynı metin zaten çevriliyorsa onun sonucunu bekle"""
+        self.requests += 1
+        key = (text, src_lang, dest_lang)
+        future = self.inflight.get(key)
+        if future is not None:
+            self.coalesced += 1
+            # shield: bir istemci bağlantıyı kapatsa da ortak sonuç iptal edilmez
+            return await asyncio.shield(future)
+        if len(self.inflight) >= self.max_pending:
+            self.rejected += 1
+            raise ServiceOverloaded(f"{len(self.inflight)} çeviri bekliyor")
+
+        loop = asyncio.get_running_loop()
+        future = self.inflight[key] = loop.create_future()
+        if src_lang == AUTO_LANGUAGE:
+            # Karışık dilli metin tek başına çevrilir (dil algılama metnin kendi satırlarıyla yapılır)
+            self._submit([key], lambda: [self.pipeline.translate_mixed(text, dest_lang)])
+        else:
+            pair = (src_lang, dest_lang)
+            queue = self.queues.setdefault(pair, [])
+            queue.append(text)
+            if len(queue) >= self.max_batch:
+                self._flush(pair)
+            elif pair not in self.timers:
+                self.timers[pair] = loop.call_later(self.batch_window, self._flush, pair)
+        return await asyncio.shield(future)
+
+    def _flush(self, pair):
+        timer = self.timers.pop(pair, None)
+        if timer is not None:
+            timer.cancel()
+        texts = self.queues.pop(pair, None)
+        if not texts:
+            return
+        self.batches += 1
+        self.batched_texts += len(texts)
+        src_lang, dest_lang = pair
+        self._submit([(text, src_lang, dest_lang) for text in texts],
+                     lambda: self.pipeline.translate_many(texts, src_lang, dest_lang))
+
+    def _submit(self, keys, func):
+        # Çeviri iş parçacığında çalışır; sonuçlar olay döngüsünde dağıtılır
+        job = asyncio.get_running_loop().run_in_executor(self.executor, func)
+
+        def done(job):
+            error = None if job.cancelled() else job.exception()
+            for i, key in enumerate(keys):
+                future = self.inflight.pop(key)
+                if future.done():
+                    continue
+                if job.cancelled():
+                    future.cancel()
+                elif error is not None:
+                    future.set_exception(error)
+                else:
+                    future.set_result(job.result()[i])
+
+        job.add_done_callback(done)
+
+    def stats(self):
+        return {
+            "requests": self.requests,
+            "coalesced": self.coalesced,
+            "rejected": self.rejected,
+            "batches": self.batches,
+            "batched_texts": self.batched_texts,
+            "pending": len(self.inflight),
+            "backends": self.pipeline.router.stats(),
+            "metrics": self.pipeline.metrics.snapshot()
+        }
+
+    async def handle_request(self, method, path, body):
+        """(HTTP durumu, JSON yanıtı) döndür; /metrics için yanıt düz metindir"""
+        if path == "/health":
+            return HTTPStatus.OK, {"status": "ok"}
+        if path == "/stats":
+            return HTTPStatus.OK, self.stats()
+        if path == "/metrics":
+            return HTTPStatus.OK, self.pipeline.metrics.to_prometheus()
+        if path != "/translate":
+            return HTTPStatus.NOT_FOUND, {"error": "bulunamadı"}
+        if method != "POST":
+            return HTTPStatus.METHOD_NOT_ALLOWED, {"error": "POST kullanın"}
+
+        try:
+            try:
+                data = json.loads(body)
+            except ValueError:
+                raise BadRequest("gövde geçerli bir JSON değil")
+            if not isinstance(data, dict):
+                raise BadRequest("gövde bir JSON nesnesi olmalı")
+            src_lang = data.get("source", "tr")
+            dest_lang = data.get("target", "en")
+            if src_lang not in self.languages and src_lang != AUTO_LANGUAGE:
+                raise BadRequest(f"desteklenmeyen kaynak dil: {src_lang}")
+            if dest_lang not in self.languages:
+                raise BadRequest(f"desteklenmeyen hedef dil: {dest_lang}")
+            if "texts" in data:
+                texts = data["texts"]
+                if not isinstance(texts, list) or not all(isinstance(text, str) for text in texts):
+                    raise BadRequest("'texts' metin listesi olmalı")
+                translations = await asyncio.gather(*(self.translate(text, src_lang, dest_lang)
+                                                      for text in texts))
+                return HTTPStatus.OK, {"translations": translations}
+            if not isinstance(data.get("text"), str):
+                raise BadRequest("'text' alanı gerekli")
+            return HTTPStatus.OK, {"translation": await self.translate(data["text"], src_lang, dest_lang)}
+        except BadRequest as e:
+            return HTTPStatus.BAD_REQUEST, {"error": str(e)}
+        except ServiceOverloaded as e:
+            return HTTPStatus.SERVICE_UNAVAILABLE, {"error": f"servis meşgul: {e}"}
+        except Exception as e:
+            print(f"Servis çeviri hatası: {str(e)}", file=sys.stderr)
+            return HTTPStatus.INTERNAL_SERVER_ERROR, {"error": str(e)}
+
+    async def handle_connection(self, reader, writer):
+        # Basit HTTP/1.1: Content-Length gövdeli istekler, keep-alive destekli
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line.strip():
+                    break
+                try:
+                    method, path, version = request_line.decode("latin-1").split()
+                except ValueError:
+                    await self._respond(writer, HTTPStatus.BAD_REQUEST, {"error": "geçersiz istek"}, False)
+                    break
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b"\r\n", b"\n", b""):
+                        break
+                    name, _, value = line.decode("latin-1").partition(":")
+                    headers[name.strip().lower()] = value.strip()
+
+                # HTTP/1.1'de bağlantı varsayılan olarak açık kalır, HTTP/1.0'da kapanır
+                connection = headers.get("connection", "").lower()
+                keep_alive = connection == "keep-alive" if version == "HTTP/1.0" else connection != "close"
+                length = int(headers.get("content-length") or 0)
+                if length > MAX_BODY:
+                    await self._respond(writer, HTTPStatus.REQUEST_ENTITY_TOO_LARGE,
+                                        {"error": "istek gövdesi çok büyük"}, False)
+                    break
+                body = await reader.readexactly(length) if length else b""
+                path = path.split("?", 1)[0]
+                start = time.perf_counter()
+                status, payload = await self.handle_request(method, path, body)
+                self.pipeline.metrics.observe("service_request_seconds", time.perf_counter() - start,
+                                              path=path if path in ENDPOINTS else "diğer", status=status.value)
+                await self._respond(writer, status, payload, keep_alive)
+                if not keep_alive:
+                    break
+        except (asyncio.IncompleteReadError, ConnectionError, ValueError):
+            pass
+        finally:
+            writer.close()
+
+    @staticmethod
+    async def _respond(writer, status, payload, keep_alive):
+        if isinstance(payload, str):
+            body = payload.encode("utf-8")
+            content_type = "text/plain; version=0.0.4; charset=utf-8"
+        else:
+            body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+            content_type = "application/json; charset=utf-8"
+        headers = [
+            f"HTTP/1.1 {status.value} {status.phrase}",
+            f"Content-Type: {content_type}",
+            f"Content-Length: {len(body)}",
+            "Connection: " + ("keep-alive" if keep_alive else "close")
+        ]
+        if status == HTTPStatus.SERVICE_UNAVAILABLE:
+            headers.append("Retry-After: 1")
+        writer.write(("\r\n".join(headers) + "\r\n\r\n").encode("latin-1") + body)
+        await writer.drain()
+
+    async def start(self, host="127.0.0.1", port=8765):
+        self.server = await asyncio.start_server(self.handle_connection, host, port)
+        return self.server
+
+    async def serve(self, host="127.0.0.1", port=8765):
+        server = await self.start(host, port)
+        address = server.sockets[0].getsockname()
+        print(f"Çeviri servisi http://{address[0]}:{address[1]} adresinde çalışıyor", file=sys.stderr)
+        async with server:
+            await server.serve_forever()
+
+    def close(self):
+        if self.server is not None:
+            self.server.close()
+        self.executor.shutdown(wait=False)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Çeviri hattını yerel HTTP/JSON servisi olarak çalıştır")
+    parser.add_argument("--host", default="127.0.0.1", help="dinlenecek adres")
+    parser.add_argument("--port", type=int, default=8765, help="dinlenecek port")
+    parser.add_argument("--cache", default="translation_cache.db", help="önbellek dosyası")
+    parser.add_argument("--workers", type=int, default=4, help="eş zamanlı arka uç isteği sayısı")
+    parser.add_argument("--rps", type=float, default=2.0, help="saniyedeki istek bütçesi")
+    parser.add_argument("--batch-window", type=float, default=5.0,
+                        help="metinlerin gruplanmak için beklediği süre (ms)")
+    parser.add_argument("--max-batch", type=int, default=50, help="bir gruptaki en fazla metin")
+    parser.add_argument("--max-pending", type=int, default=1000,
+                        help="bu kadar metin beklerken yeni istekler 503 ile reddedilir")
+    args = parser.parse_args(argv)
+
+    pipeline = TranslationPipeline(
+        cache=TranslationCache(args.cache),
+        max_workers=args.workers,
+        requests_per_second=args.rps,
+        on_status=lambda message: print(message, file=sys.stderr)
+    )
+    service = TranslationService(pipeline, batch_window=args.batch_window / 1000, max_batch=args.max_batch,
+                                 max_pending=args.max_pending, max_concurrent=args.workers)
+    try:
+        asyncio.run(service.serve(args.host, args.port))
+    except KeyboardInterrupt:
+        return 130
+    finally:
+        service.close()
+        pipeline.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
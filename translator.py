@@ -1,16 +1,18 @@
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog, scrolledtext
-from deep_translator import GoogleTranslator, single_detection
 import traceback
-import requests
-import time
-import re
-import json
 import os
-import threading
+import queue
 from tkinter import font
 from PIL import Image, ImageTk, ImageDraw
 from io import BytesIO
+from translation_cache import TranslationCache
+from translation_pipeline import TranslationPipeline, SUPPORTED_LANGUAGES, AUTO_LANGUAGE
+from translation_engine import OfflineTranslation, TranslationCancelled
+from translation_scheduler import TranslationScheduler, INTERACTIVE, BULK
+from language_detection import LanguageDetector
+from translation_history import TranslationHistory, HistoryPager
+from live_translation import LiveSession
 
 class TranslatorApp:
     def __init__(self, root):
@@ -52,33 +54,77 @@ class TranslatorApp:
         
         self.current_theme = "light"
         
-        # Çeviri geçmişi
-        self.history = []
-        self.history_file = "translation_history.json"
-        self.load_history()
-        
-        # Çeviri önbelleği
-        self.translation_cache = {}
+        # Çeviri geçmişi (eklemeli SQLite deposu; eski JSON dosyası ilk açılışta içe aktarılır)
+        self.history_store = TranslationHistory("translation_history.db")
+        # Geçmiş penceresi depodan kayıtları bu boyutta sayfalarla çeker
+        self.history_page_size = 100
+        # Arama kutusuna yazmayı bitirdikten sonra filtrelemeden önce beklenen süre (ms)
+        self.history_filter_delay = 250
         
         # Desteklenen diller
-        self.supported_languages = {
-            "Türkçe": "tr",
-            "İngilizce": "en",
-            "Almanca": "de",
-            "Fransızca": "fr",
-            "İspanyolca": "es",
-            "İtalyanca": "it",
-            "Rusça": "ru",
-            "Çince": "zh-CN",
-            "Japonca": "ja",
-            "Korece": "ko",
-            "Arapça": "ar"
+        self.supported_languages = SUPPORTED_LANGUAGES
+        # Kaynak dil olarak ayrıca karışık dilli metinler için otomatik seçenek
+        self.source_languages = dict(SUPPORTED_LANGUAGES)
+        self.source_languages["Otomatik (karışık)"] = AUTO_LANGUAGE
+        # Dil kodundan ad ve combobox sırasına hızlı erişim
+        self.language_names = {code: name for name, code in self.source_languages.items()}
+        self.source_language_index = {code: i for i, code in enumerate(self.source_languages.values())}
+        self.target_language_index = {code: i for i, code in enumerate(self.supported_languages.values())}
+        
+        # Bu boyutun üzerindeki dosyalar metin alanına yüklenmez, akış halinde çevrilir
+        self.large_file_size = 1024 * 1024
+        
+        # Çeviri hattı (önbellek, arka uçlar ve paralel çeviri ayarları)
+        self.pipeline = TranslationPipeline(
+            cache=TranslationCache("translation_cache.db"),
+            max_workers=4,
+            requests_per_second=2.0,
+            on_status=lambda message: self.post_event("status", message)
+        )
+        
+        # Yerel öncelikli dil algılayıcı (belirsiz sonuçlar için ağa sorar)
+        self.language_detector = LanguageDetector(self.pipeline.backends)
+        
+        # Arka plan thread'lerinden arayüze giden olay kuyruğu.
+        # Tkinter thread güvenli olmadığı için thread'ler widget'lara dokunmaz,
+        # yalnızca olay gönderir; ana döngü kuyruğu after() ile boşaltır.
+        self.ui_events = queue.Queue()
+        self.ui_event_handlers = {
+            "status": self.handle_status_event,
+            "progress": self.handle_progress_event,
+            "chunk": self.handle_chunk_event,
+            "translation_done": self.handle_translation_done_event,
+            "job_finished": self.handle_job_finished_event,
+            "language_detected": self.handle_language_detected_event,
+            "live_result": self.handle_live_result_event,
+            "error": self.handle_error_event
         }
+        self.ui_poll_interval = 50  # ms
+        
+        # Tüm çeviri işleri zamanlayıcı üzerinden çalışır; hedef metin alanı
+        # yalnızca en son metin işine aittir
+        self.scheduler = TranslationScheduler(self.pipeline, max_concurrent_requests=4)
+        self.active_job_id = None
+        # Bu uzunluğa kadar olan metinler etkileşimli öncelikle çevrilir
+        self.interactive_max_length = 2000
+        
+        # Canlı çeviri: yazma durduktan bu kadar sonra (ms) yalnızca değişen cümleler çevrilir
+        self.live_delay = 400
+        self.live_after_id = None
+        self.live_session = LiveSession(
+            self.scheduler, self.pipeline,
+            lambda job_id, translations: self.post_event("live_result", job_id, translations))
+        
+        # Çeviri belleğini geçmişteki çevirilerle arka planda doldur
+        self.scheduler.submit(
+            lambda job: self.pipeline.memory.load_history(self.history_store, max_length=self.pipeline.max_length),
+            priority=BULK)
         
         # Ana çerçeve
         self.root.configure(bg=self.colors[self.current_theme]["bg"])
         self.setup_ui()
         self.create_custom_styles()
+        self.root.after(self.ui_poll_interval, self.process_ui_events)
 
     # Metin logo oluşturma
     def create_text_logo(self, size=(50, 50)):
@@ -163,7 +209,7 @@ class TranslatorApp:
         
         self.src_lang_var = tk.StringVar()
         self.src_lang_combobox = ttk.Combobox(src_select_frame, textvariable=self.src_lang_var, 
-                                             values=list(self.supported_languages.keys()), 
+                                             values=list(self.source_languages.keys()), 
                                              state="readonly", width=15)
         self.src_lang_combobox.current(0)
         self.src_lang_combobox.pack(side="left", pady=5)
@@ -277,6 +323,17 @@ class TranslatorApp:
         load_button.bind("<Enter>", lambda e: e.widget.config(bg=self.colors[self.current_theme]["button_hover"]))
         load_button.bind("<Leave>", lambda e: e.widget.config(bg=self.colors[self.current_theme]["accent"]))
         
+        file_translate_button = tk.Button(src_buttons_frame, text="Dosyayı Çevir", 
+                                        command=self.translate_file,
+                                        bg=self.colors[self.current_theme]["accent"], 
+                                        fg=self.colors[self.current_theme]["button_text"],
+                                        font=self.button_font,
+                                        relief=tk.FLAT,
+                                        padx=8, pady=2)
+        file_translate_button.pack(side="left", padx=5)
+        file_translate_button.bind("<Enter>", lambda e: e.widget.config(bg=self.colors[self.current_theme]["button_hover"]))
+        file_translate_button.bind("<Leave>", lambda e: e.widget.config(bg=self.colors[self.current_theme]["accent"]))
+        
         # Kaynak metin alanı
         self.src_text = scrolledtext.ScrolledText(src_frame, height=10, width=30, 
                                                 font=("Segoe UI", 11), 
@@ -285,6 +342,9 @@ class TranslatorApp:
                                                 padx=10, pady=10,
                                                 relief=tk.FLAT)
         self.src_text.pack(fill="both", expand=True, padx=5, pady=(0, 5))
+        self.src_text.bind("<<Modified>>", self.on_source_modified)
+        self.src_lang_combobox.bind("<<ComboboxSelected>>", lambda e: self.schedule_live_translation())
+        self.dest_lang_combobox.bind("<<ComboboxSelected>>", lambda e: self.schedule_live_translation())
         
         # Hedef metin
         dest_frame = tk.Frame(text_frame, bg=self.colors[self.current_theme]["bg"],
@@ -353,6 +413,44 @@ class TranslatorApp:
         self.history_button.bind("<Enter>", lambda e: e.widget.config(bg="#e6e6e6" if self.current_theme == "light" else "#3a3a3a"))
         self.history_button.bind("<Leave>", lambda e: e.widget.config(bg=self.colors[self.current_theme]["bg"]))
         
+        # İptal butonu
+        self.cancel_button = tk.Button(bottom_frame, text="İptal", 
+                                     command=self.cancel_translations,
+                                     bg=self.colors[self.current_theme]["bg"], 
+                                     fg=self.colors[self.current_theme]["label"],
+                                     font=self.button_font,
+                                     relief=tk.FLAT, 
+                                     padx=10, pady=5,
+                                     borderwidth=1)
+        self.cancel_button.pack(side="left", padx=(10, 0))
+        self.cancel_button.bind("<Enter>", lambda e: e.widget.config(bg="#e6e6e6" if self.current_theme == "light" else "#3a3a3a"))
+        self.cancel_button.bind("<Leave>", lambda e: e.widget.config(bg=self.colors[self.current_theme]["bg"]))
+        
+        # Tanılama butonu
+        self.diagnostics_button = tk.Button(bottom_frame, text="Tanılama", 
+                                          command=self.show_diagnostics,
+                                          bg=self.colors[self.current_theme]["bg"], 
+                                          fg=self.colors[self.current_theme]["label"],
+                                          font=self.button_font,
+                                          relief=tk.FLAT, 
+                                          padx=10, pady=5,
+                                          borderwidth=1)
+        self.diagnostics_button.pack(side="left", padx=(10, 0))
+        self.diagnostics_button.bind("<Enter>", lambda e: e.widget.config(bg="#e6e6e6" if self.current_theme == "light" else "#3a3a3a"))
+        self.diagnostics_button.bind("<Leave>", lambda e: e.widget.config(bg=self.colors[self.current_theme]["bg"]))
+        
+        # Canlı çeviri seçeneği
+        self.live_var = tk.BooleanVar(value=False)
+        self.live_check = tk.Checkbutton(bottom_frame, text="Canlı çeviri",
+                                         variable=self.live_var,
+                                         command=self.toggle_live_translation,
+                                         bg=self.colors[self.current_theme]["bg"],
+                                         fg=self.colors[self.current_theme]["label"],
+                                         activebackground=self.colors[self.current_theme]["bg"],
+                                         selectcolor=self.colors[self.current_theme]["text_bg"],
+                                         font=self.button_font)
+        self.live_check.pack(side="left", padx=(10, 0))
+        
         # Durum çubuğu
         status_frame = tk.Frame(main_frame, bg=self.colors[self.current_theme]["bg"])
         status_frame.pack(fill="x", pady=(10, 0))
@@ -365,22 +463,9 @@ class TranslatorApp:
                                   font=("Segoe UI", 9), anchor="w")
         self.status_bar.pack(side="left", fill="x")
         
-        # Basit çeviri sözlüğü (çevrimdışı çalışması için)
-        self.basic_dictionary = {
-            # Türkçe-İngilizce
-            "merhaba": "hello", "selam": "hi", "nasılsın": "how are you", 
-            "teşekkürler": "thank you", "evet": "yes", "hayır": "no",
-            "ve": "and", "veya": "or", "ama": "but", "eğer": "if",
-            "ben": "I", "sen": "you", "o": "he/she/it", "biz": "we", 
-            "siz": "you", "onlar": "they", "bu": "this", "şu": "that",
-            
-            # İngilizce-Türkçe
-            "hello": "merhaba", "hi": "selam", "how are you": "nasılsın",
-            "thank you": "teşekkürler", "yes": "evet", "no": "hayır",
-            "and": "ve", "or": "veya", "but": "ama", "if": "eğer",
-            "i": "ben", "you": "sen", "he": "o", "she": "o", "it": "o",
-            "we": "biz", "they": "onlar", "this": "bu", "that": "şu"
-        }
+        # İlerleme göstergesi (parçalar geldikçe dolar)
+        self.progress_bar = ttk.Progressbar(status_frame, mode="determinate", length=180)
+        self.progress_bar.pack(side="right")
     
     def toggle_theme(self):
         if self.current_theme == "light":
@@ -421,11 +506,17 @@ class TranslatorApp:
             elif isinstance(widget, scrolledtext.ScrolledText) or isinstance(widget, tk.Text):
                 widget.configure(bg=self.colors[self.current_theme]["text_bg"])
             
+            elif isinstance(widget, tk.Checkbutton):
+                widget.configure(bg=self.colors[self.current_theme]["bg"],
+                               fg=self.colors[self.current_theme]["label"],
+                               activebackground=self.colors[self.current_theme]["bg"],
+                               selectcolor=self.colors[self.current_theme]["text_bg"])
+            
             elif isinstance(widget, tk.Button):
                 if widget == self.translate_button:
                     widget.configure(bg=self.colors[self.current_theme]["button"], 
                                    fg=self.colors[self.current_theme]["button_text"])
-                elif widget in [self.auto_detect_button] or "Kopyala" in str(widget['text']) or "Dosyadan Yükle" in str(widget['text']):
+                elif widget in [self.auto_detect_button] or "Kopyala" in str(widget['text']) or "Dosyadan Yükle" in str(widget['text']) or "Dosyayı Çevir" in str(widget['text']):
                     widget.configure(bg=self.colors[self.current_theme]["accent"],
                                    fg=self.colors[self.current_theme]["button_text"])
                 else:
@@ -461,6 +552,14 @@ class TranslatorApp:
             )
             
             if file_path:
+                # Büyük dosyaları metin alanına yüklemek yerine dosyadan dosyaya çevir
+                if os.path.getsize(file_path) > self.large_file_size:
+                    if messagebox.askyesno("Büyük Dosya",
+                                           "Dosya metin alanı için çok büyük. "
+                                           "Doğrudan başka bir dosyaya çevrilsin mi?"):
+                        self.translate_file(file_path)
+                    return
+                
                 with open(file_path, "r", encoding="utf-8") as file:
                     content = file.read()
                     self.src_text.delete("1.0", "end")
@@ -469,46 +568,58 @@ class TranslatorApp:
         except Exception as e:
             messagebox.showerror("Dosya Okuma Hatası", f"Dosya okunamadı: {str(e)}")
     
-    def load_history(self):
-        try:
-            if os.path.exists(self.history_file):
-                with open(self.history_file, "r", encoding="utf-8") as file:
-                    self.history = json.load(file)
-        except Exception as e:
-            print(f"Geçmiş yüklenirken hata: {str(e)}")
-            self.history = []
+    def translate_file(self, input_path=None):
+        if not input_path:
+            input_path = filedialog.askopenfilename(
+                title="Çevrilecek Dosyayı Seç",
+                filetypes=[("Metin Dosyaları", "*.txt"), ("Tüm Dosyalar", "*.*")]
+            )
+            if not input_path:
+                return
+        
+        src_lang = self.source_languages[self.src_lang_var.get()]
+        dest_lang = self.supported_languages[self.dest_lang_var.get()]
+        
+        base, ext = os.path.splitext(input_path)
+        output_path = filedialog.asksaveasfilename(
+            title="Çeviriyi Kaydet",
+            initialfile=os.path.basename(f"{base}.{dest_lang}{ext or '.txt'}"),
+            defaultextension=".txt",
+            filetypes=[("Metin Dosyaları", "*.txt"), ("Tüm Dosyalar", "*.*")]
+        )
+        if not output_path:
+            return
+        
+        def on_progress(done, total):
+            percent = int(done * 100 / total) if total else 100
+            self.post_event("status", f"Dosya çevriliyor... %{percent}")
+            self.post_event("progress", done, total)
+        
+        def run(job):
+            try:
+                self.pipeline.translate_file(input_path, output_path, src_lang, dest_lang,
+                                             on_progress=on_progress,
+                                             cancel_event=job.cancel_event, priority=job.priority)
+                self.post_event("status", f"Dosya çevrildi: {os.path.basename(output_path)}")
+            except TranslationCancelled:
+                self.post_event("status", "Dosya çevirisi iptal edildi")
+            except Exception as e:
+                print(f"Dosya çeviri hatası: {str(e)}")
+                self.post_event("status", "Dosya çevirisi başarısız")
+                self.post_event("error", "Hata", f"Dosya çevrilemedi:\n{str(e)}")
+        
+        # Dosya çevirisi toplu iş olarak arka planda çalışır
+        self.scheduler.submit(run, priority=BULK)
     
-    def save_history(self):
+    def add_to_history(self, source_text, translated_text, source_lang, target_lang):
+        # Tek bir kayıt eklenir, dosya baştan yazılmaz
         try:
-            # En son 20 çeviri kaydedilsin
-            if len(self.history) > 20:
-                self.history = self.history[-20:]
-                
-            with open(self.history_file, "w", encoding="utf-8") as file:
-                json.dump(self.history, file, ensure_ascii=False, indent=2)
+            self.history_store.add(source_text, translated_text, source_lang, target_lang)
         except Exception as e:
             print(f"Geçmiş kaydedilirken hata: {str(e)}")
     
-    def add_to_history(self, source_text, translated_text, source_lang, target_lang):
-        # Çok uzun metinlerde ilk 100 karakter kaydedilsin
-        if len(source_text) > 100:
-            display_source = source_text[:100] + "..."
-        else:
-            display_source = source_text
-            
-        self.history.append({
-            "source": display_source,
-            "full_source": source_text,
-            "translation": translated_text,
-            "source_lang": source_lang,
-            "target_lang": target_lang,
-            "timestamp": time.strftime("%Y-%m-%d %H:%M:%S")
-        })
-        
-        self.save_history()
-    
     def show_history(self):
-        if not self.history:
+        if not len(self.history_store):
             messagebox.showinfo("Geçmiş", "Henüz çeviri geçmişi bulunmuyor.")
             return
             
@@ -529,6 +640,21 @@ class TranslatorApp:
                 bg=self.colors[self.current_theme]["bg"],
                 fg=self.colors[self.current_theme]["accent"]).pack(side="left")
         
+        # Arama kutusu (kaynak metin ve çevirilerde indeksli arama)
+        search_var = tk.StringVar()
+        search_entry = tk.Entry(title_frame, textvariable=search_var,
+                              font=("Segoe UI", 10),
+                              bg=self.colors[self.current_theme]["text_bg"],
+                              fg=self.colors[self.current_theme]["label"],
+                              relief=tk.FLAT,
+                              highlightbackground=self.colors[self.current_theme]["border"],
+                              highlightthickness=1)
+        search_entry.pack(side="right", ipady=3)
+        tk.Label(title_frame, text="Ara:", 
+                font=("Segoe UI", 10), 
+                bg=self.colors[self.current_theme]["bg"],
+                fg=self.colors[self.current_theme]["label"]).pack(side="right", padx=5)
+        
         # Liste çerçevesi
         list_frame = tk.Frame(history_window, bg=self.colors[self.current_theme]["bg"],
                             padx=15, pady=10)  # Tuple formatı yerine tek sayı kullanıyorum
@@ -541,7 +667,7 @@ class TranslatorApp:
                                highlightthickness=1)
         listbox_frame.pack(fill="both", expand=True)
         
-        # Geçmiş listesi
+        # Geçmiş listesi (sanal: yalnızca görünen satırlar listbox'a eklenir)
         history_listbox = tk.Listbox(listbox_frame, 
                                    font=("Segoe UI", 10),
                                    bg=self.colors[self.current_theme]["text_bg"],
@@ -549,23 +675,124 @@ class TranslatorApp:
                                    selectbackground=self.colors[self.current_theme]["button"],
                                    selectforeground="white",
                                    borderwidth=0,
-                                   highlightthickness=0)
-        history_listbox.pack(fill="both", expand=True, padx=2, pady=2)
+                                   highlightthickness=0,
+                                   exportselection=False)
         
-        # Kaydırma çubuğu
-        scrollbar = ttk.Scrollbar(listbox_frame, command=history_listbox.yview)
+        # Kaydırma çubuğu listbox'a değil, tüm sonuç kümesine göre ayarlanır
+        scrollbar = ttk.Scrollbar(listbox_frame)
         scrollbar.pack(side="right", fill="y")
-        history_listbox.config(yscrollcommand=scrollbar.set)
+        history_listbox.pack(fill="both", expand=True, padx=2, pady=2)
+        
+        row_height = font.Font(font=("Segoe UI", 10)).metrics("linespace") + 1
+        alternate_bg = "#f5f5f5" if self.current_theme == "light" else "#3a3a3a"
         
-        # Listbox'a geçmiş öğeleri ekle (ters sırayla - en yeni üstte)
-        for i, item in enumerate(reversed(self.history)):
-            date_time = item['timestamp']
-            text_preview = item['source']
-            history_listbox.insert(tk.END, f"{date_time} - {text_preview}")
+        # Görünüm durumu: sorgu sonuçları, ilk görünen satır, görünen satır sayısı, seçili satır
+        view = {"pager": HistoryPager(self.history_store, page_size=self.history_page_size),
+                "top": 0, "visible": 15, "selected": None, "filter_job": None}
+        
+        def render():
+            total = len(view["pager"])
+            view["top"] = max(0, min(view["top"], total - view["visible"]))
+            top = view["top"]
+            
+            history_listbox.delete(0, tk.END)
+            for i, item in enumerate(view["pager"].rows(top, view["visible"])):
+                history_listbox.insert(tk.END, f"{item['timestamp']} - {item['source']}")
+                
+                # Alternatif satırlara arka plan rengi ekle (mutlak sıraya göre)
+                if (top + i) % 2 == 1:
+                    history_listbox.itemconfig(i, bg=alternate_bg)
             
-            # Alternatif satırlara arka plan rengi ekle
-            if i % 2 == 1:
-                history_listbox.itemconfig(i, bg="#f5f5f5" if self.current_theme == "light" else "#3a3a3a")
+            if view["selected"] is not None and top <= view["selected"] < top + view["visible"]:
+                history_listbox.selection_set(view["selected"] - top)
+            
+            if total:
+                scrollbar.set(top / total, min(1.0, (top + view["visible"]) / total))
+            else:
+                scrollbar.set(0, 1)
+        
+        def scroll_to(top):
+            if top != view["top"]:
+                view["top"] = top
+                render()
+        
+        def on_scrollbar(*args):
+            if args[0] == "moveto":
+                scroll_to(int(float(args[1]) * len(view["pager"])))
+            elif args[0] == "scroll":
+                step = int(args[1]) * (view["visible"] if args[2] == "pages" else 1)
+                scroll_to(view["top"] + step)
+        
+        def on_mousewheel(event):
+            if getattr(event, "num", None) == 4:
+                step = -3
+            elif getattr(event, "num", None) == 5:
+                step = 3
+            else:
+                step = -3 if event.delta > 0 else 3
+            scroll_to(max(0, view["top"] + step))
+            return "break"
+        
+        def on_resize(event):
+            visible = max(1, event.height // row_height)
+            if visible != view["visible"]:
+                view["visible"] = visible
+                render()
+        
+        def on_select(event=None):
+            selection = history_listbox.curselection()
+            if selection:
+                view["selected"] = view["top"] + selection[0]
+        
+        def move_selection(step):
+            total = len(view["pager"])
+            if not total:
+                return "break"
+            current = view["selected"] if view["selected"] is not None else view["top"] - step
+            selected = max(0, min(total - 1, current + step))
+            view["selected"] = selected
+            # Seçim görünür alanın dışına çıkarsa görünümü kaydır
+            if selected < view["top"]:
+                view["top"] = selected
+            elif selected >= view["top"] + view["visible"]:
+                view["top"] = selected - view["visible"] + 1
+            history_listbox.selection_clear(0, tk.END)
+            render()
+            return "break"
+        
+        def apply_filter():
+            # Yeni sorgu: sonuçlar yine sayfa sayfa, görünür oldukça çekilir
+            view["filter_job"] = None
+            view["pager"] = HistoryPager(self.history_store, search_var.get().strip() or None,
+                                         page_size=self.history_page_size)
+            view["top"] = 0
+            view["selected"] = None
+            render()
+        
+        def on_search_changed(*args):
+            # Her tuşta değil, yazma duraksadığında filtrele
+            if view["filter_job"] is not None:
+                history_window.after_cancel(view["filter_job"])
+            view["filter_job"] = history_window.after(self.history_filter_delay, apply_filter)
+        
+        def selected_item():
+            if view["selected"] is None:
+                return None
+            return view["pager"].get(view["selected"])
+        
+        scrollbar.config(command=on_scrollbar)
+        history_listbox.bind("<Configure>", on_resize)
+        history_listbox.bind("<<ListboxSelect>>", on_select)
+        history_listbox.bind("<MouseWheel>", on_mousewheel)
+        history_listbox.bind("<Button-4>", on_mousewheel)
+        history_listbox.bind("<Button-5>", on_mousewheel)
+        history_listbox.bind("<Up>", lambda e: move_selection(-1))
+        history_listbox.bind("<Down>", lambda e: move_selection(1))
+        history_listbox.bind("<Prior>", lambda e: move_selection(-view["visible"]))
+        history_listbox.bind("<Next>", lambda e: move_selection(view["visible"]))
+        search_var.trace_add("write", on_search_changed)
+        search_entry.bind("<Return>", lambda e: apply_filter())
+        render()
         
         # Butonlar
         button_frame = tk.Frame(history_window, bg=self.colors[self.current_theme]["bg"], padx=15)
@@ -573,7 +800,7 @@ class TranslatorApp:
         
         # Çeviriyi yükle butonu
         load_button = tk.Button(button_frame, text="Çeviriyi Yükle", 
-                              command=lambda: self.load_from_history(history_listbox.curselection()),
+                              command=lambda: self.load_from_history(selected_item()),
                               bg=self.colors[self.current_theme]["button"], 
                               fg=self.colors[self.current_theme]["button_text"],
                               font=self.button_font,
@@ -602,18 +829,16 @@ class TranslatorApp:
         details_frame.pack(fill="x", pady=10)
         
         # Çift tıklama ile çeviriyi yükleme
-        history_listbox.bind("<Double-Button-1>", lambda e: self.load_from_history(history_listbox.curselection()))
+        history_listbox.bind("<Double-Button-1>", lambda e: self.load_from_history(selected_item()))
         
         # Seçili öğenin detaylarını göstermek için fonksiyon
         def show_details(event=None):
-            selection = history_listbox.curselection()
-            if selection:
-                index = len(self.history) - 1 - selection[0]
-                item = self.history[index]
+            item = selected_item()
+            if item:
                 messagebox.showinfo("Çeviri Detayları", 
                                   f"Tarih: {item['timestamp']}\n\n"
-                                  f"Kaynak Dil: {list(self.supported_languages.keys())[list(self.supported_languages.values()).index(item['source_lang'])]}\n"
-                                  f"Hedef Dil: {list(self.supported_languages.keys())[list(self.supported_languages.values()).index(item['target_lang'])]}\n\n"
+                                  f"Kaynak Dil: {self.language_names.get(item['source_lang'], item['source_lang'])}\n"
+                                  f"Hedef Dil: {self.language_names.get(item['target_lang'], item['target_lang'])}\n\n"
                                   f"Kaynak Metin: {item['full_source'][:150]}{'...' if len(item['full_source']) > 150 else ''}\n\n"
                                   f"Çeviri: {item['translation'][:150]}{'...' if len(item['translation']) > 150 else ''}")
         
@@ -631,25 +856,87 @@ class TranslatorApp:
         details_button.bind("<Enter>", lambda e: e.widget.config(bg="#e6e6e6" if self.current_theme == "light" else "#3a3a3a"))
         details_button.bind("<Leave>", lambda e: e.widget.config(bg=self.colors[self.current_theme]["bg"]))
     
-    def load_from_history(self, selection):
-        if not selection:
+    def show_diagnostics(self):
+        """Aşama süreleri ve arka uç sayaçlarını gösteren, kendini yenileyen pencere"""
+        metrics = self.pipeline.metrics
+        diagnostics_window = tk.Toplevel(self.root)
+        diagnostics_window.title("Tanılama")
+        diagnostics_window.geometry("760x480")
+        diagnostics_window.transient(self.root)
+        diagnostics_window.configure(bg=self.colors[self.current_theme]["bg"])
+        
+        report_text = scrolledtext.ScrolledText(diagnostics_window, wrap=tk.NONE,
+                                                font=("Consolas", 9),
+                                                bg=self.colors[self.current_theme]["text_bg"],
+                                                fg=self.colors[self.current_theme]["label"],
+                                                relief=tk.FLAT)
+        report_text.pack(fill="both", expand=True, padx=15, pady=(15, 5))
+        
+        def update_report():
+            report = metrics.report()
+            if report != report_text.get("1.0", "end-1c"):
+                # Kaydırma konumu korunur, yalnızca içerik değişir
+                view = report_text.yview()[0]
+                report_text.config(state="normal")
+                report_text.delete("1.0", "end")
+                report_text.insert("1.0", report)
+                report_text.config(state="disabled")
+                report_text.yview_moveto(view)
+        
+        def refresh():
+            # Pencere açık kaldıkça her saniye yenilenir
+            if diagnostics_window.winfo_exists():
+                update_report()
+                diagnostics_window.after(1000, refresh)
+        
+        def save_json():
+            file_path = filedialog.asksaveasfilename(
+                parent=diagnostics_window,
+                title="Metrikleri Kaydet",
+                defaultextension=".json",
+                filetypes=[("JSON Dosyaları", "*.json"), ("Tüm Dosyalar", "*.*")]
+            )
+            if not file_path:
+                return
+            try:
+                metrics.dump(file_path)
+                self.status_var.set(f"Metrikler kaydedildi: {os.path.basename(file_path)}")
+            except Exception as e:
+                messagebox.showerror("Kaydetme Hatası", f"Metrikler kaydedilemedi: {str(e)}",
+                                     parent=diagnostics_window)
+        
+        def reset():
+            metrics.reset()
+            update_report()
+        
+        button_frame = tk.Frame(diagnostics_window, bg=self.colors[self.current_theme]["bg"])
+        button_frame.pack(fill="x", padx=15, pady=(5, 15))
+        for text, command in (("Kapat", diagnostics_window.destroy), ("Sıfırla", reset), ("JSON Kaydet", save_json)):
+            button = tk.Button(button_frame, text=text, command=command,
+                               bg=self.colors[self.current_theme]["bg"], 
+                               fg=self.colors[self.current_theme]["label"],
+                               font=self.button_font,
+                               relief=tk.FLAT, padx=10, pady=5,
+                               highlightbackground=self.colors[self.current_theme]["border"],
+                               highlightthickness=1)
+            button.pack(side="right", padx=(10, 0))
+        
+        refresh()
+    
+    def load_from_history(self, item):
+        if not item:
             messagebox.showinfo("Seçim", "Lütfen bir çeviri seçin.")
             return
-            
-        # Seçilen öğeyi al (listbox ters sıralı olduğu için indeksi düzelt)
-        index = len(self.history) - 1 - selection[0]
-        item = self.history[index]
         
         # Kaynak metni ve dilleri yükle
         self.src_text.delete("1.0", "end")
         self.src_text.insert("1.0", item["full_source"])
         
         # Dilleri ayarla
-        for i, lang in enumerate(self.supported_languages.keys()):
-            if self.supported_languages[lang] == item["source_lang"]:
-                self.src_lang_combobox.current(i)
-            if self.supported_languages[lang] == item["target_lang"]:
-                self.dest_lang_combobox.current(i)
+        if item["source_lang"] in self.source_language_index:
+            self.src_lang_combobox.current(self.source_language_index[item["source_lang"]])
+        if item["target_lang"] in self.target_language_index:
+            self.dest_lang_combobox.current(self.target_language_index[item["target_lang"]])
     
     def auto_detect_language(self):
         text = self.src_text.get("1.0", "end-1c")
@@ -659,82 +946,50 @@ class TranslatorApp:
             return
             
         self.status_var.set("Dil algılanıyor...")
-        self.root.update()
         
-        try:
-            # Kısa bir metin parçası al (algılama için yeterlidir)
-            sample = text[:100] if len(text) > 100 else text
-            
-            # GoogleTranslator ile dil algılama denemeleri
+        # Algılama arayüz thread'ini bloklamaz; sonuç olay olarak gelir
+        def run(job):
             try:
-                translator = GoogleTranslator(source='auto', target='en')
-                detected_lang = translator.detect(sample)
-            except:
-                # Basit dil algılama mantığı
-                detected_lang = self.simple_detect_language(sample)
-            
-            # Algılanan dile göre combobox'ı ayarla
-            found = False
-            for i, lang_name in enumerate(self.supported_languages.keys()):
-                if self.supported_languages[lang_name] == detected_lang:
-                    self.src_lang_combobox.current(i)
-                    found = True
-                    break
-            
-            if found:
-                self.status_var.set(f"Dil algılandı: {list(self.supported_languages.keys())[list(self.supported_languages.values()).index(detected_lang)]}")
-            else:
-                # Varsayılan olarak İngilizce veya Türkçe
-                if detected_lang == "en":
-                    self.src_lang_combobox.current(1)  # İngilizce
-                    self.status_var.set(f"Dil algılandı: İngilizce")
-                else:
-                    self.src_lang_combobox.current(0)  # Türkçe
-                    self.status_var.set(f"Dil algılandı: Türkçe")
-        
-        except Exception as e:
-            print(f"Dil algılama hatası: {str(e)}")
+                detected_lang = self.language_detector.detect(text)
+            except Exception as e:
+                print(f"Dil algılama hatası: {str(e)}")
+                detected_lang = None
+            if not job.cancelled:
+                self.post_event("language_detected", detected_lang)
+        
+        self.scheduler.submit(run, priority=INTERACTIVE, group="detect")
+    
+    def handle_language_detected_event(self, detected_lang):
+        if detected_lang is None:
             # Hata durumunda varsayılan olarak Türkçe seç
             self.src_lang_combobox.current(0)  # Türkçe
             self.status_var.set("Dil algılanamadı, varsayılan olarak Türkçe seçildi")
-    
-    # Basit dil algılama - en yaygın dilleri tespit eden basit bir algoritma
-    def simple_detect_language(self, text):
-        text = text.lower()
-        
-        # Türkçe'ye özgü karakterler
-        tr_chars = {'ç', 'ğ', 'ı', 'ö', 'ş', 'ü'}
-        # İngilizce'ye özgü karakter grupları
-        en_patterns = ['th', 'wh', 'ph']
-        
-        # Türkçe karakterlerin sayısını say
-        tr_count = sum(1 for c in text if c in tr_chars)
-        
-        # İngilizce pattern sayısını say
-        en_count = sum(1 for p in en_patterns if p in text)
-        
-        # Eğer Türkçe karakterler varsa muhtemelen Türkçe
-        if tr_count > 0:
-            return "tr"
-        # Eğer İngilizce patternler varsa muhtemelen İngilizce
-        elif en_count > 0:
-            return "en"
-        # Sonuç belirsizse karakter frekans analizi yap
+            return
+        
+        # Algılanan dile göre combobox'ı ayarla
+        for i, (lang_name, code) in enumerate(self.supported_languages.items()):
+            if code == detected_lang:
+                self.src_lang_combobox.current(i)
+                self.status_var.set(f"Dil algılandı: {lang_name}")
+                return
+        
+        # Varsayılan olarak İngilizce veya Türkçe
+        if detected_lang == "en":
+            self.src_lang_combobox.current(1)  # İngilizce
+            self.status_var.set(f"Dil algılandı: İngilizce")
         else:
-            # İngilizce'de sık kullanılan kelimeleri say
-            en_words = ['the', 'a', 'an', 'and', 'or', 'but', 'i', 'you', 'he', 'she', 'it', 'we', 'they']
-            tr_words = ['ve', 'veya', 'ama', 'ben', 'sen', 'o', 'biz', 'siz', 'onlar', 'bu', 'şu', 'için']
-            
-            words = text.split()
-            en_word_count = sum(1 for w in words if w in en_words)
-            tr_word_count = sum(1 for w in words if w in tr_words)
-            
-            return "en" if en_word_count > tr_word_count else "tr"
+            self.src_lang_combobox.current(0)  # Türkçe
+            self.status_var.set(f"Dil algılandı: Türkçe")
     
     def swap_languages(self):
         src_index = self.src_lang_combobox.current()
         dest_index = self.dest_lang_combobox.current()
         
+        # Otomatik kaynak dil hedef dil olamaz
+        if self.source_languages[self.src_lang_var.get()] == AUTO_LANGUAGE:
+            self.status_var.set("Otomatik kaynak dil hedef dil olarak seçilemez")
+            return
+        
         self.src_lang_combobox.current(dest_index)
         self.dest_lang_combobox.current(src_index)
         
@@ -748,206 +1003,183 @@ class TranslatorApp:
         if dest_text:
             self.src_text.insert("1.0", dest_text)
     
-    # Metni parçalara ayırma (maksimum uzunluk sınırı için)
-    def split_text(self, text, max_length=4500):
-        # Boş metin kontrolü
-        if not text:
-            return []
-            
-        # Metin yeterince kısa ise, doğrudan döndür
-        if len(text) <= max_length:
-            return [text]
-            
-        chunks = []
-        
-        # Metin çok uzunsa, cümlelere ayırıyoruz
-        sentences = re.split(r'(?<=[.!?])\s+', text)
-        current_chunk = ""
-        
-        for sentence in sentences:
-            # Tek bir cümle çok uzunsa, kelimelere ayırıyoruz
-            if len(sentence) > max_length:
-                if current_chunk:
-                    chunks.append(current_chunk)
-                    current_chunk = ""
-                
-                words = sentence.split()
-                word_chunk = ""
-                
-                for word in words:
-                    if len(word_chunk) + len(word) + 1 <= max_length:
-                        word_chunk += word + " "
-                    else:
-                        chunks.append(word_chunk.strip())
-                        word_chunk = word + " "
-                
-                if word_chunk:
-                    current_chunk = word_chunk
-            else:
-                # Cümle eklendiğinde chunk fazla uzun olmayacaksa ekle
-                if len(current_chunk) + len(sentence) + 1 <= max_length:
-                    current_chunk += sentence + " "
-                else:
-                    chunks.append(current_chunk.strip())
-                    current_chunk = sentence + " "
-        
-        # Son chunk'ı da ekliyoruz
-        if current_chunk:
-            chunks.append(current_chunk.strip())
-            
-        return chunks
+    def post_event(self, kind, *args):
+        """Herhangi bir thread'den arayüze olay gönder"""
+        self.ui_events.put((kind, args))
     
-    # Alternatif çeviri yöntemi: LibreTranslate
-    def translate_with_libre(self, text, source, target):
+    def process_ui_events(self):
+        """Olay kuyruğunu ana thread'de boşalt ve tekrar planla"""
         try:
-            # LibreTranslate API'si ile çeviri (API anahtarı gerektirmez)
-            url = "https://translate.argosopentech.com/translate"
-            data = {
-                "q": text,
-                "source": source,
-                "target": target
-            }
-            response = requests.post(url, json=data, timeout=5)  # 5 saniye timeout eklendi
-            response.raise_for_status()  # HTTP hataları için
-            return response.json()["translatedText"]
-        except Exception as e:
-            print(f"LibreTranslate hatası: {str(e)}")
-            raise e
-             
-    # Basit çevrimdışı çeviri
-    def offline_translate(self, text, src_lang, dest_lang):
-        # Küçük harfe çeviriyoruz
-        text_lower = text.lower()
-        
-        # Eğer tam bir eşleşme varsa doğrudan döndür
-        if text_lower in self.basic_dictionary:
-            return self.basic_dictionary[text_lower]
-             
-        # Kelime kelime çeviri yapalım
-        words = text_lower.split()
-        translated_words = []
-        
-        for word in words:
-            # Noktalama işaretlerini temizle
-            clean_word = re.sub(r'[^\w\s]', '', word)
-            
-            if clean_word in self.basic_dictionary:
-                # Eğer kelime sözlükte varsa, çevirisini ekle
-                translated_word = self.basic_dictionary[clean_word]
-                
-                # Orijinal kelimede büyük harf varsa, çeviride de uygula
-                if word[0].isupper():
-                    translated_word = translated_word[0].upper() + translated_word[1:]
-                    
-                translated_words.append(translated_word)
-            else:
-                # Kelime sözlükte yoksa, olduğu gibi bırak
-                translated_words.append(word)
-                
-        return " ".join(translated_words)
+            while True:
+                kind, args = self.ui_events.get_nowait()
+                try:
+                    self.ui_event_handlers[kind](*args)
+                except Exception as e:
+                    print(f"Arayüz olayı işlenemedi ({kind}): {str(e)}")
+        except queue.Empty:
+            pass
+        self.root.after(self.ui_poll_interval, self.process_ui_events)
     
-    def start_translation(self):
-        # Çeviriyi ayrı bir thread'de başlat
-        translation_thread = threading.Thread(target=self.translate_text)
-        translation_thread.daemon = True
-        translation_thread.start()
-
-    def translate_text(self):
-        # Çeviri düğmesini devre dışı bırak
-        self.translate_button.config(state="disabled")
+    def handle_status_event(self, message):
+        self.status_var.set(message)
+    
+    def handle_progress_event(self, value, maximum):
+        self.progress_bar.config(maximum=maximum or 1, value=value)
+    
+    def handle_chunk_event(self, job_id, index, total, translated_chunk):
+        # Eski işlerin parçaları hedef alana yazılmaz
+        if job_id != self.active_job_id:
+            return
+        # Parça, özgün boşluk ve satır yapısıyla birlikte gelir
+        with self.pipeline.metrics.timer("stage_seconds", stage="ui_insert"):
+            self.dest_text.insert("end", translated_chunk)
+        self.progress_bar.config(maximum=total, value=index + 1)
+        if total > 1:
+            self.status_var.set(f"Çeviriliyor... ({index + 1}/{total})")
+    
+    def handle_translation_done_event(self, job_id, source_text, full_translation, src_lang, dest_lang, reused, total):
+        # Geçmişe ekle; çevrimdışı (kelime kelime) çeviriler geçmişe ve dolayısıyla
+        # açılışta doldurulan çeviri belleğine girmez
+        if not isinstance(full_translation, OfflineTranslation):
+            self.add_to_history(source_text, full_translation, src_lang, dest_lang)
         
+        if job_id != self.active_job_id:
+            return
+        if total and reused == total:
+            self.status_var.set("Çeviri önbellekten alındı")
+        elif reused:
+            self.status_var.set(f"Çeviri tamamlandı ({reused}/{total} parça önbellekten)")
+        else:
+            self.status_var.set("Çeviri tamamlandı")
+    
+    def handle_job_finished_event(self, job_id, state):
+        if job_id == self.active_job_id and state == "cancelled":
+            self.status_var.set("Çeviri iptal edildi")
+    
+    def handle_error_event(self, title, message):
+        messagebox.showerror(title, message)
+    
+    def start_translation(self):
         text_to_translate = self.src_text.get("1.0", "end-1c")
         
         if not text_to_translate.strip():
             messagebox.showinfo("Uyarı", "Lütfen çevrilecek bir metin girin.")
-            self.translate_button.config(state="normal")
             return
         
+        src_lang = self.source_languages[self.src_lang_var.get()]
+        dest_lang = self.supported_languages[self.dest_lang_var.get()]
+        
+        # Elle başlatılan çeviri hedef alanı devralır; canlı sonuçlar üzerine yazmasın
+        self.live_session.cancel()
+        self.dest_text.delete("1.0", "end")
+        self.progress_bar.config(value=0)
         self.status_var.set("Çeviriliyor...")
-        self.root.update()
         
+        # Kısa metinler toplu işlerin önüne geçer. Aynı gruptaki yeni iş
+        # eskisini iptal eder ve hedef metin alanını devralır.
+        priority = INTERACTIVE if len(text_to_translate) <= self.interactive_max_length else BULK
+        job = self.scheduler.submit(
+            lambda job: self.translate_text(job, text_to_translate, src_lang, dest_lang),
+            priority=priority,
+            group="text",
+            on_done=lambda job: self.post_event("job_finished", job.id, job.state)
+        )
+        self.active_job_id = job.id
+    
+    def cancel_translations(self):
+        self.scheduler.cancel_all()
+        self.live_session.cancel()
+        self.status_var.set("Çeviriler iptal ediliyor...")
+    
+    def on_source_modified(self, event=None):
+        # <<Modified>> yalnızca bayrak kalkarken tetiklenir; bir sonraki değişiklik için sıfırla
+        self.src_text.edit_modified(False)
+        self.schedule_live_translation()
+    
+    def schedule_live_translation(self):
+        """Canlı moddaysa çeviriyi yazma durana kadar ertele (debounce)"""
+        if not self.live_var.get():
+            return
+        if self.live_after_id is not None:
+            self.root.after_cancel(self.live_after_id)
+        self.live_after_id = self.root.after(self.live_delay, self.live_translate)
+    
+    def toggle_live_translation(self):
+        if self.live_var.get():
+            self.live_translate()
+        else:
+            if self.live_after_id is not None:
+                self.root.after_cancel(self.live_after_id)
+                self.live_after_id = None
+            self.live_session.cancel()
+            self.status_var.set("Hazır")
+    
+    def live_translate(self):
+        self.live_after_id = None
+        text = self.src_text.get("1.0", "end-1c")
+        src_lang = self.source_languages[self.src_lang_var.get()]
+        dest_lang = self.supported_languages[self.dest_lang_var.get()]
+        
+        # Elle başlatılmış işin parçaları artık hedef alana yazılmaz
+        self.active_job_id = None
+        self.live_session.update(text, src_lang, dest_lang)
+        self.render_live_translation()
+    
+    def render_live_translation(self):
+        translation = self.live_session.render()
+        if translation != self.dest_text.get("1.0", "end-1c"):
+            # Kaydırma konumu korunur, yalnızca içerik değişir
+            with self.pipeline.metrics.timer("stage_seconds", stage="ui_insert"):
+                view = self.dest_text.yview()[0]
+                self.dest_text.delete("1.0", "end")
+                self.dest_text.insert("1.0", translation)
+                self.dest_text.yview_moveto(view)
+        pending = self.live_session.pending()
+        self.status_var.set(f"Canlı çeviri: {pending} cümle çevriliyor..." if pending else "Canlı çeviri güncel")
+    
+    def handle_live_result_event(self, job_id, translations):
+        # İptal edilmiş veya elle başlatılan çeviriyle geçersiz kalmış canlı işler yok sayılır
+        if job_id not in self.live_session.jobs or not self.live_var.get():
+            return
+        self.live_session.apply(job_id, translations)
+        self.render_live_translation()
+
+    def translate_text(self, job, text_to_translate, src_lang, dest_lang):
+        """Zamanlayıcı thread'inde çalışır; arayüzü yalnızca olaylarla günceller"""
         try:
-            src_lang_name = self.src_lang_var.get()
-            dest_lang_name = self.dest_lang_var.get()
-            
-            src_lang = self.supported_languages[src_lang_name]
-            dest_lang = self.supported_languages[dest_lang_name]
+            # Çevrilen parçaları hazır oldukça sırayla hedef alana gönder
+            def on_chunk(index, total, translated_chunk):
+                self.post_event("chunk", job.id, index, total, translated_chunk)
             
-            # Önbellekte var mı kontrol et
-            cache_key = f"{src_lang}:{dest_lang}:{text_to_translate}"
-            if cache_key in self.translation_cache:
-                full_translation = self.translation_cache[cache_key]
-                self.status_var.set("Çeviri önbellekten alındı")
+            if src_lang == AUTO_LANGUAGE:
+                # Karışık metin: satırların dili toplu algılanır, her dil grubu ayrı çevrilir;
+                # satırlar hazır oldukça metindeki sırayla hedef alana gönderilir
+                full_translation, reused, total = self.pipeline.translate_mixed_detailed(
+                    text_to_translate, dest_lang, on_chunk=on_chunk,
+                    cancel_event=job.cancel_event, priority=job.priority
+                )
             else:
-                # Metni parçalara ayır (uzunluk sınırı için)
-                text_chunks = self.split_text(text_to_translate)
-                translated_chunks = []
-                
-                # Her parçayı çevir
-                for i, chunk in enumerate(text_chunks):
-                    if len(text_chunks) > 1:
-                        self.status_var.set(f"Çeviriliyor... ({i+1}/{len(text_chunks)})")
-                        self.root.update()
-                    
-                    try:
-                        # İlk yöntem: GoogleTranslator
-                        try:
-                            translator = GoogleTranslator(source=src_lang, target=dest_lang)
-                            translated_chunk = translator.translate(chunk)
-                            
-                            if not translated_chunk:
-                                raise Exception("Çeviri sonucu boş")
-                                
-                        except Exception as e:
-                            print(f"GoogleTranslator hatası: {str(e)}")
-                            
-                            # İkinci yöntem: LibreTranslate
-                            try:
-                                translated_chunk = self.translate_with_libre(chunk, src_lang, dest_lang)
-                            except Exception as libre_error:
-                                print(f"LibreTranslate hatası: {str(libre_error)}")
-                                
-                                # Son çare: Basit çevrimdışı çeviri
-                                translated_chunk = self.offline_translate(chunk, src_lang, dest_lang)
-                                self.status_var.set("Çevrimdışı çeviri kullanılıyor (sınırlı)")
-                        
-                        translated_chunks.append(translated_chunk)
-                        
-                        # API limitlerini aşmamak için kısa bir bekleme
-                        if len(text_chunks) > 1 and i < len(text_chunks) - 1:
-                            time.sleep(0.5)
-                    
-                    except Exception as chunk_error:
-                        print(f"Chunk {i+1} çeviri hatası: {str(chunk_error)}")
-                        # Hata durumunda da çevrilmemiş metni ekle
-                        translated_chunks.append(f"[Çeviri hatası: {chunk}]")
-                
-                # Tüm çevrilmiş parçaları birleştir
-                full_translation = " ".join(translated_chunks)
-                
-                # Önbelleğe ekle
-                self.translation_cache[cache_key] = full_translation
-            
-            self.dest_text.delete("1.0", "end")
-            self.dest_text.insert("1.0", full_translation)
-            
-            # Geçmişe ekle
-            self.add_to_history(text_to_translate, full_translation, src_lang, dest_lang)
-            
-            self.status_var.set("Çeviri tamamlandı")
+                # Önbellekte olan parçaları yeniden kullan, kalanları paralel çevir
+                translations, reused, total = self.pipeline.translate_detailed(
+                    [text_to_translate], src_lang, dest_lang, on_chunk=on_chunk,
+                    cancel_event=job.cancel_event, priority=job.priority
+                )
+                full_translation = translations[0]
             
+            self.post_event("translation_done", job.id, text_to_translate, full_translation,
+                            src_lang, dest_lang, reused, total)
+        
+        except TranslationCancelled:
+            raise
+        
         except Exception as e:
             error_msg = str(e)
             traceback_msg = traceback.format_exc()
             print(f"Çeviri hatası: {error_msg}")
             print(traceback_msg)
             
-            self.status_var.set("Çeviri başarısız")
-            messagebox.showerror("Hata", f"Çeviri yapılırken bir hata oluştu:\n{error_msg}")
-        
-        finally:
-            # Çeviri düğmesini tekrar etkinleştir
-            self.translate_button.config(state="normal")
+            self.post_event("status", "Çeviri başarısız")
+            self.post_event("error", "Hata", f"Çeviri yapılırken bir hata oluştu:\n{error_msg}")
 
 
 if __name__ == "__main__":